@@ -0,0 +1,36 @@
+import numpy as np
+
+# Dimensions and measures of the pre-aggregated cube
+CUBE_KEYS = ['company', 'industry', 'location', 'year', 'month']
+CUBE_MEASURES = ['layoffs', 'hires', 'net_change', 'layoff_events', 'hiring_events']
+
+def build_cube(layoffs_df, hiring_df):
+    """Aggregate raw events once into a company x industry x location x year x month cube"""
+
+    layoffs = layoffs_df.groupby(CUBE_KEYS, observed=True).agg(
+        layoffs=('layoffs', 'sum'),
+        layoff_events=('layoffs', 'size')
+    )
+    hires = hiring_df.groupby(CUBE_KEYS, observed=True).agg(
+        hires=('hires', 'sum'),
+        hiring_events=('hires', 'size')
+    )
+
+    cube = layoffs.join(hires, how='outer').fillna(0).astype(np.int64).reset_index()
+    cube['net_change'] = cube['hires'] - cube['layoffs']
+
+    return cube[CUBE_KEYS + CUBE_MEASURES]
+
+def rollup(cube, by=None):
+    """Roll a (filtered) cube up to totals per `by` columns, or to grand totals"""
+    if not by:
+        return cube[CUBE_MEASURES].sum()
+
+    if 'quarter' in by and 'quarter' not in cube.columns:
+        cube = cube.assign(quarter='Q' + ((cube['month'] - 1) // 3 + 1).astype(str))
+    return cube.groupby(by, observed=True)[CUBE_MEASURES].sum().reset_index()
+
+def event_totals(rolled, value_col):
+    """Keep only groups that had events of one type, matching a groupby over raw events"""
+    events_col = 'layoff_events' if value_col == 'layoffs' else 'hiring_events'
+    return rolled[rolled[events_col] > 0]
@@ -1,16 +1,33 @@
-import pandas as pd
-import numpy as np
-from datetime import datetime
-import random
+from aggregation_cube import build_cube, rollup, event_totals
+from rolling_windows import RollingWindows
+from forecasting import forecast_totals, DEFAULT_HORIZON
 
-def generate_ai_insights(layoffs_df, hiring_df, fused_df):
+# Forecasting model behind the predictions; see forecasting.MODELS
+FORECAST_MODEL = 'holt_winters'
+
+def build_insight_kernel(cube):
+    """Derive every input of the insight rules from a (filtered) aggregation cube"""
+    yearly = rollup(cube, ['year'])
+    return {
+        'yearly_layoffs': event_totals(yearly, 'layoffs').set_index('year')['layoffs'],
+        'yearly_hires': event_totals(yearly, 'hires').set_index('year')['hires'],
+        'industry_layoffs': event_totals(rollup(cube, ['industry']), 'layoffs').set_index('industry')['layoffs'],
+        'company_net_change': rollup(cube, ['company']).set_index('company')['net_change'],
+        'monthly_layoffs': event_totals(rollup(cube, ['month']), 'layoffs').set_index('month')['layoffs'],
+    }
+
+def generate_ai_insights(layoffs_df, hiring_df, fused_df, cube=None):
     """Generate AI-powered insights from the employment data"""
     
+    if cube is None:
+        cube = build_cube(layoffs_df, hiring_df)
+    kernel = build_insight_kernel(cube)
+    
     insights = []
     
     # Trend Analysis
-    yearly_layoffs = layoffs_df.groupby('year')['layoffs'].sum()
-    yearly_hires = hiring_df.groupby('year')['hires'].sum()
+    yearly_layoffs = kernel['yearly_layoffs']
+    yearly_hires = kernel['yearly_hires']
     
     # Peak layoff year
     peak_layoff_year = yearly_layoffs.idxmax()
@@ -23,18 +40,18 @@ def generate_ai_insights(layoffs_df, hiring_df, fused_df):
     insights.append(f"📈 **Peak Hiring**: {peak_hiring_year} had the strongest hiring with {peak_hires:,} new positions.")
     
     # Industry Analysis
-    industry_layoffs = layoffs_df.groupby('industry')['layoffs'].sum().sort_values(ascending=False)
+    industry_layoffs = kernel['industry_layoffs'].sort_values(ascending=False)
     most_affected_industry = industry_layoffs.index[0]
     insights.append(f"🏭 **Most Affected Industry**: {most_affected_industry} experienced the highest layoffs ({industry_layoffs.iloc[0]:,} jobs).")
     
     # Company Analysis
-    company_net_change = fused_df.groupby('company')['net_change'].sum().sort_values(ascending=False)
+    company_net_change = kernel['company_net_change'].sort_values(ascending=False)
     top_net_hirer = company_net_change.index[0]
     top_net_change = company_net_change.iloc[0]
     insights.append(f"🏢 **Top Net Hirer**: {top_net_hirer} has the highest net employment growth (+{top_net_change:,} positions).")
     
     # Seasonal Patterns
-    monthly_layoffs = layoffs_df.groupby('month')['layoffs'].sum()
+    monthly_layoffs = kernel['monthly_layoffs']
     peak_layoff_month = monthly_layoffs.idxmax()
     month_names = {1: 'January', 2: 'February', 3: 'March', 4: 'April', 5: 'May', 6: 'June',
                    7: 'July', 8: 'August', 9: 'September', 10: 'October', 11: 'November', 12: 'December'}
@@ -59,8 +76,12 @@ def generate_ai_insights(layoffs_df, hiring_df, fused_df):
     
     return insights
 
-def predict_trends(fused_df):
-    """Generate predictive insights based on historical data"""
+def predict_trends(fused_df, windows=None, industry_windows=None):
+    """Generate predictive insights based on historical data
+
+    windows and industry_windows are the overall and per-industry
+    RollingWindows of the same data; they are built from fused_df when not given.
+    """
     
     predictions = []
     
@@ -91,9 +112,41 @@ def predict_trends(fused_df):
         elif latest_hiring_growth < -0.1:
             predictions.append("🔮 **Hiring Trend**: Declining hiring activity suggests cautious market sentiment.")
     
-    # Industry momentum
-    recent_data = fused_df[fused_df['year'] >= fused_df['year'].max() - 1]
-    industry_momentum = recent_data.groupby('industry')['net_change'].sum().sort_values(ascending=False)
+    if fused_df.empty:
+        return predictions
+    if windows is None:
+        windows = RollingWindows.from_frame(fused_df)
+    if industry_windows is None:
+        industry_windows = RollingWindows.from_frame(fused_df, 'industry')
+    
+    # Short-term momentum: last 3 months against the 12-month average
+    if windows.n_months >= 12:
+        recent_layoffs = windows.window('layoffs', 3)['mean'].iloc[0]
+        yearly_layoffs = windows.window('layoffs', 12)['mean'].iloc[0]
+        if yearly_layoffs > 0 and recent_layoffs > 1.2 * yearly_layoffs:
+            predictions.append("📉 **Layoff Momentum**: Layoffs over the last 3 months are running above the 12-month average.")
+        elif yearly_layoffs > 0 and recent_layoffs < 0.8 * yearly_layoffs:
+            predictions.append("📈 **Layoff Momentum**: Layoffs over the last 3 months are easing below the 12-month average.")
+    
+    # Damped-trend Holt-Winters forecasts over the next months, with 95% prediction intervals
+    if windows.n_months >= 12:
+        layoff_forecast = forecast_totals(windows, 'layoffs', model=FORECAST_MODEL).iloc[0]
+        last_layoffs = windows.window('layoffs', DEFAULT_HORIZON)['sum'].iloc[0]
+        direction = "up from" if layoff_forecast['forecast'] > last_layoffs else "down from"
+        predictions.append(
+            f"📊 **Layoff Forecast**: About {max(layoff_forecast['forecast'], 0):,.0f} layoffs expected over the next "
+            f"{DEFAULT_HORIZON} months (95% interval {max(layoff_forecast['lower'], 0):,.0f}–"
+            f"{max(layoff_forecast['upper'], 0):,.0f}), {direction} {last_layoffs:,} in the last {DEFAULT_HORIZON}.")
+        
+        industry_outlook = forecast_totals(industry_windows, 'net_change', model=FORECAST_MODEL)
+        if len(industry_outlook) > 1:
+            predictions.append(
+                f"🧭 **Industry Outlook**: {industry_outlook.index[0]} is forecast to add the most net positions over the "
+                f"next {DEFAULT_HORIZON} months; {industry_outlook.index[-1]} the fewest.")
+    
+    # Industry momentum since the start of the previous year
+    latest_month = (windows.first_period + windows.n_months - 1) % 12 + 1
+    industry_momentum = industry_windows.window('net_change', 12 + latest_month)['sum'].sort_values(ascending=False)
     
     if len(industry_momentum) > 0:
         growing_industry = industry_momentum.index[0]
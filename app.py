@@ -1,19 +1,36 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-import numpy as np
+import time
+import os
+import logging
+from collections import deque
+from functools import cached_property
 
 # Import custom modules
-from data_generator import generate_sample_data, get_company_list, get_date_range
-from data_fusion import fuse_employment_data, calculate_industry_trends, get_summary_statistics, filter_data
+from data_generator import EVENT_TYPES, get_company_list
+from schema import generate_compact_sample_data
+from dataset_store import load_or_build, dataset_key, DEFAULT_STORE_DIR
+from data_sources import DEFAULT_SOURCE, open_source
+from sql_backend import open_backend, database_path, default_engine
+from event_stream import DEFAULT_EVENT_LOG, EventLogTailer, LiveDataset
+from shared_dataset import attach_or_publish
+from aggregation_cube import build_cube, rollup, event_totals, CUBE_KEYS, CUBE_MEASURES
+from filter_index import FilterIndex
+from selection_cache import SelectionCache, selection_key
+from figure_cache import FigureCache
+from chart_budget import top_n_other
+from rolling_windows import RollingWindows, WINDOW_MEASURES, WINDOW_LENGTHS, complete_lengths, latest_windows
+from forecasting import forecast_totals, DEFAULT_HORIZON
+from data_fusion import fuse_employment_data
 from ai_insights import generate_ai_insights, predict_trends, generate_recommendations
 from visualizations import (
     create_timeline_chart, create_company_comparison_chart, create_industry_heatmap,
     create_net_change_chart, create_top_companies_chart, create_quarterly_trends
 )
 
+logger = logging.getLogger(__name__)
+
 # Page configuration
 st.set_page_config(
     page_title="AI Powered Data Fusion and Visualization Dashboards",
@@ -58,27 +75,512 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+# Parameters of the generated sample dataset; they key the on-disk dataset store
+DATA_PARAMS = {'n_layoffs': 500, 'n_hiring': 600, 'seed': 2024}
+
+# Set to 'sqlite', 'duckdb' or 'auto' to answer selection aggregates from an embedded database
+SQL_ENGINE = os.environ.get('DASHBOARD_SQL_ENGINE')
+
+# How often an open dashboard checks the live event log for new events
+LIVE_REFRESH_SECONDS = 5
+
+# Render timings kept per view and session; older ones are dropped
+LATENCY_HISTORY = 100
+
+# Tables build_frames produces; bump dataset_store.STORE_VERSION when their columns or meaning change
+DATASET_LAYOUT = {'tables': ['layoffs', 'hiring', 'fused', 'cube']}
+
+def build_frames(layoffs_df, hiring_df):
+    """The raw events alongside the fused monthly table and the aggregation cube"""
+    fused_df = fuse_employment_data(layoffs_df, hiring_df)
+    cube = build_cube(layoffs_df, hiring_df)
+    return {'layoffs': layoffs_df, 'hiring': hiring_df, 'fused': fused_df, 'cube': cube}
+
+def build_dataset(n_layoffs, n_hiring, seed):
+    """Generate the sample events and derive the dashboard frames"""
+    return build_frames(*generate_compact_sample_data(n_layoffs, n_hiring, seed))
+
+def build_source_dataset(source, fingerprint):
+    """Load the events of a configured data source and derive the dashboard frames"""
+    return build_frames(*open_source(source).load())
+
+@st.cache_resource
+def dataset_source():
+    """Store parameters, frame builder and dataset version of the configured events
+
+    Events come from DASHBOARD_DATA_SOURCE when set, otherwise from the sample
+    generator. A source's version changes whenever its files change.
+    """
+    if DEFAULT_SOURCE:
+        params = {'source': DEFAULT_SOURCE, 'fingerprint': open_source(DEFAULT_SOURCE).fingerprint()}
+        build = build_source_dataset
+    else:
+        params, build = DATA_PARAMS, build_dataset
+    return params, build, dataset_key(params, DATASET_LAYOUT)
+
+@st.cache_resource
 def load_data():
-    """Load and cache the sample data"""
-    return generate_sample_data()
+    """Attach to the shared dataset (published once per host) along with its dataset version"""
+    params, build, dataset_version = dataset_source()
+    frames = attach_or_publish(dataset_version, lambda: load_or_build(params, build, layout=DATASET_LAYOUT)[0])
+    return frames['layoffs'], frames['hiring'], frames['fused'], frames['cube'], dataset_version
+
+@st.cache_resource
+def get_live_dataset():
+    """Loaded data kept current from DASHBOARD_EVENT_LOG, or None when live ingestion is off"""
+    if not DEFAULT_EVENT_LOG:
+        return None
+    layoffs_df, hiring_df, _, _, dataset_version = load_data()
+    return LiveDataset(layoffs_df, hiring_df, dataset_version, EventLogTailer(DEFAULT_EVENT_LOG))
+
+def current_dataset():
+    """Filter indexes, sidebar options and dataset version for this rerun, with new live events folded in"""
+    live = get_live_dataset()
+    if live is None:
+        layoffs_df, hiring_df, fused_df, cube, dataset_version = load_data()
+        frames = {'layoffs': layoffs_df, 'hiring': hiring_df, 'fused': fused_df, 'cube': cube}
+        return load_filter_indexes(dataset_version, frames), load_filter_options(dataset_version, frames), dataset_version
+    live.poll()
+    return live.snapshot()
+
+@st.cache_resource(max_entries=2)
+def load_filter_indexes(dataset_version, _frames):
+    """Build the row bitmap indexes for every frame the dashboard filters"""
+    return {name: FilterIndex(_frames[name]) for name in ('layoffs', 'hiring', 'fused', 'cube')}
+
+@st.cache_resource(max_entries=2)
+def load_filter_options(dataset_version, _frames):
+    """Sidebar filter options, computed once per dataset version"""
+    layoffs_df, hiring_df = _frames['layoffs'], _frames['hiring']
+    all_companies = get_company_list(layoffs_df, hiring_df)
+    years = sorted(layoffs_df['year'].unique())
+    industries = sorted(layoffs_df['industry'].unique())
+    return all_companies, years, industries
+
+@st.cache_resource(max_entries=2)
+def load_sql_filter_options(dataset_version, _sql):
+    """Sidebar filter options queried from the SQL backend, once per dataset version"""
+    return _sql.filter_options()
+
+@st.cache_resource
+def get_sql_backend():
+    """Embedded database holding the events of the current dataset, or None when not enabled
+
+    The dashboard frames are never loaded in SQL mode: a configured source is
+    streamed into the database, and generated sample events are inserted
+    straight from the generator.
+    """
+    # The database is built once per stored dataset, so it cannot follow live events
+    if not SQL_ENGINE or DEFAULT_EVENT_LOG:
+        return None
+    engine = default_engine() if SQL_ENGINE == 'auto' else SQL_ENGINE
+    _, _, dataset_version = dataset_source()
+    if DEFAULT_SOURCE:
+        build = lambda backend: backend.build_from_source(open_source(DEFAULT_SOURCE))
+    else:
+        build = lambda backend: backend.build_from_frames(*generate_compact_sample_data(**DATA_PARAMS))
+    return open_backend(database_path(DEFAULT_STORE_DIR, dataset_version, engine), build, engine)
+
+@st.cache_resource
+def get_selection_cache():
+    """Per-selection results (insights, view aggregates) shared by every session in this process"""
+    return SelectionCache(maxsize=256, max_bytes=32 * 1024 * 1024, ttl=3600)
+
+@st.cache_resource
+def get_figure_cache():
+    """Built chart figures per selection, shared by every session in this process"""
+    return FigureCache(maxsize=256, max_bytes=64 * 1024 * 1024, ttl=3600)
+
+# Dashboard views; only the selected one is computed and rendered on a rerun
+VIEWS = ["📊 Overview", "📈 Trends", "🏢 Companies", "🏭 Industries", "🤖 AI Insights"]
+
+MONTH_NAMES = {1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
+               7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'}
+
+# Fallbacks, finest first, for charts whose payload exceeds the budget
+TIMELINE_UNITS = ('D', 'W', 'M')
+INDUSTRY_TOP_N = (None, 20, 10, 5)
+
+class SelectionData:
+    """Filtered frames and per-view aggregates for one filter selection, computed on first use
+
+    With a SQL backend there are no filter indexes and no event rows come back:
+    totals, emptiness checks, the cube and the fused table are SQL GROUP BY
+    results, and event charts get the selection summed per the keys they chart.
+    """
+
+    def __init__(self, indexes, selection, dataset_version, cache, figures, sql=None):
+        self.indexes = indexes
+        self.selection = selection
+        self.dataset_version = dataset_version
+        self.cache = cache
+        self.figures = figures
+        self.sql = sql
+
+    @cached_property
+    def layoffs(self):
+        return self.indexes['layoffs'].filter(*self.selection)
+
+    @cached_property
+    def hiring(self):
+        return self.indexes['hiring'].filter(*self.selection)
+
+    @cached_property
+    def fused(self):
+        if self.sql is not None:
+            return self.cached('fused', lambda: self.sql.fused(*self.selection))
+        return self.indexes['fused'].filter(*self.selection)
+
+    @cached_property
+    def cube(self):
+        if self.sql is not None:
+            return self.cached('cube', lambda: self.sql.rollup(CUBE_KEYS, *self.selection))
+        return self.indexes['cube'].filter(*self.selection)
+
+    def events_by(self, by):
+        """Selected layoffs and hiring; with a SQL backend, their counts summed per `by` columns"""
+        if self.sql is None:
+            return self.layoffs, self.hiring
+        return self.cached('events_by:' + ','.join(by), lambda: tuple(
+            self.sql.totals(value_col, by, *self.selection) for value_col in EVENT_TYPES))
+
+    @cached_property
+    def totals(self):
+        return self.rollup([])
+
+    @property
+    def has_layoffs(self):
+        return self.totals['layoff_events'] > 0
+
+    @property
+    def has_hires(self):
+        return self.totals['hiring_events'] > 0
+
+    @property
+    def has_events(self):
+        return self.has_layoffs or self.has_hires
+
+    def active_companies(self):
+        """Number of companies with any selected event"""
+        if self.sql is not None:
+            return self.cached('active_companies', lambda: self.sql.active_companies(*self.selection))
+        return self.cached('active_companies', lambda: self.cube['company'].nunique())
+
+    def cached(self, namespace, compute):
+        """Result of compute for this selection, shared with other sessions via the selection cache"""
+        return self.cache.get_or_compute(
+            selection_key(self.dataset_version, *self.selection, namespace=namespace), compute)
+
+    def rollup(self, by):
+        """Selection totals per `by` columns, from the SQL backend when enabled or else the cube"""
+        namespace = 'rollup:' + ','.join(by)
+        if self.sql is not None:
+            return self.cached(namespace, lambda: self.sql.rollup(by, *self.selection))
+        return self.cached(namespace, lambda: rollup(self.cube, by))
+
+    def company_summary(self):
+        """Company performance table, from the fused frame (itself a SQL aggregate when enabled)"""
+        return self.cached('company_summary', lambda: compute_company_summary(self.fused))
+
+    def windows(self, by=None):
+        """Monthly rolling-window series of the selection, overall or per `by` column
+
+        Built from the fused frame, like the rest of predict_trends, so a
+        company's months count toward its fused (first-seen) industry.
+        """
+        return self.cached(f'windows:{by}', lambda: RollingWindows.from_frame(self.fused, by))
+
+    def figure(self, chart, builds):
+        """Chart figure for this selection, rebuilt from the figure cache when seen before
+
+        builds is one build or a list ordered finest first; coarser builds are
+        used when a finer one exceeds the chart payload budget.
+        """
+        return self.figures.get_figure(chart, self.dataset_version, self.selection, builds)
+
+def compute_company_summary(filtered_fused):
+    """Company performance table for the Companies view"""
+    company_summary = filtered_fused.groupby('company', observed=True).agg({
+        'layoffs': 'sum',
+        'hires': 'sum',
+        'net_change': 'sum',
+        'industry': 'first'
+    }).reset_index()
+    return company_summary.sort_values('net_change', ascending=False)
+
+def compute_insights(data):
+    """Insights, predictions, recommendations and summary indicators for the AI Insights view"""
+    # Every insight rule reads the cube, so no event rows are needed
+    insights = generate_ai_insights(None, None, data.fused, data.cube)
+    predictions = predict_trends(data.fused, data.windows(), data.windows('industry'))
+    recommendations = generate_recommendations(insights, predictions)
+    
+    recent_net = None
+    if data.has_events:
+        recent_net = data.fused[data.fused['year'] == data.fused['year'].max()]['net_change'].sum()
+    
+    volatility_ratio = None
+    if data.has_layoffs:
+        yearly_totals = data.rollup(['year'])
+        layoff_volatility = event_totals(yearly_totals, 'layoffs')['layoffs'].std()
+        hiring_volatility = event_totals(yearly_totals, 'hires')['hires'].std()
+        volatility_ratio = layoff_volatility / hiring_volatility if hiring_volatility > 0 else 0
+    
+    return insights, predictions, recommendations, recent_net, volatility_ratio
+
+def create_monthly_activity_chart(monthly_data):
+    """Layoffs and hires per calendar month for the Trends view"""
+    monthly_data = monthly_data.assign(month_name=monthly_data['month'].map(MONTH_NAMES))
+    return px.line(monthly_data, x='month_name', y=['layoffs', 'hires'], 
+                   title='Monthly Employment Activity',
+                   labels={'value': 'Number of Employees', 'month_name': 'Month'})
+
+def create_rolling_chart(windows, months, stat='sum'):
+    """Rolling `months`-month layoffs, hires and net change for the Trends view"""
+    rolling = pd.DataFrame({measure: windows.rolling(measure, months, stat).iloc[:, 0] for measure in WINDOW_MEASURES})
+    return px.line(rolling, x=rolling.index, y=WINDOW_MEASURES,
+                   title=f'Rolling {months}-Month {stat.title()}',
+                   labels={'value': 'Number of Employees', 'x': 'Window End'})
+
+def create_industry_activity_chart(industry_totals, top_n=None):
+    """Layoffs and hires per industry, optionally bucketing all but the top_n industries"""
+    if top_n:
+        industry_totals = top_n_other(industry_totals, 'industry', top_n, CUBE_MEASURES)
+    return px.bar(industry_totals, 
+                  x='industry', y=['layoffs', 'hires'], 
+                  title='Industry Employment Activity',
+                  barmode='group')
+
+def create_industry_trends_chart(industry_trends, top_n=None):
+    """Net change per industry and year, optionally bucketing all but the top_n industries"""
+    if top_n:
+        industry_trends = top_n_other(industry_trends, 'industry', top_n, CUBE_MEASURES)
+    return px.line(industry_trends, x='year', y='net_change', color='industry',
+                   title='Industry Net Employment Change Over Time')
+
+def render_overview(data, selected_companies):
+    st.markdown('<h2 class="sub-header">📊 Executive Summary</h2>', unsafe_allow_html=True)
+    
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_layoffs = data.totals['layoffs']
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>Total Layoffs</h3>
+            <h2>{total_layoffs:,}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        total_hires = data.totals['hires']
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>Total Hiring</h3>
+            <h2>{total_hires:,}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        net_change = total_hires - total_layoffs
+        color = "green" if net_change >= 0 else "red"
+        st.markdown(f"""
+        <div class="metric-card" style="background: linear-gradient(135deg, {color} 0%, {'#2d5a27' if net_change >= 0 else '#5a2d2d'} 100%);">
+            <h3>Net Change</h3>
+            <h2>{net_change:+,}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        active_companies = data.active_companies()
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>Active Companies</h3>
+            <h2>{active_companies}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Timeline visualization
+    if data.has_layoffs and data.has_hires:
+        st.plotly_chart(data.figure('timeline', [
+            lambda unit=unit: create_timeline_chart(*data.events_by(['date']), unit=unit) for unit in TIMELINE_UNITS]),
+                        use_container_width=True)
+    
+    # Net change chart
+    if data.has_events:
+        st.plotly_chart(data.figure('net_change', lambda: create_net_change_chart(data.fused)), use_container_width=True)
+
+def render_trends(data, selected_companies):
+    st.markdown('<h2 class="sub-header">📈 Trend Analysis</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if data.has_layoffs and data.has_hires:
+            st.plotly_chart(data.figure('quarterly_trends', lambda: create_quarterly_trends(*data.events_by(['year', 'quarter']))),
+                            use_container_width=True)
+    
+    with col2:
+        # Monthly breakdown
+        monthly_data = data.rollup(['month'])
+        
+        if not monthly_data.empty:
+            # At most twelve points, so this chart never needs a coarser fallback
+            fig = data.figure('monthly_activity', lambda: create_monthly_activity_chart(monthly_data))
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Rolling windows over the selected months
+    if data.has_events:
+        # Only lengths with a complete window fit in the selected months
+        lengths = complete_lengths(data.windows())
+        if lengths:
+            col1, col2 = st.columns(2)
+            months = col1.selectbox("Rolling window", lengths, format_func=lambda n: f"{n} months")
+            stat = col2.selectbox("Statistic", ['sum', 'mean', 'std'])
+            st.plotly_chart(data.figure(f'rolling_{months}_{stat}',
+                                        lambda: create_rolling_chart(data.windows(), months, stat)),
+                            use_container_width=True)
+        else:
+            st.info(f"Rolling windows need a selection spanning at least {min(WINDOW_LENGTHS)} months.")
+        
+        st.markdown("### Latest Net Change Windows by Industry")
+        industry_windows = data.cached('latest_windows:industry',
+                                       lambda: latest_windows(data.windows('industry'), 'net_change'))
+        st.dataframe(industry_windows.round(1), use_container_width=True)
+    
+    # Industry heatmap
+    if data.has_layoffs and data.has_hires:
+        st.plotly_chart(data.figure('industry_heatmap', lambda: create_industry_heatmap(*data.events_by(['industry', 'year']))),
+                        use_container_width=True)
+
+def render_companies(data, selected_companies):
+    st.markdown('<h2 class="sub-header">🏢 Company Analysis</h2>', unsafe_allow_html=True)
+    
+    # Company comparison
+    if data.has_events:
+        st.plotly_chart(data.figure('company_comparison',
+                                    lambda: create_company_comparison_chart(data.fused, selected_companies)),
+                        use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if data.has_layoffs:
+            st.plotly_chart(data.figure('top_layoffs', lambda: create_top_companies_chart(*data.events_by(['company']), 'layoffs')),
+                            use_container_width=True)
+    
+    with col2:
+        if data.has_hires:
+            st.plotly_chart(data.figure('top_hires', lambda: create_top_companies_chart(*data.events_by(['company']), 'hires')),
+                            use_container_width=True)
+    
+    # Company details table
+    if data.has_events:
+        st.markdown("### Company Performance Summary")
+        company_summary = data.company_summary()
+        st.dataframe(company_summary, use_container_width=True)
+
+def render_industries(data, selected_companies):
+    st.markdown('<h2 class="sub-header">🏭 Industry Insights</h2>', unsafe_allow_html=True)
+    
+    if data.has_layoffs and data.has_hires:
+        industry_totals = data.rollup(['industry'])
+        industry_trends = data.rollup(['industry', 'year'])
+        
+        # Industry performance chart
+        fig = data.figure('industry_activity', [
+            lambda top_n=top_n: create_industry_activity_chart(industry_totals, top_n) for top_n in INDUSTRY_TOP_N])
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Industry trends over time
+        fig2 = data.figure('industry_trends', [
+            lambda top_n=top_n: create_industry_trends_chart(industry_trends, top_n) for top_n in INDUSTRY_TOP_N])
+        st.plotly_chart(fig2, use_container_width=True)
+
+def render_ai_insights(data, selected_companies):
+    st.markdown('<h2 class="sub-header">🤖 AI-Powered Insights</h2>', unsafe_allow_html=True)
+    
+    # Generate insights, reusing results for selections seen before
+    insights, predictions, recommendations, recent_net, volatility_ratio = data.cached(
+        'ai_insights', lambda: compute_insights(data))
+    
+    # Display insights
+    st.markdown("### 🔍 Key Insights")
+    for insight in insights:
+        st.markdown(f'<div class="insight-box">{insight}</div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🔮 Predictive Analysis")
+    for prediction in predictions:
+        st.markdown(f'<div class="insight-box">{prediction}</div>', unsafe_allow_html=True)
+    
+    if data.has_events:
+        with st.expander(f"Company net change forecast, next {DEFAULT_HORIZON} months"):
+            company_forecast = data.cached('forecast:company',
+                                           lambda: forecast_totals(data.windows('company'), 'net_change'))
+            st.dataframe(company_forecast.round(0), use_container_width=True)
+    
+    st.markdown("### 💡 Strategic Recommendations")
+    for recommendation in recommendations:
+        st.markdown(f'<div class="insight-box">{recommendation}</div>', unsafe_allow_html=True)
+    
+    # AI Analysis Summary
+    st.markdown("### 📋 Analysis Summary")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Market Health Indicators:**")
+        if recent_net is not None:
+            health_status = "🟢 Healthy" if recent_net > 0 else "🔴 Challenging" if recent_net < -1000 else "🟡 Stable"
+            st.write(f"Current Market Status: {health_status}")
+            st.write(f"Recent Net Change: {recent_net:+,} positions")
+    
+    with col2:
+        st.markdown("**Volatility Assessment:**")
+        if volatility_ratio is not None:
+            volatility_level = "High" if volatility_ratio > 1.2 else "Moderate" if volatility_ratio > 0.8 else "Low"
+            st.write(f"Market Volatility: {volatility_level}")
+            st.write(f"Volatility Ratio: {volatility_ratio:.2f}")
+
+RENDERERS = dict(zip(VIEWS, [render_overview, render_trends, render_companies, render_industries, render_ai_insights]))
+
+def record_view_latency(view, elapsed):
+    """Keep the latest per-view render timings for this session and log them"""
+    timings = st.session_state.setdefault('view_timings', {})
+    timings.setdefault(view, deque(maxlen=LATENCY_HISTORY)).append(elapsed)
+    logger.info("view=%s render_ms=%.1f", view, elapsed * 1000)
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def watch_live_events(shown_version):
+    """Poll the live event log and rerun the dashboard once new events have been folded in"""
+    live = get_live_dataset()
+    live.poll()
+    st.caption(f"🔴 Live: {live.events_total:,} new events · version {live.dataset_version}")
+    if live.dataset_version != shown_version:
+        st.rerun()
 
 def main():
     # Header
     st.markdown('<h1 class="main-header">🤖 AI Powered Data Fusion and Visualization Dashboards</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">Tech Industry Employment Analytics & Insights</p>', unsafe_allow_html=True)
     
-    # Load data
+    # Load data; in SQL mode selections are answered by the database and no frames are loaded
+    sql = get_sql_backend()
     with st.spinner("Loading employment data..."):
-        layoffs_df, hiring_df = load_data()
-        fused_df = fuse_employment_data(layoffs_df, hiring_df)
-        stats = get_summary_statistics(layoffs_df, hiring_df, fused_df)
+        if sql is None:
+            indexes, (all_companies, years, industries), dataset_version = current_dataset()
+        else:
+            _, _, dataset_version = dataset_source()
+            indexes = None
+            all_companies, years, industries = load_sql_filter_options(dataset_version, sql)
     
     # Sidebar filters
     st.sidebar.markdown("## 🎛️ Dashboard Controls")
     
     # Company filter
-    all_companies = get_company_list(layoffs_df, hiring_df)
     selected_companies = st.sidebar.multiselect(
         "Select Companies",
         options=all_companies,
@@ -87,7 +589,6 @@ def main():
     )
     
     # Year filter
-    years = sorted(layoffs_df['year'].unique())
     selected_years = st.sidebar.multiselect(
         "Select Years",
         options=years,
@@ -97,18 +598,15 @@ def main():
     
     # Month filter
     months = list(range(1, 13))
-    month_names = {1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-                   7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'}
     selected_months = st.sidebar.multiselect(
         "Select Months",
         options=months,
         default=months,
-        format_func=lambda x: month_names[x],
+        format_func=lambda x: MONTH_NAMES[x],
         help="Choose months to analyze"
     )
     
     # Industry filter
-    industries = sorted(layoffs_df['industry'].unique())
     selected_industries = st.sidebar.multiselect(
         "Select Industries",
         options=industries,
@@ -116,192 +614,37 @@ def main():
         help="Choose industries to analyze"
     )
     
-    # Filter data based on selections
-    filtered_layoffs = filter_data(layoffs_df, selected_companies, selected_years, selected_months, selected_industries)
-    filtered_hiring = filter_data(hiring_df, selected_companies, selected_years, selected_months, selected_industries)
-    filtered_fused = filter_data(fused_df, selected_companies, selected_years, selected_months, selected_industries)
+    # Filtered data is computed lazily by whichever view needs it
+    selection = (selected_companies, selected_years, selected_months, selected_industries)
+    data = SelectionData(indexes, selection, dataset_version, get_selection_cache(), get_figure_cache(), sql)
     
-    # Main dashboard tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Overview", "📈 Trends", "🏢 Companies", "🏭 Industries", "🤖 AI Insights"])
-    
-    with tab1:
-        st.markdown('<h2 class="sub-header">📊 Executive Summary</h2>', unsafe_allow_html=True)
-        
-        # Key metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            total_layoffs = filtered_layoffs['layoffs'].sum()
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>Total Layoffs</h3>
-                <h2>{total_layoffs:,}</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            total_hires = filtered_hiring['hires'].sum()
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>Total Hiring</h3>
-                <h2>{total_hires:,}</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            net_change = total_hires - total_layoffs
-            color = "green" if net_change >= 0 else "red"
-            st.markdown(f"""
-            <div class="metric-card" style="background: linear-gradient(135deg, {color} 0%, {'#2d5a27' if net_change >= 0 else '#5a2d2d'} 100%);">
-                <h3>Net Change</h3>
-                <h2>{net_change:+,}</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            active_companies = len(set(filtered_layoffs['company'].unique()) | set(filtered_hiring['company'].unique()))
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>Active Companies</h3>
-                <h2>{active_companies}</h2>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Timeline visualization
-        if not filtered_layoffs.empty and not filtered_hiring.empty:
-            st.plotly_chart(create_timeline_chart(filtered_layoffs, filtered_hiring), use_container_width=True)
-        
-        # Net change chart
-        if not filtered_fused.empty:
-            st.plotly_chart(create_net_change_chart(filtered_fused), use_container_width=True)
+    # Main dashboard views
+    view = st.radio("View", VIEWS, horizontal=True, label_visibility="collapsed", key="active_view")
     
-    with tab2:
-        st.markdown('<h2 class="sub-header">📈 Trend Analysis</h2>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if not filtered_layoffs.empty and not filtered_hiring.empty:
-                st.plotly_chart(create_quarterly_trends(filtered_layoffs, filtered_hiring), use_container_width=True)
-        
-        with col2:
-            # Monthly breakdown
-            monthly_data = filtered_fused.groupby('month').agg({
-                'layoffs': 'sum',
-                'hires': 'sum',
-                'net_change': 'sum'
-            }).reset_index()
-            
-            if not monthly_data.empty:
-                monthly_data['month_name'] = monthly_data['month'].map(month_names)
-                
-                fig = px.line(monthly_data, x='month_name', y=['layoffs', 'hires'], 
-                             title='Monthly Employment Activity',
-                             labels={'value': 'Number of Employees', 'month_name': 'Month'})
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Industry heatmap
-        if not filtered_layoffs.empty and not filtered_hiring.empty:
-            st.plotly_chart(create_industry_heatmap(filtered_layoffs, filtered_hiring), use_container_width=True)
+    start = time.perf_counter()
+    RENDERERS[view](data, selected_companies)
+    elapsed = time.perf_counter() - start
+    record_view_latency(view, elapsed)
     
-    with tab3:
-        st.markdown('<h2 class="sub-header">🏢 Company Analysis</h2>', unsafe_allow_html=True)
-        
-        # Company comparison
-        if not filtered_fused.empty:
-            st.plotly_chart(create_company_comparison_chart(filtered_fused, selected_companies), use_container_width=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if not filtered_layoffs.empty:
-                st.plotly_chart(create_top_companies_chart(filtered_layoffs, filtered_hiring, 'layoffs'), use_container_width=True)
-        
-        with col2:
-            if not filtered_hiring.empty:
-                st.plotly_chart(create_top_companies_chart(filtered_layoffs, filtered_hiring, 'hires'), use_container_width=True)
-        
-        # Company details table
-        if not filtered_fused.empty:
-            st.markdown("### Company Performance Summary")
-            company_summary = filtered_fused.groupby('company').agg({
-                'layoffs': 'sum',
-                'hires': 'sum',
-                'net_change': 'sum',
-                'industry': 'first'
-            }).reset_index()
-            
-            company_summary = company_summary.sort_values('net_change', ascending=False)
-            st.dataframe(company_summary, use_container_width=True)
-    
-    with tab4:
-        st.markdown('<h2 class="sub-header">🏭 Industry Insights</h2>', unsafe_allow_html=True)
-        
-        if not filtered_layoffs.empty and not filtered_hiring.empty:
-            industry_trends = calculate_industry_trends(filtered_layoffs, filtered_hiring)
-            
-            # Industry performance chart
-            fig = px.bar(industry_trends.groupby('industry').agg({
-                'layoffs': 'sum',
-                'hires': 'sum',
-                'net_change': 'sum'
-            }).reset_index(), 
-            x='industry', y=['layoffs', 'hires'], 
-            title='Industry Employment Activity',
-            barmode='group')
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Industry trends over time
-            fig2 = px.line(industry_trends, x='year', y='net_change', color='industry',
-                          title='Industry Net Employment Change Over Time')
-            st.plotly_chart(fig2, use_container_width=True)
-    
-    with tab5:
-        st.markdown('<h2 class="sub-header">🤖 AI-Powered Insights</h2>', unsafe_allow_html=True)
-        
-        # Generate insights
-        insights = generate_ai_insights(filtered_layoffs, filtered_hiring, filtered_fused)
-        predictions = predict_trends(filtered_fused)
-        recommendations = generate_recommendations(insights, predictions)
-        
-        # Display insights
-        st.markdown("### 🔍 Key Insights")
-        for insight in insights:
-            st.markdown(f'<div class="insight-box">{insight}</div>', unsafe_allow_html=True)
-        
-        st.markdown("### 🔮 Predictive Analysis")
-        for prediction in predictions:
-            st.markdown(f'<div class="insight-box">{prediction}</div>', unsafe_allow_html=True)
-        
-        st.markdown("### 💡 Strategic Recommendations")
-        for recommendation in recommendations:
-            st.markdown(f'<div class="insight-box">{recommendation}</div>', unsafe_allow_html=True)
-        
-        # AI Analysis Summary
-        st.markdown("### 📋 Analysis Summary")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**Market Health Indicators:**")
-            if not filtered_fused.empty:
-                recent_net = filtered_fused[filtered_fused['year'] == filtered_fused['year'].max()]['net_change'].sum()
-                health_status = "🟢 Healthy" if recent_net > 0 else "🔴 Challenging" if recent_net < -1000 else "🟡 Stable"
-                st.write(f"Current Market Status: {health_status}")
-                st.write(f"Recent Net Change: {recent_net:+,} positions")
-        
-        with col2:
-            st.markdown("**Volatility Assessment:**")
-            if not filtered_layoffs.empty:
-                layoff_volatility = filtered_layoffs.groupby('year')['layoffs'].sum().std()
-                hiring_volatility = filtered_hiring.groupby('year')['hires'].sum().std()
-                volatility_ratio = layoff_volatility / hiring_volatility if hiring_volatility > 0 else 0
-                volatility_level = "High" if volatility_ratio > 1.2 else "Moderate" if volatility_ratio > 0.8 else "Low"
-                st.write(f"Market Volatility: {volatility_level}")
-                st.write(f"Volatility Ratio: {volatility_ratio:.2f}")
+    # Rerun latency monitoring
+    with st.sidebar.expander("⏱️ View Latency"):
+        for name, timings in st.session_state['view_timings'].items():
+            st.write(f"{name}: last {timings[-1] * 1000:.0f} ms, best {min(timings) * 1000:.0f} ms over the last {len(timings)} runs")
 
+    # Cache monitoring
+    with st.sidebar.expander("⚙️ Cache Statistics"):
+        st.write("Selection results")
+        st.json(get_selection_cache().stats())
+        st.write("Chart figures")
+        st.json(get_figure_cache().stats())
+        st.write("Chart payload bytes")
+        st.json(get_figure_cache().payloads(dataset_version, selection))
+    
+    # Live ingestion status; new events trigger a rerun with the next dataset version
+    if get_live_dataset() is not None:
+        with st.sidebar:
+            watch_live_events(dataset_version)
+    
     # Footer
     st.markdown("---")
     st.markdown("""
@@ -0,0 +1,56 @@
+"""Compare filter_data against FilterIndex on large generated event frames
+
+Usage: python benchmarks/bench_filter.py --rows 10000000
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schema import generate_compact_sample_data
+from data_fusion import filter_data
+from filter_index import FilterIndex
+
+# Typical dashboard selections: narrow, default (5 companies, everything else) and wide
+SELECTIONS = {
+    'narrow': (['Meta', 'Apple'], [2022], [1, 2, 3], ['Software', 'Fintech']),
+    'default': (['Adobe', 'Airbnb', 'Amazon', 'Apple', 'Dropbox'], [2020, 2021, 2022, 2023, 2024],
+                list(range(1, 13)), None),
+    'wide': (None, [2021, 2022, 2023, 2024], list(range(2, 13)), None),
+}
+
+def best_of(func, repeat):
+    """Best wall time of repeat calls"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    layoffs_df, _ = generate_compact_sample_data(args.rows, 0, args.seed)
+
+    start = time.perf_counter()
+    index = FilterIndex(layoffs_df)
+    print(f"rows={args.rows:,} index build {time.perf_counter() - start:.3f}s, {index.nbytes / 1e6:.1f} MB")
+
+    for name, selection in SELECTIONS.items():
+        baseline, expected = best_of(lambda: filter_data(layoffs_df, *selection), args.repeat)
+        indexed, result = best_of(lambda: index.filter(*selection), args.repeat)
+        rows_only, _ = best_of(lambda: index.rows(*selection), args.repeat)
+        assert expected.index.equals(result.index)
+        print(f"{name:>8}: matched {len(result):>10,}  filter_data {baseline * 1000:8.1f}ms  "
+              f"FilterIndex.filter {indexed * 1000:8.1f}ms  FilterIndex.rows {rows_only * 1000:8.1f}ms  "
+              f"speedup {baseline / indexed:5.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark parallel forecasting of (company, industry, location) series across 1-N worker processes
+
+The fused table is built once per configuration; each worker count then
+forecasts every series with parallel_forecast.forecast_parallel, keeping the
+best of --repeat runs. The pool is used even for small inputs, where
+forecast_parallel would otherwise stay in-process. Results (wall time,
+series/s, speedup and efficiency against the first worker count) are written
+as JSON, and every run is checked to match the first run's forecasts.
+
+Usage:
+    python benchmarks/bench_forecast.py --sizes 1e5,1e6 --workers 1,2,4,8 --output forecast_results.json
+    python benchmarks/bench_forecast.py --sizes 1e6 --companies 20000 --model seasonal_trend
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from schema import generate_compact_sample_data
+from data_fusion import fuse_employment_data
+from forecasting import MODELS, DEFAULT_MODEL, DEFAULT_HORIZON
+from parallel_forecast import forecast_parallel
+from bench_pipeline import git_revision, names, parse_counts
+
+def best_of(func, repeat):
+    """Best wall time of repeat calls, with the last result"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def run_config(config, worker_counts, repeat):
+    """Forecast one configuration's series with each worker count"""
+    options = {}
+    if config['companies']:
+        options['companies'] = names('Company', config['companies'])
+    n_events = config['events']
+    layoffs_df, hiring_df = generate_compact_sample_data(n_events // 2, n_events - n_events // 2, config['seed'],
+                                                         **options)
+    fused_df = fuse_employment_data(layoffs_df, hiring_df)
+
+    results, expected = [], None
+    for workers in worker_counts:
+        wall, table = best_of(lambda: forecast_parallel(fused_df, horizon=config['horizon'], model=config['model'],
+                                                        workers=workers, min_series_per_worker=1), repeat)
+        if expected is None:
+            expected = table
+        elif not table.equals(expected):
+            raise AssertionError(f"forecasts with {workers} workers differ from {worker_counts[0]} worker(s)")
+        n_series = len(table) // config['horizon']
+        results.append(dict(config, workers=workers, series=n_series, fused_rows=len(fused_df), wall_s=wall,
+                            series_per_s=n_series / wall if wall > 0 else float('inf')))
+
+    base = results[0]['wall_s']
+    for row in results:
+        row['speedup'] = base / row['wall_s'] if row['wall_s'] > 0 else float('inf')
+        row['efficiency'] = row['speedup'] * worker_counts[0] / row['workers']
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1e5,1e6', help='total event counts (layoffs + hiring)')
+    parser.add_argument('--companies', default='0,20000', help='company cardinalities; 0 uses the sample list')
+    parser.add_argument('--workers', default=','.join(str(n) for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1)) or '1',
+                        help='worker process counts to compare, e.g. 1,2,4,8')
+    parser.add_argument('--model', default=DEFAULT_MODEL, choices=sorted(MODELS))
+    parser.add_argument('--horizon', type=int, default=DEFAULT_HORIZON)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='forecast_results.json')
+    args = parser.parse_args()
+
+    worker_counts = parse_counts(args.workers)
+    results = []
+    for events in parse_counts(args.sizes):
+        for companies in parse_counts(args.companies):
+            config = {'events': events, 'companies': companies, 'model': args.model,
+                      'horizon': args.horizon, 'seed': args.seed}
+            rows = run_config(config, worker_counts, args.repeat)
+            for row in rows:
+                print(f"{row['events']:>12,} events  c={row['companies'] or 'sample':>6}  {row['series']:>9,} series  "
+                      f"workers={row['workers']:<3} {row['wall_s'] * 1000:10.1f}ms "
+                      f"{row['series_per_s'] / 1e3:9.1f}k series/s  speedup {row['speedup']:5.2f}x  "
+                      f"efficiency {row['efficiency']:5.0%}")
+            results.extend(rows)
+
+    report = {
+        'meta': {
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {len(results)} measurements to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""Benchmark the data pipeline stages (generate -> fuse -> stats -> insights)
+
+Each (size, cardinality) configuration runs in a fresh process so peak RSS is
+not inherited from earlier runs. Results are written as JSON and can be
+compared against an earlier run to flag regressions.
+
+Usage:
+    python benchmarks/bench_pipeline.py --sizes 1e3,1e4,1e5,1e6 --output results.json
+    python benchmarks/bench_pipeline.py --sizes 1e6 --companies 20,2000 --compare results.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import subprocess
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from schema import generate_compact_sample_data
+from data_fusion import fuse_employment_data, calculate_industry_trends, get_summary_statistics
+from ai_insights import generate_ai_insights, predict_trends
+
+STAGES = ['generate', 'fuse', 'industry_trends', 'summary_statistics', 'ai_insights', 'predict_trends']
+
+def peak_rss_mb():
+    """High-water mark of this process's resident set size in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+
+def names(prefix, count):
+    """Synthetic dictionary of count distinct names"""
+    return [f"{prefix} {i:06d}" for i in range(count)]
+
+def run_config(config):
+    """Run every stage once for one configuration and return per-stage measurements"""
+    n_events = config['events']
+    options = {}
+    if config['companies']:
+        options['companies'] = names('Company', config['companies'])
+    if config['industries']:
+        options['industries'] = names('Industry', config['industries'])
+    if config['locations']:
+        options['locations'] = names('Location', config['locations'])
+
+    data = {}
+    stages = {
+        'generate': lambda: data.update(zip(
+            ('layoffs', 'hiring'),
+            generate_compact_sample_data(n_events // 2, n_events - n_events // 2, config['seed'], **options))),
+        'fuse': lambda: data.update(fused=fuse_employment_data(data['layoffs'], data['hiring'])),
+        'industry_trends': lambda: calculate_industry_trends(data['layoffs'], data['hiring']),
+        'summary_statistics': lambda: get_summary_statistics(data['layoffs'], data['hiring'], data['fused']),
+        'ai_insights': lambda: generate_ai_insights(data['layoffs'], data['hiring'], data['fused']),
+        'predict_trends': lambda: predict_trends(data['fused']),
+    }
+
+    results = []
+    for stage in STAGES:
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        stages[stage]()
+        wall = time.perf_counter() - start
+        rss_after = peak_rss_mb()
+        results.append(dict(config, stage=stage, wall_s=wall,
+                            rows_per_s=n_events / wall if wall > 0 else float('inf'),
+                            peak_rss_mb=rss_after, peak_rss_growth_mb=rss_after - rss_before))
+    return results
+
+def git_revision():
+    """Current git commit of the repository, if available"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def compare(results, baseline, threshold):
+    """Stages whose wall time grew by more than threshold against a baseline run"""
+    def key(row):
+        return (row['stage'], row['events'], row['companies'], row['industries'], row['locations'])
+
+    previous = {key(row): row for row in baseline['results']}
+    regressions = []
+    for row in results:
+        before = previous.get(key(row))
+        if before and before['wall_s'] > 0 and row['wall_s'] > before['wall_s'] * (1 + threshold):
+            regressions.append((row, before))
+    return regressions
+
+def parse_counts(text):
+    """Comma-separated counts, accepting scientific notation such as 1e6"""
+    return [int(float(value)) for value in text.split(',') if value]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1e3,1e4,1e5,1e6',
+                        help='total event counts (layoffs + hiring), e.g. 1e3,1e5,1e8')
+    parser.add_argument('--companies', default='0', help='company cardinalities; 0 uses the sample list')
+    parser.add_argument('--industries', default='0', help='industry cardinalities; 0 uses the sample list')
+    parser.add_argument('--locations', default='0', help='location cardinalities; 0 uses the sample list')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', help='earlier results JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative slowdown')
+    args = parser.parse_args()
+
+    configs = [
+        {'events': events, 'companies': companies, 'industries': industries, 'locations': locations,
+         'seed': args.seed}
+        for events in parse_counts(args.sizes)
+        for companies in parse_counts(args.companies)
+        for industries in parse_counts(args.industries)
+        for locations in parse_counts(args.locations)
+    ]
+
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for config in configs:
+        with context.Pool(1) as pool:
+            rows = pool.apply(run_config, (config,))
+        for row in rows:
+            print(f"{row['events']:>12,} events  c={row['companies'] or 'sample':>6} "
+                  f"i={row['industries'] or 'sample':>6} l={row['locations'] or 'sample':>6}  "
+                  f"{row['stage']:<20} {row['wall_s'] * 1000:10.1f}ms {row['rows_per_s'] / 1e6:10.2f}M rows/s "
+                  f"peak {row['peak_rss_mb']:8.1f}MB")
+        results.extend(rows)
+
+    report = {
+        'meta': {
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {len(results)} measurements to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for row, before in regressions:
+            print(f"REGRESSION {row['stage']} at {row['events']:,} events: "
+                  f"{before['wall_s'] * 1000:.1f}ms -> {row['wall_s'] * 1000:.1f}ms")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
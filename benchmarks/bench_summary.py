@@ -0,0 +1,83 @@
+"""Compare the one-scan get_summary_statistics with the original groupby version
+
+The original made seven passes over the raw frames (two totals, two company
+groupbys with full sorts, two monthly groupbys and an industry groupby); the
+one-scan engine reads each frame once and derives everything from the joint
+totals.
+
+Usage: python benchmarks/bench_summary.py --rows 1e7
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from schema import generate_compact_sample_data
+from data_fusion import get_summary_statistics
+
+def groupby_summary_statistics(layoffs_df, hiring_df):
+    """The original multi-pass implementation, kept as the benchmark baseline"""
+    total_layoffs = layoffs_df['layoffs'].sum()
+    total_hires = hiring_df['hires'].sum()
+    company_layoffs = layoffs_df.groupby('company', observed=True)['layoffs'].sum().sort_values(ascending=False)
+    company_hires = hiring_df.groupby('company', observed=True)['hires'].sum().sort_values(ascending=False)
+    monthly_layoffs = layoffs_df.groupby(['year', 'month'])['layoffs'].sum()
+    monthly_hires = hiring_df.groupby(['year', 'month'])['hires'].sum()
+    industry_impact = layoffs_df.groupby('industry', observed=True)['layoffs'].sum().sort_values(ascending=False)
+    return {
+        'total_layoffs': total_layoffs,
+        'total_hires': total_hires,
+        'net_employment_change': total_hires - total_layoffs,
+        'top_layoff_companies': company_layoffs.head(10),
+        'top_hiring_companies': company_hires.head(10),
+        'monthly_layoffs': monthly_layoffs,
+        'monthly_hires': monthly_hires,
+        'industry_impact': industry_impact
+    }
+
+def best_of(func, repeat):
+    """Best wall time of repeat calls"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def check_same(expected, actual):
+    """Assert both implementations report the same statistics"""
+    for key in ('total_layoffs', 'total_hires', 'net_employment_change'):
+        assert expected[key] == actual[key], key
+    for key in ('top_layoff_companies', 'top_hiring_companies', 'industry_impact'):
+        assert np.array_equal(expected[key].to_numpy(), actual[key].to_numpy()), key
+    for key in ('monthly_layoffs', 'monthly_hires'):
+        assert np.array_equal(expected[key].to_numpy(), actual[key].to_numpy()), key
+        assert expected[key].index.equals(actual[key].index), key
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=float, default=1e7, help='events per frame')
+    parser.add_argument('--companies', type=int, default=0, help='company cardinality; 0 uses the sample list')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = int(args.rows)
+    options = {}
+    if args.companies:
+        options['companies'] = [f"Company {i:06d}" for i in range(args.companies)]
+    layoffs_df, hiring_df = generate_compact_sample_data(rows, rows, 0, **options)
+
+    baseline, expected = best_of(lambda: groupby_summary_statistics(layoffs_df, hiring_df), args.repeat)
+    one_scan, actual = best_of(lambda: get_summary_statistics(layoffs_df, hiring_df, None), args.repeat)
+    check_same(expected, actual)
+
+    print(f"rows per frame {rows:,}")
+    print(f"groupby (7 passes)  {baseline * 1000:9.1f}ms")
+    print(f"one scan (2 passes) {one_scan * 1000:9.1f}ms  speedup {baseline / one_scan:4.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import logging
+import plotly.io as pio
+
+logger = logging.getLogger(__name__)
+
+# Largest serialized figure we are willing to ship to the browser for one chart
+CHART_BUDGET_BYTES = 256 * 1024
+
+OTHER_LABEL = 'Other'
+
+def serialize(fig):
+    """Figure as the JSON string sent to the browser"""
+    return pio.to_json(fig, validate=False)
+
+def fit_to_budget(chart, builds, budget=CHART_BUDGET_BYTES):
+    """First built figure whose serialized payload fits the budget, with its size in bytes
+
+    builds are ordered from finest to coarsest; the coarsest is used even when
+    it is still over budget. Every chart's payload size is logged.
+    """
+    if callable(builds):
+        builds = [builds]
+
+    for level, build in enumerate(builds):
+        fig = build()
+        size = len(serialize(fig))
+        if size <= budget:
+            break
+    logger.info("chart=%s payload_bytes=%d level=%d/%d over_budget=%s",
+                chart, size, level, len(builds) - 1, size > budget)
+    return fig, size, level
+
+def top_n_other(df, column, n, measures, weights=('layoffs', 'hires'), other=OTHER_LABEL):
+    """Keep the n values of column with the largest activity and sum the rest into one bucket
+
+    Activity is the absolute sum of the weights columns. Columns that are not
+    measures stay grouping keys, so rolled-up frames such as industry x year
+    keep their shape.
+    """
+    weights = list(weights)
+    activity = df[weights].abs().sum(axis=1).groupby(df[column], observed=True).sum()
+    if len(activity) <= n:
+        return df
+
+    keep = activity.nlargest(n).index
+    labels = df[column].astype(object).where(df[column].isin(keep), other)
+    keys = [col for col in df.columns if col != column and col not in measures]
+    bucketed = df.assign(**{column: labels}).groupby([column] + keys, sort=False)[list(measures)].sum()
+    return bucketed.reset_index()[df.columns]
@@ -1,39 +1,127 @@
 import pandas as pd
 import numpy as np
 
-def fuse_employment_data(layoffs_df, hiring_df):
-    """Fuse layoffs and hiring data for comprehensive analysis"""
-    
-    # Aggregate layoffs by company and month
-    layoffs_monthly = layoffs_df.groupby(['company', 'year', 'month']).agg({
-        'layoffs': 'sum',
+# Keys of the fused monthly table
+FUSION_KEYS = ['company', 'year', 'month']
+
+def aggregate_monthly(events_df, value_col):
+    """Aggregate layoff or hiring events to one row per company and month"""
+    return events_df.groupby(FUSION_KEYS, observed=True).agg({
+        value_col: 'sum',
         'industry': 'first',
         'location': 'first'
     }).reset_index()
+
+def _company_codes(layoffs_df, hiring_df):
+    """Shared integer company codes for both frames plus the sorted company values"""
+    layoff_companies, hiring_companies = layoffs_df['company'], hiring_df['company']
+    if (isinstance(layoff_companies.dtype, pd.CategoricalDtype)
+            and layoff_companies.dtype == hiring_companies.dtype):
+        return (layoff_companies.cat.codes.to_numpy(), hiring_companies.cat.codes.to_numpy(),
+                layoff_companies.cat.categories)
+
+    codes, uniques = pd.factorize(pd.concat([layoff_companies, hiring_companies], ignore_index=True), sort=True)
+    return codes[:len(layoffs_df)], codes[len(layoffs_df):], uniques
+
+def _month_keys(df):
+    """Absolute month number (year * 12 + month - 1) per row, built in place"""
+    keys = df['year'].to_numpy().astype(np.int64)
+    keys *= 12
+    keys += df['month'].to_numpy()
+    keys -= 1
+    return keys
+
+def _dense_keys(month_keys, company_codes, first_month, n_months):
+    """Turn month numbers into company code x month index keys, in place"""
+    month_keys -= first_month
+    offsets = company_codes.astype(np.int64)
+    offsets *= n_months
+    month_keys += offsets
+    return month_keys
+
+def _scatter(keys, rows, values, n_keys):
+    """Per-key sums of values and whether each key has any row"""
+    if rows is not None:
+        keys, values = keys[rows], values[rows]
+    sums = np.bincount(keys, weights=values, minlength=n_keys)
+    present = np.bincount(keys, minlength=n_keys) > 0
+    return sums, present
+
+def _first_positions(keys, rows, n_keys, n_rows):
+    """Row position of the first selected row per key (n_rows where a key has none)"""
+    first = np.full(n_keys, n_rows, dtype=np.int64)
+    if rows is None:
+        np.minimum.at(first, keys, np.arange(n_rows))
+    else:
+        np.minimum.at(first, keys[rows], np.flatnonzero(rows))
+    return first
+
+def _first_values(df, keys, rows, selected, n_keys):
+    """Industry and location of the first row per selected key, missing where it has none"""
+    n_rows = len(df)
+    values = {}
+    shared_first = None
+    for col in ['industry', 'location']:
+        missing = df[col].isna().to_numpy()
+        if missing.any():
+            col_rows = ~missing if rows is None else rows & ~missing
+            first = _first_positions(keys, col_rows, n_keys, n_rows)
+        else:
+            if shared_first is None:
+                shared_first = _first_positions(keys, rows, n_keys, n_rows)
+            first = shared_first
+        positions = first[selected]
+        positions[positions == n_rows] = -1
+        values[col] = pd.Series(pd.api.extensions.take(df[col].array, positions, allow_fill=True))
+    return values
+
+def fuse_employment_data(layoffs_df, hiring_df):
+    """Fuse layoffs and hiring data for comprehensive analysis"""
     
-    # Aggregate hiring by company and month
-    hiring_monthly = hiring_df.groupby(['company', 'year', 'month']).agg({
-        'hires': 'sum',
-        'industry': 'first',
-        'location': 'first'
-    }).reset_index()
+    # Map both sides to one dense key: company code x month index
+    layoff_company, hiring_company, companies = _company_codes(layoffs_df, hiring_df)
+    layoff_keys = _month_keys(layoffs_df)
+    hiring_keys = _month_keys(hiring_df)
+    month_bounds = [keys.min() for keys in (layoff_keys, hiring_keys) if len(keys)] + \
+                   [keys.max() for keys in (layoff_keys, hiring_keys) if len(keys)]
+    first_month = min(month_bounds) if month_bounds else 0
+    n_months = max(month_bounds) - first_month + 1 if month_bounds else 1
+    n_keys = len(companies) * n_months
+    
+    layoff_keys = _dense_keys(layoff_keys, layoff_company, first_month, n_months)
+    hiring_keys = _dense_keys(hiring_keys, hiring_company, first_month, n_months)
     
-    # Merge the datasets
-    fused_df = pd.merge(
-        layoffs_monthly, 
-        hiring_monthly, 
-        on=['company', 'year', 'month'], 
-        how='outer',
-        suffixes=('_layoffs', '_hiring')
-    )
+    # Rows without a company are dropped, as groupby does
+    layoff_rows = None if (layoff_company >= 0).all() else layoff_company >= 0
+    hiring_rows = None if (hiring_company >= 0).all() else hiring_company >= 0
     
-    # Fill missing values
-    fused_df['layoffs'] = fused_df['layoffs'].fillna(0)
-    fused_df['hires'] = fused_df['hires'].fillna(0)
+    # Scatter-add headcounts per key
+    layoffs, has_layoffs = _scatter(layoff_keys, layoff_rows, layoffs_df['layoffs'].to_numpy(), n_keys)
+    hires, has_hires = _scatter(hiring_keys, hiring_rows, hiring_df['hires'].to_numpy(), n_keys)
     
-    # Use industry and location from either dataset
-    fused_df['industry'] = fused_df['industry_layoffs'].fillna(fused_df['industry_hiring'])
-    fused_df['location'] = fused_df['location_layoffs'].fillna(fused_df['location_hiring'])
+    # Keys with any event, in (company, year, month) order
+    keys = np.flatnonzero(has_layoffs | has_hires)
+    month_index = keys % n_months + first_month
+    company_index = keys // n_months
+    
+    if isinstance(layoffs_df['company'].dtype, pd.CategoricalDtype) and companies is layoffs_df['company'].cat.categories:
+        company = pd.Categorical.from_codes(company_index, dtype=layoffs_df['company'].dtype)
+    else:
+        company = companies.take(company_index)
+    
+    fused_df = pd.DataFrame({
+        'company': company,
+        'year': (month_index // 12).astype(layoffs_df['year'].dtype),
+        'month': (month_index % 12 + 1).astype(layoffs_df['month'].dtype),
+        'layoffs': layoffs[keys],
+        'hires': hires[keys],
+    })
+    
+    # Use industry and location from the first event of either dataset, layoffs first
+    layoff_first = _first_values(layoffs_df, layoff_keys, layoff_rows, keys, n_keys)
+    hiring_first = _first_values(hiring_df, hiring_keys, hiring_rows, keys, n_keys)
+    fused_df['industry'] = layoff_first['industry'].fillna(hiring_first['industry'])
+    fused_df['location'] = layoff_first['location'].fillna(hiring_first['location'])
     
     # Calculate net employment change
     fused_df['net_change'] = fused_df['hires'] - fused_df['layoffs']
@@ -42,21 +130,18 @@ def fuse_employment_data(layoffs_df, hiring_df):
     # Create date column
     fused_df['date'] = pd.to_datetime(fused_df[['year', 'month']].assign(day=1))
     
-    # Clean up columns
-    fused_df = fused_df.drop(['industry_layoffs', 'industry_hiring', 'location_layoffs', 'location_hiring'], axis=1)
-    
     return fused_df
 
 def calculate_industry_trends(layoffs_df, hiring_df):
     """Calculate trends by industry"""
     
     # Industry layoffs trends
-    industry_layoffs = layoffs_df.groupby(['industry', 'year']).agg({
+    industry_layoffs = layoffs_df.groupby(['industry', 'year'], observed=True).agg({
         'layoffs': 'sum'
     }).reset_index()
     
     # Industry hiring trends
-    industry_hiring = hiring_df.groupby(['industry', 'year']).agg({
+    industry_hiring = hiring_df.groupby(['industry', 'year'], observed=True).agg({
         'hires': 'sum'
     }).reset_index()
     
@@ -72,32 +157,93 @@ def calculate_industry_trends(layoffs_df, hiring_df):
     
     return industry_trends
 
+def column_codes(series):
+    """Integer codes (-1 for missing) and the distinct values they point into"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, uniques = pd.factorize(series)
+    return codes, pd.Index(uniques)
+
+def _axis_totals(values, codes, size):
+    """Sum values and count rows per code of one axis; rows with a -1 (missing) code are skipped
+
+    One bincount per axis keeps memory proportional to the events plus the axis
+    size, rather than to the cross product of every axis.
+    """
+    if len(codes) and codes.min() < 0:
+        present = codes >= 0
+        codes, values = codes[present], values[present]
+    sums = np.bincount(codes, weights=values, minlength=size)
+    counts = np.bincount(codes, minlength=size)
+    return sums, counts
+
+def _totals_series(sums, counts, index, name, dtype):
+    """Series of the groups that had rows, named and typed like a groupby sum"""
+    present = counts > 0
+    return pd.Series(sums[present].astype(dtype), index=index[present], name=name)
+
+def _top_n(series, n=10):
+    """Largest n values in descending order, selected with argpartition"""
+    values = series.to_numpy()
+    if len(values) > n:
+        top = np.argpartition(-values, n - 1)[:n]
+    else:
+        top = np.arange(len(values))
+    return series.iloc[top[np.argsort(-values[top], kind='stable')]]
+
+def _scan_events(events_df, value_col, with_industry):
+    """Company, monthly and (optionally) industry totals from one scan of an event frame"""
+    values = events_df[value_col].to_numpy()
+    dtype = np.int64 if np.issubdtype(values.dtype, np.integer) else np.float64
+
+    company_codes, companies = column_codes(events_df['company'])
+    month_keys = _month_keys(events_df)
+    first_month = month_keys.min() if len(month_keys) else 0
+    n_months = month_keys.max() - first_month + 1 if len(month_keys) else 0
+    month_keys -= first_month
+
+    totals = {
+        'total': values.sum(dtype=dtype),
+        'company': _totals_series(*_axis_totals(values, company_codes, len(companies)),
+                                  pd.Index(companies, name='company'), value_col, dtype),
+    }
+
+    month_index = np.arange(n_months) + first_month
+    totals['monthly'] = _totals_series(
+        *_axis_totals(values, month_keys, n_months),
+        pd.MultiIndex.from_arrays([(month_index // 12).astype(events_df['year'].dtype),
+                                   (month_index % 12 + 1).astype(events_df['month'].dtype)],
+                                  names=['year', 'month']),
+        value_col, dtype)
+
+    if with_industry:
+        industry_codes, industries = column_codes(events_df['industry'])
+        totals['industry'] = _totals_series(*_axis_totals(values, industry_codes, len(industries)),
+                                            pd.Index(industries, name='industry'), value_col, dtype)
+    return totals
+
 def get_summary_statistics(layoffs_df, hiring_df, fused_df):
     """Calculate key summary statistics"""
     
-    total_layoffs = layoffs_df['layoffs'].sum()
-    total_hires = hiring_df['hires'].sum()
-    net_employment_change = total_hires - total_layoffs
-    
-    # Most affected companies
-    company_layoffs = layoffs_df.groupby('company')['layoffs'].sum().sort_values(ascending=False)
-    company_hires = hiring_df.groupby('company')['hires'].sum().sort_values(ascending=False)
+    # One scan per event frame, with one bincount per reported dimension
+    layoff_totals = _scan_events(layoffs_df, 'layoffs', with_industry=True)
+    hiring_totals = _scan_events(hiring_df, 'hires', with_industry=False)
     
-    # Monthly trends
-    monthly_layoffs = layoffs_df.groupby(['year', 'month'])['layoffs'].sum()
-    monthly_hires = hiring_df.groupby(['year', 'month'])['hires'].sum()
+    total_layoffs = layoff_totals['total']
+    total_hires = hiring_totals['total']
+    net_employment_change = total_hires - total_layoffs
     
     # Industry impact
-    industry_impact = layoffs_df.groupby('industry')['layoffs'].sum().sort_values(ascending=False)
+    industry_impact = layoff_totals['industry'].sort_values(ascending=False)
     
     return {
         'total_layoffs': total_layoffs,
         'total_hires': total_hires,
         'net_employment_change': net_employment_change,
-        'top_layoff_companies': company_layoffs.head(10),
-        'top_hiring_companies': company_hires.head(10),
-        'monthly_layoffs': monthly_layoffs,
-        'monthly_hires': monthly_hires,
+        'top_layoff_companies': _top_n(layoff_totals['company']),
+        'top_hiring_companies': _top_n(hiring_totals['company']),
+        'monthly_layoffs': layoff_totals['monthly'],
+        'monthly_hires': hiring_totals['monthly'],
         'industry_impact': industry_impact
     }
 
@@ -1,85 +1,153 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 
-def generate_sample_data():
+# Tech companies list
+COMPANIES = [
+    'Meta', 'Google', 'Amazon', 'Microsoft', 'Apple', 'Netflix', 'Tesla',
+    'Twitter', 'Uber', 'Airbnb', 'Spotify', 'Zoom', 'Salesforce', 'Adobe',
+    'Intel', 'NVIDIA', 'PayPal', 'Square', 'Dropbox', 'Slack'
+]
+
+# Industries
+INDUSTRIES = ['Social Media', 'Search/Cloud', 'E-commerce', 'Software', 'Hardware',
+              'Streaming', 'Automotive', 'Transportation', 'Travel', 'Music',
+              'Video Conferencing', 'CRM', 'Design', 'Semiconductors', 'Fintech']
+
+# Locations
+LOCATIONS = ['San Francisco', 'Seattle', 'New York', 'Austin', 'Boston',
+             'Los Angeles', 'Chicago', 'Denver', 'Atlanta', 'Remote']
+
+QUARTERS = ['Q1', 'Q2', 'Q3', 'Q4']
+
+# Sample period (2020-2024)
+START_DATE = datetime(2020, 1, 1)
+END_DATE = datetime(2024, 12, 31)
+
+# Event types, named after their headcount column
+EVENT_TYPES = ('layoffs', 'hires')
+
+# Headcount ranges per event type as (default range, {year: range})
+HEADCOUNT_RANGES = {
+    # Higher layoffs in 2022-2023 (economic downturn)
+    'layoffs': ((10, 500), {2022: (50, 2000), 2023: (50, 2000)}),
+    # Higher hiring in 2020-2021 (pandemic boom)
+    'hires': ((50, 1500), {2020: (100, 3000), 2021: (100, 3000),
+                           2022: (20, 800), 2023: (20, 800)}),
+}
+
+def _headcount_bounds(years, value_col):
+    """Look up the era-dependent headcount range for every event year"""
+    default, by_year = HEADCOUNT_RANGES[value_col]
+    first_year = int(years.min()) if len(years) else START_DATE.year
+    span = (int(years.max()) if len(years) else first_year) - first_year + 1
+
+    low = np.full(span, default[0], dtype=np.int64)
+    high = np.full(span, default[1], dtype=np.int64)
+    for year, (year_low, year_high) in by_year.items():
+        if 0 <= year - first_year < span:
+            low[year - first_year] = year_low
+            high[year - first_year] = year_high
+
+    offsets = years - first_year
+    return low[offsets], high[offsets]
+
+def draw_event_columns(rng, value_col, n_events, companies=COMPANIES, industries=INDUSTRIES,
+                       locations=LOCATIONS, start_date=START_DATE, end_date=END_DATE):
+    """Draw typed event columns, keeping company/industry/location as integer codes"""
+    start = np.datetime64(start_date.date(), 'D')
+    n_days = (end_date - start_date).days
+
+    dates = start + rng.integers(0, n_days + 1, size=n_events)
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    months = dates.astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+    company_codes = rng.integers(0, len(companies), size=n_events)
+    industry_codes = rng.integers(0, len(industries), size=n_events)
+    location_codes = rng.integers(0, len(locations), size=n_events)
+
+    low, high = _headcount_bounds(years, value_col)
+    values = rng.integers(low, high + 1)
+
+    return {
+        'date': dates,
+        'company': company_codes,
+        value_col: values,
+        'industry': industry_codes,
+        'location': location_codes,
+        'year': years,
+        'month': months,
+    }
+
+def events_to_frame(columns, value_col, companies=COMPANIES, industries=INDUSTRIES,
+                    locations=LOCATIONS):
+    """Materialize drawn event columns into the layoffs/hiring DataFrame schema"""
+    return pd.DataFrame({
+        'date': columns['date'].astype('datetime64[us]'),
+        'company': np.asarray(companies, dtype=object)[columns['company']],
+        value_col: columns[value_col],
+        'industry': np.asarray(industries, dtype=object)[columns['industry']],
+        'location': np.asarray(locations, dtype=object)[columns['location']],
+        'year': columns['year'],
+        'month': columns['month'],
+        'quarter': np.asarray(QUARTERS, dtype=object)[(columns['month'] - 1) // 3],
+    })
+
+def _dictionaries(options):
+    """Pick the category dictionaries out of generator keyword options"""
+    return {key: value for key, value in options.items()
+            if key in ('companies', 'industries', 'locations')}
+
+def generate_events(value_col, n_events, seed=None, rng=None, **options):
+    """Generate n_events layoff ('layoffs') or hiring ('hires') events"""
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    columns = draw_event_columns(rng, value_col, n_events, **options)
+    return events_to_frame(columns, value_col, **_dictionaries(options))
+
+def chunk_rng(seed, value_col, chunk_index):
+    """Derive the independent random generator for one chunk of one event type"""
+    seed_seq = np.random.SeedSequence(seed, spawn_key=(EVENT_TYPES.index(value_col), chunk_index))
+    return np.random.default_rng(seed_seq)
+
+def count_chunks(n_events, chunk_size):
+    """Number of chunks needed to cover n_events"""
+    return -(-n_events // chunk_size)
+
+def generate_chunk(value_col, chunk_index, n_events, chunk_size, seed, as_arrow=False, **options):
+    """Generate one fixed-size chunk; its content depends only on seed and chunk_index"""
+    size = min(chunk_size, n_events - chunk_index * chunk_size)
+    if size <= 0:
+        raise IndexError(f"chunk {chunk_index} is out of range for {n_events} events")
+
+    frame = generate_events(value_col, size, rng=chunk_rng(seed, value_col, chunk_index), **options)
+    if as_arrow:
+        import pyarrow as pa
+        return pa.RecordBatch.from_pandas(frame, preserve_index=False)
+    return frame
+
+def iter_event_chunks(value_col, n_events, chunk_size=1_000_000, seed=None, as_arrow=False, **options):
+    """Yield n_events events of one type as DataFrame (or Arrow record batch) chunks"""
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    for chunk_index in range(count_chunks(n_events, chunk_size)):
+        yield generate_chunk(value_col, chunk_index, n_events, chunk_size, seed, as_arrow, **options)
+
+def stream_sample_data(n_layoffs, n_hiring, chunk_size=1_000_000, seed=None, as_arrow=False, **options):
+    """Stream layoffs then hiring events as (value_col, chunk) pairs with bounded memory"""
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    for value_col, n_events in (('layoffs', n_layoffs), ('hires', n_hiring)):
+        for chunk in iter_event_chunks(value_col, n_events, chunk_size, seed, as_arrow, **options):
+            yield value_col, chunk
+
+def generate_sample_data(n_layoffs=500, n_hiring=600, seed=None):
     """Generate sample tech layoffs and hiring data"""
-    
-    # Tech companies list
-    companies = [
-        'Meta', 'Google', 'Amazon', 'Microsoft', 'Apple', 'Netflix', 'Tesla',
-        'Twitter', 'Uber', 'Airbnb', 'Spotify', 'Zoom', 'Salesforce', 'Adobe',
-        'Intel', 'NVIDIA', 'PayPal', 'Square', 'Dropbox', 'Slack'
-    ]
-    
-    # Industries
-    industries = ['Social Media', 'Search/Cloud', 'E-commerce', 'Software', 'Hardware', 
-                 'Streaming', 'Automotive', 'Transportation', 'Travel', 'Music',
-                 'Video Conferencing', 'CRM', 'Design', 'Semiconductors', 'Fintech']
-    
-    # Locations
-    locations = ['San Francisco', 'Seattle', 'New York', 'Austin', 'Boston', 
-                'Los Angeles', 'Chicago', 'Denver', 'Atlanta', 'Remote']
-    
-    # Generate layoffs data (2020-2024)
-    layoffs_data = []
-    start_date = datetime(2020, 1, 1)
-    end_date = datetime(2024, 12, 31)
-    
-    for _ in range(500):  # 500 layoff events
-        date = start_date + timedelta(days=random.randint(0, (end_date - start_date).days))
-        company = random.choice(companies)
-        industry = random.choice(industries)
-        location = random.choice(locations)
-        
-        # Higher layoffs in 2022-2023 (economic downturn)
-        if date.year in [2022, 2023]:
-            layoffs = random.randint(50, 2000)
-        else:
-            layoffs = random.randint(10, 500)
-            
-        layoffs_data.append({
-            'date': date,
-            'company': company,
-            'layoffs': layoffs,
-            'industry': industry,
-            'location': location,
-            'year': date.year,
-            'month': date.month,
-            'quarter': f"Q{(date.month-1)//3 + 1}"
-        })
-    
-    # Generate hiring data
-    hiring_data = []
-    for _ in range(600):  # 600 hiring events
-        date = start_date + timedelta(days=random.randint(0, (end_date - start_date).days))
-        company = random.choice(companies)
-        industry = random.choice(industries)
-        location = random.choice(locations)
-        
-        # Higher hiring in 2020-2021 (pandemic boom)
-        if date.year in [2020, 2021]:
-            hires = random.randint(100, 3000)
-        elif date.year in [2022, 2023]:
-            hires = random.randint(20, 800)
-        else:
-            hires = random.randint(50, 1500)
-            
-        hiring_data.append({
-            'date': date,
-            'company': company,
-            'hires': hires,
-            'industry': industry,
-            'location': location,
-            'year': date.year,
-            'month': date.month,
-            'quarter': f"Q{(date.month-1)//3 + 1}"
-        })
-    
-    layoffs_df = pd.DataFrame(layoffs_data)
-    hiring_df = pd.DataFrame(hiring_data)
-    
+    rng = np.random.default_rng(seed)
+
+    layoffs_df = generate_events('layoffs', n_layoffs, rng=rng)
+    hiring_df = generate_events('hires', n_hiring, rng=rng)
+
     return layoffs_df, hiring_df
 
 def get_company_list(layoffs_df, hiring_df):
@@ -91,4 +159,4 @@ def get_date_range(layoffs_df, hiring_df):
     """Get the date range from both datasets"""
     min_date = min(layoffs_df['date'].min(), hiring_df['date'].min())
     max_date = max(layoffs_df['date'].max(), hiring_df['date'].max())
-    return min_date, max_date
\ No newline at end of file
+    return min_date, max_date
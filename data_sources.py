@@ -0,0 +1,271 @@
+import os
+import logging
+import sqlite3
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pandas.api.types import union_categoricals
+
+from data_generator import QUARTERS, EVENT_TYPES
+from data_fusion import filter_data
+from schema import compact_frames
+
+logger = logging.getLogger(__name__)
+
+# Path of the production event source; unset means the dashboard uses generated sample data
+DEFAULT_SOURCE = os.environ.get('DASHBOARD_DATA_SOURCE')
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+# File or table names accepted for each event type, in lookup order
+EVENT_NAMES = {'layoffs': ('layoffs',), 'hires': ('hiring', 'hires')}
+
+CATEGORY_COLUMNS = ['company', 'industry', 'location']
+
+SQL_ENGINES = {'.db': 'sqlite', '.sqlite': 'sqlite', '.sqlite3': 'sqlite', '.duckdb': 'duckdb'}
+
+def event_columns(value_col):
+    """Columns every layoffs or hiring feed has to provide"""
+    return ['date', 'company', value_col, 'industry', 'location']
+
+def validate_events(df, value_col):
+    """Check a chunk of raw events against the event schema and coerce its types
+
+    Missing columns raise ValueError. Rows with a non-ISO 8601 date, a missing
+    name or a missing, negative or fractional count are dropped and logged.
+    Dates and datetimes may be mixed; offset-aware times are converted to UTC.
+    """
+    columns = event_columns(value_col)
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"{value_col} events are missing columns: {', '.join(missing)}")
+
+    dates = pd.to_datetime(df['date'], errors='coerce', format='ISO8601', utc=True).dt.tz_localize(None)
+    values = pd.to_numeric(df[value_col], errors='coerce')
+    # Counts are headcounts; a fractional one is a bad row, not something to truncate
+    counts = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = dates.notna().to_numpy() & np.isfinite(counts) & (counts >= 0) & (counts == np.floor(counts))
+    for col in CATEGORY_COLUMNS:
+        valid &= df[col].notna().to_numpy()
+
+    n_invalid = len(df) - int(valid.sum())
+    if n_invalid:
+        logger.warning("dropped %d invalid %s rows", n_invalid, value_col)
+
+    return pd.DataFrame({
+        'date': dates[valid].astype('datetime64[us]').to_numpy(),
+        'company': df['company'][valid].astype(str).astype('category').to_numpy(),
+        value_col: values[valid].astype(np.int64).to_numpy(),
+        'industry': df['industry'][valid].astype(str).astype('category').to_numpy(),
+        'location': df['location'][valid].astype(str).astype('category').to_numpy(),
+    })
+
+def derive_calendar(df):
+    """Add year, month and quarter columns derived from the event dates"""
+    dates = df['date'].dt
+    month = dates.month.to_numpy()
+    return df.assign(
+        year=dates.year.to_numpy(),
+        month=month,
+        quarter=np.asarray(QUARTERS, dtype=object)[(month - 1) // 3]
+    )
+
+def _date_bounds(years):
+    """Half-open [start, end) date range covering the selected years"""
+    return f"{min(years):04d}-01-01", f"{max(years) + 1:04d}-01-01"
+
+def _concat_chunks(chunks):
+    """Concatenate validated chunks, unioning their per-chunk categoricals"""
+    if len(chunks) == 1:
+        return chunks[0]
+    columns = {}
+    for col in chunks[0].columns:
+        if isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+            columns[col] = union_categoricals([chunk[col] for chunk in chunks])
+        else:
+            columns[col] = np.concatenate([chunk[col].to_numpy() for chunk in chunks])
+    return pd.DataFrame(columns)
+
+class EventSource:
+    """Base for layoff and hiring feeds read in chunks with optional filter pushdown
+
+    Subclasses implement read_chunks(value_col, filters) and paths(). filters
+    is a dict with the filter_data keys (companies, years, months, industries);
+    whatever a source cannot push down is applied after validation.
+    """
+
+    chunksize = DEFAULT_CHUNK_SIZE
+
+    def paths(self):
+        raise NotImplementedError
+
+    def read_chunks(self, value_col, filters=None):
+        raise NotImplementedError
+
+    def fingerprint(self):
+        """Paths, sizes and modification times identifying the current source contents"""
+        stamps = []
+        for path in self.paths():
+            stat = os.stat(path)
+            stamps.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+        return stamps
+
+    def iter_events(self, value_col, filters=None):
+        """Validated chunks of one event type with calendar columns, filtered to the selection"""
+        filters = filters or {}
+        for chunk in self.read_chunks(value_col, filters):
+            chunk = derive_calendar(validate_events(chunk, value_col))
+            if any(filters.values()):
+                chunk = filter_data(chunk, **filters)
+            yield chunk
+
+    def load_events(self, value_col, filters=None):
+        """Validated events of one type with calendar columns, filtered to the selection"""
+        chunks = list(self.iter_events(value_col, filters))
+        if not chunks:
+            chunks = [derive_calendar(validate_events(pd.DataFrame(columns=event_columns(value_col)), value_col))]
+        return _concat_chunks(chunks)
+
+    def load(self, filters=None):
+        """Layoffs and hiring frames in the compact schema over one shared dictionary"""
+        layoffs_df, hiring_df = (self.load_events(value_col, filters) for value_col in EVENT_TYPES)
+        return compact_frames(layoffs_df, hiring_df)
+
+class CSVSource(EventSource):
+    """Events from one CSV file per event type
+
+    CSV cannot skip rows, so filters are applied chunk by chunk as the file
+    streams in and only matching rows are kept in memory.
+    """
+
+    def __init__(self, layoffs_path, hiring_path, chunksize=DEFAULT_CHUNK_SIZE):
+        self.files = {'layoffs': layoffs_path, 'hires': hiring_path}
+        self.chunksize = chunksize
+
+    def paths(self):
+        return list(self.files.values())
+
+    def read_chunks(self, value_col, filters=None):
+        with pd.read_csv(self.files[value_col], usecols=event_columns(value_col), chunksize=self.chunksize) as reader:
+            yield from reader
+
+class ParquetSource(EventSource):
+    """Events from a Parquet file or directory of part files per event type
+
+    Company and industry filters, and the selected years as a date range,
+    are pushed into the scan so row groups outside them are skipped.
+    """
+
+    def __init__(self, layoffs_path, hiring_path, chunksize=DEFAULT_CHUNK_SIZE):
+        self.files = {'layoffs': layoffs_path, 'hires': hiring_path}
+        self.chunksize = chunksize
+
+    def paths(self):
+        paths = []
+        for path in self.files.values():
+            if os.path.isdir(path):
+                paths.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.parquet'))
+            else:
+                paths.append(path)
+        return paths
+
+    def _expression(self, schema, filters):
+        """Arrow filter expression for the pushable part of a selection"""
+        expression = None
+        conditions = []
+        for col, key in (('company', 'companies'), ('industry', 'industries')):
+            if filters.get(key):
+                conditions.append(ds.field(col).isin([str(value) for value in filters[key]]))
+        if filters.get('years') and pa.types.is_timestamp(schema.field('date').type):
+            start, end = _date_bounds(filters['years'])
+            date_type = schema.field('date').type
+            conditions.append((ds.field('date') >= pa.scalar(pd.Timestamp(start), date_type))
+                              & (ds.field('date') < pa.scalar(pd.Timestamp(end), date_type)))
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def read_chunks(self, value_col, filters=None):
+        dataset = ds.dataset(self.files[value_col], format='parquet')
+        batches = dataset.to_batches(columns=event_columns(value_col),
+                                     filter=self._expression(dataset.schema, filters or {}),
+                                     batch_size=self.chunksize)
+        for batch in batches:
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+class SQLSource(EventSource):
+    """Events from tables in a SQLite or DuckDB database file
+
+    Company, industry and year filters become a WHERE clause, so only the
+    selected rows leave the database. DuckDB is optional and only imported
+    when a .duckdb file is opened.
+    """
+
+    def __init__(self, path, engine='sqlite', tables=None, chunksize=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.engine = engine
+        self.tables = tables or {'layoffs': 'layoffs', 'hires': 'hiring'}
+        self.chunksize = chunksize
+
+    def paths(self):
+        return [self.path]
+
+    def connect(self):
+        """Read-only connection to the database file"""
+        if self.engine == 'duckdb':
+            import duckdb
+            return duckdb.connect(self.path, read_only=True)
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def _where(self, filters):
+        """WHERE clause and parameters for the pushable part of a selection"""
+        conditions, params = [], []
+        for col, key in (('company', 'companies'), ('industry', 'industries')):
+            if filters.get(key):
+                conditions.append(f"{col} IN ({', '.join('?' * len(filters[key]))})")
+                params.extend(str(value) for value in filters[key])
+        if filters.get('years'):
+            conditions.append("date >= ? AND date < ?")
+            params.extend(_date_bounds(filters['years']))
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def read_chunks(self, value_col, filters=None):
+        where, params = self._where(filters or {})
+        columns = ', '.join(event_columns(value_col))
+        connection = self.connect()
+        try:
+            cursor = connection.execute(f"SELECT {columns} FROM {self.tables[value_col]}{where}", params)
+            names = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(self.chunksize)
+                if not rows:
+                    break
+                yield pd.DataFrame(rows, columns=names)
+        finally:
+            connection.close()
+
+def _find_event_file(directory, value_col, extensions):
+    """First file or part directory in directory naming value_col's events"""
+    for name in EVENT_NAMES[value_col]:
+        for extension in extensions:
+            path = os.path.join(directory, name + extension)
+            if os.path.isfile(path) if extension else os.path.isdir(path):
+                return path
+    raise FileNotFoundError(f"no {value_col} events found in {directory}")
+
+def open_source(path, chunksize=DEFAULT_CHUNK_SIZE):
+    """Event source for a database file or a directory of CSV or Parquet event files"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in SQL_ENGINES:
+        return SQLSource(path, SQL_ENGINES[extension], chunksize=chunksize)
+    if not os.path.isdir(path):
+        raise ValueError(f"unsupported data source: {path}")
+
+    try:
+        files = [_find_event_file(path, value_col, ('.parquet', '')) for value_col in EVENT_TYPES]
+        return ParquetSource(*files, chunksize=chunksize)
+    except FileNotFoundError:
+        files = [_find_event_file(path, value_col, ('.csv',)) for value_col in EVENT_TYPES]
+        return CSVSource(*files, chunksize=chunksize)
@@ -0,0 +1,99 @@
+import os
+import json
+import shutil
+import hashlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# The one version to bump when what gets stored changes: a table's columns or
+# meaning, or the meaning of the generator parameters
+# (2: aggregation cube table, 3: fused table built by the keyed-array join)
+STORE_VERSION = 3
+
+DEFAULT_STORE_DIR = os.environ.get('DASHBOARD_DATA_DIR', '.dataset_cache')
+
+META_FILE = 'meta.json'
+
+def dataset_key(params, layout=None):
+    """Content hash identifying the dataset produced by the given generator parameters
+
+    layout names the tables a caller stores, so adding or dropping a table
+    never reuses a dataset of the old shape. Changes inside a table are
+    versioned by STORE_VERSION alone.
+    """
+    payload = json.dumps({'store_version': STORE_VERSION, 'layout': layout, 'params': params},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def _write_table(df, table_dir):
+    """Write one frame as Parquet files partitioned by year"""
+    os.makedirs(table_dir)
+    if df.empty:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), os.path.join(table_dir, 'empty.parquet'))
+    for year, part in df.groupby('year', sort=True):
+        table = pa.Table.from_pandas(part, preserve_index=False)
+        pq.write_table(table, os.path.join(table_dir, f"year={int(year)}.parquet"))
+
+def _column_dtypes(df):
+    """Describe categorical columns so loads restore the exact shared dictionary"""
+    return {col: list(df[col].cat.categories) for col in df.columns
+            if isinstance(df[col].dtype, pd.CategoricalDtype)}
+
+def save_dataset(key, frames, root=DEFAULT_STORE_DIR):
+    """Persist named frames under key; the dataset directory appears atomically"""
+    dataset_dir = os.path.join(root, key)
+    tmp_dir = f"{dataset_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    meta = {'tables': {}}
+    for name, df in frames.items():
+        _write_table(df, os.path.join(tmp_dir, name))
+        meta['tables'][name] = {'rows': len(df), 'categories': _column_dtypes(df)}
+    with open(os.path.join(tmp_dir, META_FILE), 'w') as f:
+        json.dump(meta, f, indent=2, sort_keys=True)
+
+    try:
+        os.rename(tmp_dir, dataset_dir)
+    except OSError:
+        # Another process stored the same dataset first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return dataset_dir
+
+def _read_table(table_dir, categories, years=None):
+    """Memory-map the year partitions of one table and rebuild its pandas dtypes"""
+    all_files = sorted(os.listdir(table_dir))
+    files = all_files
+    if years is not None:
+        wanted = {f"year={int(year)}.parquet" for year in years}
+        files = [name for name in files if name in wanted]
+
+    tables = [pq.read_table(os.path.join(table_dir, name), memory_map=True) for name in files]
+    if not tables:
+        tables = [pq.read_schema(os.path.join(table_dir, all_files[0])).empty_table()]
+    df = pa.concat_tables(tables).to_pandas()
+    for col, values in categories.items():
+        df[col] = df[col].astype(pd.CategoricalDtype(values))
+    return df
+
+def load_dataset(key, root=DEFAULT_STORE_DIR, years=None):
+    """Load the stored frames for key (rows grouped by year), or None when not cached"""
+    dataset_dir = os.path.join(root, key)
+    meta_path = os.path.join(dataset_dir, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+
+    with open(meta_path) as f:
+        meta = json.load(f)
+    return {name: _read_table(os.path.join(dataset_dir, name), info['categories'], years)
+            for name, info in meta['tables'].items()}
+
+def load_or_build(params, build, root=DEFAULT_STORE_DIR, layout=None):
+    """Load the dataset for params from the store, building and saving it on a miss"""
+    key = dataset_key(params, layout)
+    frames = load_dataset(key, root)
+    if frames is None:
+        frames = build(**params)
+        save_dataset(key, frames, root)
+    return frames, key
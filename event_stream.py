@@ -0,0 +1,185 @@
+import os
+import json
+import logging
+import threading
+import pandas as pd
+
+from data_generator import EVENT_TYPES
+from data_sources import event_columns, validate_events, derive_calendar
+from aggregation_cube import CUBE_KEYS, CUBE_MEASURES, build_cube
+from data_fusion import FUSION_KEYS
+from filter_index import LiveIndex
+from incremental_fusion import IncrementalFusion
+from schema import build_dictionary, compact_frame, extend_dictionary, recode_categories
+
+logger = logging.getLogger(__name__)
+
+# Append-only JSONL log of live events; unset means the dashboard data is static
+DEFAULT_EVENT_LOG = os.environ.get('DASHBOARD_EVENT_LOG')
+
+# Largest number of events folded into the dataset per poll
+MAX_BATCH_EVENTS = 50_000
+
+def append_events(path, records):
+    """Append event records to a JSONL log, one complete line per event
+
+    Each record has a 'type' of 'layoffs' or 'hires', the event fields
+    (date, company, industry, location) and its count under the type's name.
+    """
+    lines = ''.join(json.dumps(record, default=str) + '\n' for record in records)
+    with open(path, 'a') as f:
+        f.write(lines)
+        f.flush()
+
+class EventLogTailer:
+    """Reads complete lines appended to a JSONL event log since the last read
+
+    A partially written last line is left for the next read. If the log is
+    replaced or truncated, reading starts over from its beginning.
+    """
+
+    def __init__(self, path, offset=0):
+        self.path = path
+        self.offset = offset
+        # The file the offset refers to; a different one is read from its start
+        try:
+            self.inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            self.inode = None
+
+    def read(self, max_records=MAX_BATCH_EVENTS):
+        """Records appended since the last read, at most max_records"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.inode = stat.st_ino
+            self.offset = 0
+        if stat.st_size == self.offset:
+            return []
+
+        records = []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            while len(records) < max_records:
+                line = f.readline()
+                if not line.endswith(b'\n'):
+                    break
+                self.offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.warning("skipped malformed event log line at offset %d", self.offset - len(line))
+        return records
+
+def records_to_frames(records):
+    """Validated layoffs and hiring frames, with calendar columns, from event records"""
+    by_type = {value_col: [] for value_col in EVENT_TYPES}
+    for record in records:
+        value_col = record.get('type')
+        if value_col in by_type:
+            by_type[value_col].append(record)
+    n_unknown = len(records) - sum(len(rows) for rows in by_type.values())
+    if n_unknown:
+        logger.warning("dropped %d events without a known type", n_unknown)
+
+    return tuple(
+        derive_calendar(validate_events(pd.DataFrame(rows, columns=event_columns(value_col)), value_col))
+        for value_col, rows in by_type.items()
+    )
+
+class LiveDataset:
+    """Dashboard indexes kept current by folding micro-batches of new events in incrementally
+
+    New events are coded against the running category dictionary, which is
+    only extended with values not seen before. The fused monthly table and
+    the cube are updated cell by cell, and every table's LiveIndex takes
+    only the new and updated rows, so a batch costs time in its own size
+    rather than the dataset's. Every applied batch bumps dataset_version,
+    so caches keyed on it miss exactly when the data has changed.
+    """
+
+    def __init__(self, layoffs_df, hiring_df, base_version, tailer=None):
+        self.base_version = base_version
+        self.tailer = tailer
+        self.dictionary = build_dictionary(layoffs_df, hiring_df)
+        layoffs_df = compact_frame(layoffs_df, self.dictionary)
+        hiring_df = compact_frame(hiring_df, self.dictionary)
+        self.fusion = IncrementalFusion(layoffs_df, hiring_df)
+        self.indexes = {
+            'layoffs': LiveIndex(layoffs_df, self.dictionary),
+            'hiring': LiveIndex(hiring_df, self.dictionary),
+            'fused': LiveIndex(recode_categories(self.fusion.fused_df, self.dictionary), self.dictionary,
+                               keys=FUSION_KEYS, sort_keys=FUSION_KEYS),
+            'cube': LiveIndex(recode_categories(build_cube(layoffs_df, hiring_df), self.dictionary), self.dictionary,
+                              keys=CUBE_KEYS),
+        }
+        self.companies = set(layoffs_df['company'].unique()) | set(hiring_df['company'].unique())
+        self.years = set(layoffs_df['year'].unique())
+        self.industries = set(layoffs_df['industry'].unique())
+        self.events_total = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return self.fusion.version
+
+    @property
+    def dataset_version(self):
+        return self.base_version if self.version == 0 else f"{self.base_version}+{self.version}"
+
+    def _cube_cells(self, new_layoffs, new_hiring):
+        """Cube rows of the cells a batch touches, with their running totals"""
+        batch = recode_categories(build_cube(new_layoffs, new_hiring), self.dictionary)
+        current = self.indexes['cube'].lookup(batch)
+        if not len(current):
+            return batch
+        return pd.concat([batch, current], ignore_index=True).groupby(
+            CUBE_KEYS, observed=True)[CUBE_MEASURES].sum().reset_index()
+
+    def apply(self, new_layoffs, new_hiring):
+        """Fold one batch of validated events into every derived table; returns the events applied"""
+        n_events = len(new_layoffs) + len(new_hiring)
+        if not n_events:
+            return 0
+        with self._lock:
+            self.dictionary = extend_dictionary(self.dictionary, new_layoffs, new_hiring)
+            new_layoffs = compact_frame(new_layoffs, self.dictionary)
+            new_hiring = compact_frame(new_hiring, self.dictionary)
+
+            cells = recode_categories(self.fusion.append(new_layoffs, new_hiring), self.dictionary)
+            cube_cells = self._cube_cells(new_layoffs, new_hiring)
+            for name, df in (('layoffs', new_layoffs), ('hiring', new_hiring), ('fused', cells), ('cube', cube_cells)):
+                self.indexes[name].append(df, self.dictionary)
+
+            self.companies.update(new_layoffs['company'].dropna().unique(), new_hiring['company'].dropna().unique())
+            self.years.update(new_layoffs['year'].unique())
+            self.industries.update(new_layoffs['industry'].dropna().unique())
+            self.events_total += n_events
+            self._snapshot = None
+        return n_events
+
+    def poll(self):
+        """Apply whatever the tailer has seen since the last poll; returns the events applied"""
+        if self.tailer is None:
+            return 0
+        with self._lock:
+            records = self.tailer.read()
+        if not records:
+            return 0
+        applied = self.apply(*records_to_frames(records))
+        logger.info("applied %d live events, dataset_version=%s", applied, self.dataset_version)
+        return applied
+
+    def snapshot(self):
+        """Current (indexes, filter options, dataset_version), taken once per version"""
+        with self._lock:
+            if self._snapshot is None:
+                indexes = {name: index.snapshot() for name, index in self.indexes.items()}
+                options = (sorted(self.companies), sorted(self.years), sorted(self.industries))
+                self._snapshot = (indexes, options, self.dataset_version)
+            return self._snapshot
@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+
+from selection_cache import SelectionCache, selection_key
+from chart_budget import CHART_BUDGET_BYTES, fit_to_budget
+
+class FigureCache:
+    """Built Plotly figures keyed by chart type, filter selection and dataset version
+
+    A hit returns the cached figure object, skipping both the aggregation and
+    the trace construction of the chart builder. Entries are sized by their
+    serialized payload, measured once when the figure is built. A chart may
+    supply several builds, finest first, to fall back through when over the
+    payload budget.
+    """
+
+    def __init__(self, maxsize=128, max_bytes=None, ttl=None, budget=CHART_BUDGET_BYTES):
+        self.entries = SelectionCache(maxsize=maxsize, max_bytes=max_bytes, ttl=ttl)
+        self.budget = budget
+        self._payloads = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, chart, dataset_version, selection):
+        """Cache key for one chart of one selection"""
+        return selection_key(dataset_version, *selection, namespace=f'figure:{chart}')
+
+    def get_figure(self, chart, dataset_version, selection, builds):
+        """Figure for a selection, building and storing it on a miss"""
+        key = self.key(chart, dataset_version, selection)
+        fig = self.entries.get(key)
+        if fig is None:
+            fig, size, level = fit_to_budget(chart, builds, self.budget)
+            self.entries.put(key, fig, size=size)
+            self._record_payload(chart, dataset_version, selection, size, level)
+        return fig
+
+    def _record_payload(self, chart, dataset_version, selection, size, level):
+        """Remember the payload size of a built figure, keeping as many records as cache entries"""
+        record = (selection_key(dataset_version, *selection, namespace='figure'), chart)
+        with self._lock:
+            self._payloads[record] = {'bytes': size, 'level': level}
+            self._payloads.move_to_end(record)
+            while len(self._payloads) > self.entries.maxsize:
+                self._payloads.popitem(last=False)
+
+    def payloads(self, dataset_version, selection):
+        """Payload bytes and fallback level of each chart built for one selection"""
+        selection = selection_key(dataset_version, *selection, namespace='figure')
+        with self._lock:
+            return {chart: dict(info) for (key, chart), info in self._payloads.items() if key == selection}
+
+    def clear(self):
+        """Drop every cached figure"""
+        self.entries.clear()
+        with self._lock:
+            self._payloads.clear()
+
+    def stats(self):
+        """Hit/miss and size counters of the underlying cache"""
+        return self.entries.stats()
@@ -0,0 +1,235 @@
+import pandas as pd
+import numpy as np
+
+from data_fusion import column_codes
+from schema import recode_categories
+
+# Columns the dashboard filters on, in filter_data argument order
+FILTER_COLUMNS = ('company', 'year', 'month', 'industry')
+
+# Columns with at most this many distinct values get packed bitmaps; larger
+# dictionaries get row lists, whose size does not grow with the value count
+MAX_BITMAP_VALUES = 64
+
+def _union(bitmaps, positions):
+    """OR together the packed bitmaps at positions"""
+    result = bitmaps[positions[0]].copy()
+    for position in positions[1:]:
+        np.bitwise_or(result, bitmaps[position], out=result)
+    return result
+
+class _Bitmaps:
+    """One packed row bitmap per value of a low-cardinality column"""
+
+    def __init__(self, codes, n_values, n_rows):
+        self.n_rows = n_rows
+        self.bitmaps = np.zeros((n_values, (n_rows + 7) // 8), dtype=np.uint8)
+        for code in range(n_values):
+            self.bitmaps[code] = np.packbits(codes == code)
+
+    def union(self, positions):
+        return _union(self.bitmaps, positions)
+
+    @property
+    def nbytes(self):
+        return self.bitmaps.nbytes
+
+class _RowLists:
+    """Rows of every value of a high-cardinality column, as one CSR array of row positions
+
+    rows[offsets[code]:offsets[code + 1]] are the ascending row positions
+    holding code; memory is one position per non-missing row, whatever the
+    number of values.
+    """
+
+    def __init__(self, codes, n_values, n_rows):
+        self.n_rows = n_rows
+        position_dtype = np.int32 if n_rows <= np.iinfo(np.int32).max else np.int64
+        present = codes >= 0
+        order = np.argsort(codes, kind='stable')
+        self.rows = order[len(codes) - int(present.sum()):].astype(position_dtype)
+        self.offsets = np.zeros(n_values + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes[present], minlength=n_values), out=self.offsets[1:])
+
+    def union(self, positions):
+        selected = np.zeros(self.n_rows, dtype=bool)
+        for position in positions:
+            selected[self.rows[self.offsets[position]:self.offsets[position + 1]]] = True
+        return np.packbits(selected)
+
+    @property
+    def nbytes(self):
+        return self.rows.nbytes + self.offsets.nbytes
+
+class FilterIndex:
+    """Per-value row indexes answering filter_data selections without copying the frame
+
+    Small dictionaries (years, months, industries) keep a packed bitmap per
+    value; large ones (companies) keep CSR row lists, so the index stays
+    proportional to the rows rather than to rows x values.
+    """
+
+    def __init__(self, df, columns=FILTER_COLUMNS, max_bitmap_values=MAX_BITMAP_VALUES):
+        self.df = df
+        self.n_rows = len(df)
+        self.columns = columns
+        self.values = {}
+        self.indexes = {}
+        self.valid = {}
+
+        for col in columns:
+            codes, values = column_codes(df[col])
+            self.values[col] = values
+            kind = _Bitmaps if len(values) <= max_bitmap_values else _RowLists
+            self.indexes[col] = kind(codes, len(values), self.n_rows)
+            self.valid[col] = np.packbits(codes >= 0)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the per-value indexes and missing-value masks"""
+        return sum(index.nbytes for index in self.indexes.values()) + sum(mask.nbytes for mask in self.valid.values())
+
+    def _column_mask(self, col, selected):
+        """Packed mask of rows whose col value is in selected, or None if it keeps every row"""
+        values = self.values[col]
+        positions = values.get_indexer(pd.Index(selected).unique())
+        positions = positions[positions >= 0]
+
+        if len(positions) == 0:
+            return np.zeros_like(self.valid[col])
+        if len(positions) <= len(values) // 2:
+            return self.indexes[col].union(positions)
+
+        # Cheaper to drop the unselected values from the non-missing rows
+        unselected = np.setdiff1d(np.arange(len(values)), positions)
+        if len(unselected) == 0:
+            return self.valid[col]
+        return self.valid[col] & ~self.indexes[col].union(unselected)
+
+    def mask(self, companies=None, years=None, months=None, industries=None):
+        """Packed row mask for a selection, or None when no filter applies"""
+        result = None
+        for col, selected in zip(FILTER_COLUMNS, (companies, years, months, industries)):
+            if not selected:
+                continue
+            col_mask = self._column_mask(col, selected)
+            if result is None:
+                result = col_mask.copy()
+            else:
+                np.bitwise_and(result, col_mask, out=result)
+        return result
+
+    def rows(self, companies=None, years=None, months=None, industries=None):
+        """Positional row indices matching a selection"""
+        mask = self.mask(companies, years, months, industries)
+        if mask is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(np.unpackbits(mask, count=self.n_rows))
+
+    def filter(self, companies=None, years=None, months=None, industries=None):
+        """Rows of the indexed frame matching a selection, with filter_data semantics"""
+        mask = self.mask(companies, years, months, industries)
+        if mask is None:
+            return self.df
+        return self.df.iloc[np.flatnonzero(np.unpackbits(mask, count=self.n_rows))]
+
+def _unpacked_rows(mask, n_rows):
+    """Positions of the set bits of a packed row mask"""
+    return np.flatnonzero(np.unpackbits(mask, count=n_rows))
+
+class SegmentedIndex:
+    """One version of a LiveIndex: its segments frozen, answering filter like a FilterIndex"""
+
+    def __init__(self, segments, dictionary, sort_keys=None):
+        self.segments = segments
+        self.dictionary = dictionary
+        self.sort_keys = sort_keys
+
+    def filter(self, companies=None, years=None, months=None, industries=None):
+        """Live rows of every segment matching a selection, with filter_data semantics"""
+        parts = []
+        for index, _, alive, _ in self.segments:
+            mask = index.mask(companies, years, months, industries)
+            if alive is not None:
+                mask = alive if mask is None else mask & alive
+            part = index.df if mask is None else index.df.iloc[_unpacked_rows(mask, index.n_rows)]
+            parts.append(recode_categories(part, self.dictionary))
+        if len(parts) == 1:
+            return parts[0]
+
+        result = pd.concat(parts, ignore_index=True)
+        if self.sort_keys:
+            result = result.sort_values(self.sort_keys, kind='stable', ignore_index=True)
+        return result
+
+class LiveIndex:
+    """FilterIndex over a frame that grows by appended batches, without re-indexing old rows
+
+    Each batch becomes a segment with its own FilterIndex. With keys, a row
+    appended for a key replaces that key's earlier row, which stays in its
+    segment but is cleared from the segment's alive mask. Segments are
+    merged like a binary counter, so every row is re-indexed O(log n) times
+    and the segment count stays logarithmic in the rows. With sort_keys,
+    filtered rows come back ordered by those columns.
+    """
+
+    def __init__(self, df, dictionary, keys=None, sort_keys=None):
+        self.dictionary = dictionary
+        self.keys = keys
+        self.sort_keys = sort_keys
+        self.segments = [self._segment(df)]
+
+    def _segment(self, df):
+        """(index, keys, alive mask or None when every row is live, live row count) of a new segment"""
+        keys = pd.MultiIndex.from_frame(df[self.keys]) if self.keys else None
+        return FilterIndex(df), keys, None, len(df)
+
+    @staticmethod
+    def _live_frame(segment):
+        index, _, alive, _ = segment
+        return index.df if alive is None else index.df.iloc[_unpacked_rows(alive, index.n_rows)]
+
+    def _matches(self, df):
+        """Per segment, the positions of its live rows sharing a key with df"""
+        batch_keys = pd.MultiIndex.from_frame(df[self.keys])
+        for i, (_, keys, alive, _) in enumerate(self.segments):
+            positions = keys.get_indexer(batch_keys)
+            positions = positions[positions >= 0]
+            if alive is not None and len(positions):
+                positions = positions[(alive[positions >> 3] & (0x80 >> (positions & 7))) != 0]
+            if len(positions):
+                yield i, positions
+
+    def lookup(self, df):
+        """Current rows for the keys of df"""
+        parts = [self.segments[i][0].df.iloc[positions] for i, positions in self._matches(df)]
+        if not parts:
+            return df.iloc[:0]
+        return pd.concat([recode_categories(part, self.dictionary) for part in parts], ignore_index=True)
+
+    def append(self, df, dictionary):
+        """Add a batch coded against dictionary, an extension of the current one"""
+        self.dictionary = dictionary
+        if not len(df):
+            return
+        if self.keys:
+            for i, positions in list(self._matches(df)):
+                index, keys, alive, n_live = self.segments[i]
+                # Copy on write: snapshots taken earlier keep their own alive masks
+                alive = np.packbits(np.ones(index.n_rows, dtype=bool)) if alive is None else alive.copy()
+                np.bitwise_and.at(alive, positions >> 3, ~(0x80 >> (positions & 7)).astype(np.uint8))
+                self.segments[i] = (index, keys, alive, n_live - len(positions))
+        self.segments.append(self._segment(df))
+
+        while len(self.segments) > 1 and self.segments[-2][3] <= 2 * self.segments[-1][3]:
+            last = self.segments.pop()
+            previous = self.segments.pop()
+            merged = pd.concat([recode_categories(self._live_frame(segment), dictionary) for segment in (previous, last)],
+                               ignore_index=True)
+            if self.sort_keys:
+                merged = merged.sort_values(self.sort_keys, kind='stable', ignore_index=True)
+            self.segments.append(self._segment(merged))
+
+    def snapshot(self):
+        """Immutable SegmentedIndex of the current rows"""
+        return SegmentedIndex(tuple(self.segments), self.dictionary, self.sort_keys)
@@ -0,0 +1,213 @@
+import pandas as pd
+import numpy as np
+from statistics import NormalDist
+
+from rolling_windows import RollingWindows
+
+DEFAULT_HORIZON = 6
+DEFAULT_INTERVAL = 0.95
+
+# Months of history needed before month-of-year effects are fitted
+MIN_SEASONAL_MONTHS = 24
+
+# Holt-Winters smoothing parameters tried per series (level, trend, season) and the trend damping
+SMOOTHING_GRID = [(alpha, beta, gamma) for alpha in (0.2, 0.5, 0.8) for beta in (0.01, 0.1) for gamma in (0.05, 0.2)]
+TREND_DAMPING = 0.9
+
+def seasonal_design(periods, seasonal=True, center=0.0):
+    """Regression design for months since year 0: intercept, linear trend and month-of-year dummies
+
+    January is the baseline month, so there are 11 dummy columns when seasonal.
+    """
+    periods = np.asarray(periods, dtype=np.int64)
+    columns = [np.ones(len(periods)), (periods - center).astype(np.float64)]
+    if seasonal:
+        month = periods % 12
+        columns += [(month == m).astype(np.float64) for m in range(1, 12)]
+    return np.column_stack(columns)
+
+def _interval_z(interval):
+    """Standard normal quantile for a two-sided interval"""
+    return NormalDist().inv_cdf(0.5 + interval / 2)
+
+class SeasonalTrendModel:
+    """Least-squares trend plus month-of-year model fitted to many monthly series at once
+
+    Every series shares the same months, so the design matrix is shared and a
+    single lstsq call with one right-hand side per series fits them all. The
+    prediction variance factor x (X'X)^-1 x' is shared too; only the residual
+    scale differs per series. Short histories fall back to a linear trend, and
+    histories of one or two months to their mean.
+    """
+
+    def __init__(self, first_period, values):
+        self.first_period = int(first_period)
+        values = np.asarray(values, dtype=np.float64)
+        self.n_series, self.n_months = values.shape
+        periods = self.first_period + np.arange(self.n_months)
+        self.center = periods.mean() if self.n_months else 0.0
+        self.seasonal = self.n_months >= MIN_SEASONAL_MONTHS
+
+        if self.n_months >= 3:
+            design = seasonal_design(periods, self.seasonal, self.center)
+        else:
+            design = np.ones((self.n_months, 1))
+        self.n_params = design.shape[1]
+        self.coef, _, rank, _ = np.linalg.lstsq(design, values.T, rcond=None)
+        residuals = values.T - design @ self.coef
+        dof = max(self.n_months - rank, 1)
+        self.sigma = np.sqrt((residuals ** 2).sum(axis=0) / dof)
+        self.design_inverse = np.linalg.pinv(design.T @ design)
+
+    @classmethod
+    def from_windows(cls, windows, measure):
+        """Model over every series of a RollingWindows for one measure"""
+        return cls(windows.first_period, windows.values(measure))
+
+    def _future_design(self, horizon):
+        periods = self.first_period + self.n_months + np.arange(horizon)
+        if self.n_params == 1:
+            return periods, np.ones((horizon, 1))
+        return periods, seasonal_design(periods, self.seasonal, self.center)
+
+    def predict(self, horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL):
+        """Point forecasts and interval bounds as three series x horizon arrays, plus the forecast periods"""
+        periods, design = self._future_design(horizon)
+        forecast = (design @ self.coef).T
+        # Prediction variance: residual noise plus the uncertainty of the fitted coefficients
+        leverage = np.einsum('ij,jk,ik->i', design, self.design_inverse, design)
+        spread = _interval_z(interval) * self.sigma[:, None] * np.sqrt(1 + leverage)[None, :]
+        return periods, forecast, forecast - spread, forecast + spread
+
+    def predict_total(self, horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL):
+        """Forecast total over the next horizon months per series, with interval bounds"""
+        _, design = self._future_design(horizon)
+        total_design = design.sum(axis=0)
+        total = total_design @ self.coef
+        # Independent noise per month plus the shared coefficient uncertainty of the summed design
+        variance_factor = horizon + total_design @ self.design_inverse @ total_design
+        spread = _interval_z(interval) * self.sigma * np.sqrt(variance_factor)
+        return total, total - spread, total + spread
+
+class HoltWintersModel:
+    """Additive damped-trend Holt-Winters smoothing run over many monthly series at once
+
+    The recursion steps through the months once, updating every series and
+    every candidate smoothing setting of SMOOTHING_GRID together as arrays;
+    each series then keeps the setting with the lowest one-step squared error.
+    Unlike a global regression it follows shifts in level. Histories shorter
+    than MIN_SEASONAL_MONTHS are smoothed without the seasonal component.
+    """
+
+    def __init__(self, first_period, values):
+        self.first_period = int(first_period)
+        values = np.asarray(values, dtype=np.float64)
+        self.n_series, self.n_months = values.shape
+        self.seasonal = self.n_months >= MIN_SEASONAL_MONTHS
+        grid = np.array(SMOOTHING_GRID)
+        alpha, beta, gamma = (grid[:, i, None] for i in range(3))
+        if not self.seasonal:
+            gamma = np.zeros_like(gamma)
+        phi = TREND_DAMPING
+
+        # Seasonal effects are indexed by calendar month so forecasts line up with the calendar;
+        # month-major layouts keep every step of the recursion on contiguous memory
+        season = np.zeros((12, len(grid), self.n_series))
+        if self.seasonal:
+            first_year = values[:, :12].mean(axis=1)
+            level = np.broadcast_to(first_year, (len(grid), self.n_series)).copy()
+            trend = np.broadcast_to((values[:, 12:24].mean(axis=1) - first_year) / 12, level.shape).copy()
+            months = (self.first_period + np.arange(12)) % 12
+            season[months] = (values[:, :12] - first_year[:, None]).T[:, None, :]
+            start = 12
+        else:
+            level = np.broadcast_to(values[:, 0], (len(grid), self.n_series)).copy()
+            trend = np.zeros_like(level)
+            start = 1
+        if self.n_months < 2:
+            start = self.n_months
+
+        by_month = np.ascontiguousarray(values.T)
+        sse = np.zeros_like(level)
+        error = np.empty_like(level)
+        step = np.empty_like(level)
+        for t in range(start, self.n_months):
+            month = (self.first_period + t) % 12
+            # error = y - (level + phi * trend + season), computed in place
+            np.multiply(trend, phi, out=trend)
+            np.add(level, trend, out=level)
+            np.subtract(by_month[t], level, out=error)
+            error -= season[month]
+            np.multiply(error, error, out=step)
+            sse += step
+            level += np.multiply(alpha, error, out=step)
+            trend += np.multiply(alpha * beta, error, out=step)
+            season[month] += np.multiply(gamma, error, out=step)
+
+        best = sse.argmin(axis=0)
+        series = np.arange(self.n_series)
+        self.alpha, self.beta, self.gamma = alpha[best, 0], beta[best, 0], gamma[best, 0]
+        self.level, self.trend = level[best, series], trend[best, series]
+        self.season = season[:, best, series].T
+        dof = max(self.n_months - start, 1)
+        self.sigma = np.sqrt(sse[best, series] / dof)
+
+    @classmethod
+    def from_windows(cls, windows, measure):
+        """Model over every series of a RollingWindows for one measure"""
+        return cls(windows.first_period, windows.values(measure))
+
+    def _error_weights(self, horizon):
+        """Weight c_j of the one-step error j months back in the forecast error, series x horizon - 1"""
+        steps = np.arange(1, horizon)
+        damped = np.cumsum(TREND_DAMPING ** steps)
+        return (self.alpha[:, None] * (1 + self.beta[:, None] * damped[None, :])
+                + self.gamma[:, None] * (steps % 12 == 0)[None, :])
+
+    def predict(self, horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL):
+        """Point forecasts and interval bounds as three series x horizon arrays, plus the forecast periods"""
+        periods = self.first_period + self.n_months + np.arange(horizon)
+        damped = np.cumsum(TREND_DAMPING ** np.arange(1, horizon + 1))
+        forecast = self.level[:, None] + self.trend[:, None] * damped[None, :] + self.season[:, periods % 12]
+        weights = np.concatenate([np.zeros((self.n_series, 1)), self._error_weights(horizon) ** 2], axis=1)
+        spread = _interval_z(interval) * self.sigma[:, None] * np.sqrt(1 + np.cumsum(weights, axis=1))
+        return periods, forecast, forecast - spread, forecast + spread
+
+    def predict_total(self, horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL):
+        """Forecast total over the next horizon months per series, with interval bounds"""
+        _, forecast, _, _ = self.predict(horizon, interval)
+        total = forecast.sum(axis=1)
+        # The k-th future error feeds every later month of the horizon
+        carried = np.concatenate([np.zeros((self.n_series, 1)), np.cumsum(self._error_weights(horizon), axis=1)], axis=1)
+        spread = _interval_z(interval) * self.sigma * np.sqrt(((1 + carried) ** 2).sum(axis=1))
+        return total, total - spread, total + spread
+
+MODELS = {'holt_winters': HoltWintersModel, 'seasonal_trend': SeasonalTrendModel}
+DEFAULT_MODEL = 'holt_winters'
+
+def forecast_windows(windows, measure, horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL, model=DEFAULT_MODEL):
+    """Long table of forecasts (series, date, forecast, lower, upper) for every series of a RollingWindows"""
+    if windows.n_months == 0 or len(windows.keys) == 0:
+        return pd.DataFrame(columns=['series', 'date', 'forecast', 'lower', 'upper'])
+    periods, forecast, lower, upper = MODELS[model].from_windows(windows, measure).predict(horizon, interval)
+    dates = pd.to_datetime(pd.DataFrame({'year': periods // 12, 'month': periods % 12 + 1, 'day': 1}))
+    return pd.DataFrame({
+        'series': np.repeat(windows.keys.to_numpy(), horizon),
+        'date': np.tile(dates.to_numpy(), len(windows.keys)),
+        'forecast': forecast.ravel(),
+        'lower': lower.ravel(),
+        'upper': upper.ravel(),
+    })
+
+def forecast_frame(df, by=None, measure='net_change', horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL,
+                   model=DEFAULT_MODEL):
+    """Forecasts of a fused or cube frame's monthly totals, per `by` column or overall"""
+    return forecast_windows(RollingWindows.from_frame(df, by), measure, horizon, interval, model)
+
+def forecast_totals(windows, measure, horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL, model=DEFAULT_MODEL):
+    """Forecast total over the horizon per series of a RollingWindows, highest forecast first"""
+    if windows.n_months == 0 or len(windows.keys) == 0:
+        return pd.DataFrame(columns=['forecast', 'lower', 'upper'])
+    total, lower, upper = MODELS[model].from_windows(windows, measure).predict_total(horizon, interval)
+    totals = pd.DataFrame({'forecast': total, 'lower': lower, 'upper': upper}, index=windows.keys)
+    return totals.sort_values('forecast', ascending=False)
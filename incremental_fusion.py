@@ -0,0 +1,89 @@
+import pandas as pd
+import numpy as np
+
+from data_fusion import FUSION_KEYS, aggregate_monthly
+
+class IncrementalFusion:
+    """Fused monthly table kept consistent with fuse_employment_data as new events arrive
+
+    The per-side monthly aggregates are kept alongside the fused table so a
+    batch only touches its own (company, year, month) cells, including which
+    side supplies the cell's industry and location.
+    """
+
+    def __init__(self, layoffs_df, hiring_df):
+        # Running totals are int64 so narrow compact counts cannot overflow or reject wider batches
+        self.layoffs_monthly = aggregate_monthly(layoffs_df, 'layoffs').astype({'layoffs': np.int64}).set_index(FUSION_KEYS)
+        self.hiring_monthly = aggregate_monthly(hiring_df, 'hires').astype({'hires': np.int64}).set_index(FUSION_KEYS)
+        self.table = self._fuse_cells(self.layoffs_monthly.index.union(self.hiring_monthly.index))
+        self.version = 0
+
+    @staticmethod
+    def _merge_side(side, batch_df, value_col):
+        """Add a batch into one side's monthly aggregate; returns the side and touched keys"""
+        batch = aggregate_monthly(batch_df, value_col).astype({value_col: np.int64}).set_index(FUSION_KEYS)
+        existing = batch.index.isin(side.index)
+
+        # Existing cells keep their first-seen industry/location, as a full regroup would;
+        # like 'first', a missing one is taken from the batch
+        keys = batch.index[existing]
+        side.loc[keys, value_col] += batch.loc[existing, value_col].to_numpy()
+        for col in ('industry', 'location'):
+            stored = side.loc[keys, col]
+            fill = batch.loc[existing, col].where(stored.isna().to_numpy())
+            if fill.notna().any():
+                if isinstance(side[col].dtype, pd.CategoricalDtype):
+                    new_values = fill.dropna().unique()
+                    side[col] = side[col].cat.add_categories(
+                        [value for value in new_values if value not in side[col].cat.categories])
+                side.loc[keys, col] = stored.fillna(pd.Series(fill.to_numpy(), index=keys))
+        side = pd.concat([side, batch[~existing]])
+
+        return side, batch.index
+
+    def _fuse_cells(self, keys):
+        """Fused rows for the given keys, computed from the per-side aggregates"""
+        layoffs = self.layoffs_monthly.reindex(keys)
+        hires = self.hiring_monthly.reindex(keys)
+
+        cells = pd.DataFrame(index=keys)
+        cells['layoffs'] = layoffs['layoffs'].fillna(0).astype(np.float64)
+        cells['hires'] = hires['hires'].fillna(0).astype(np.float64)
+        cells['industry'] = layoffs['industry'].fillna(hires['industry'])
+        cells['location'] = layoffs['location'].fillna(hires['location'])
+        cells['net_change'] = cells['hires'] - cells['layoffs']
+        cells['employment_ratio'] = cells['hires'] / (cells['layoffs'] + 1)  # +1 to avoid division by zero
+        cells['date'] = pd.to_datetime(pd.DataFrame({
+            'year': keys.get_level_values('year'),
+            'month': keys.get_level_values('month'),
+            'day': 1
+        })).to_numpy()
+
+        return cells
+
+    def append(self, new_layoffs=None, new_hiring=None):
+        """Fold a batch of new events into the fused table; returns the updated cells"""
+        touched = []
+        if new_layoffs is not None and len(new_layoffs):
+            self.layoffs_monthly, keys = self._merge_side(self.layoffs_monthly, new_layoffs, 'layoffs')
+            touched.append(keys)
+        if new_hiring is not None and len(new_hiring):
+            self.hiring_monthly, keys = self._merge_side(self.hiring_monthly, new_hiring, 'hires')
+            touched.append(keys)
+        if not touched:
+            return self.table.iloc[:0].reset_index()
+
+        affected = touched[0] if len(touched) == 1 else touched[0].union(touched[1])
+        cells = self._fuse_cells(affected)
+
+        existing = cells.index.isin(self.table.index)
+        self.table.loc[cells.index[existing]] = cells[existing]
+        self.table = pd.concat([self.table, cells[~existing]])
+        self.version += 1
+
+        return cells.reset_index()
+
+    @property
+    def fused_df(self):
+        """The fused table in fuse_employment_data's row and column order"""
+        return self.table.sort_index().reset_index()
@@ -0,0 +1,238 @@
+"""Asyncio ingestion server for layoff and hiring events
+
+Producers connect over a local TCP port or Unix socket and send one JSON event
+per line, in the event log format ({"type": "layoffs", "date": ..., "company":
+..., "layoffs": 120, "industry": ..., "location": ...}). Valid events go into a
+bounded queue; when it is full the server stops reading from producers, so TCP
+flow control pushes back on them. A writer drains the queue in batches into an
+event log (which a live dashboard tails) or into Parquet part files.
+
+Usage:
+    python ingest_server.py --socket /tmp/ingest.sock --sink log:events.jsonl
+    python ingest_server.py --port 8765 --sink parquet:ingested/
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from datetime import datetime
+
+from data_generator import EVENT_TYPES
+from data_sources import event_columns
+from event_stream import append_events, records_to_frames
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 100_000
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_FLUSH_SECONDS = 1.0
+
+# A line with this type is answered with the server metrics instead of being ingested
+METRICS_REQUEST = 'metrics'
+
+def validate_record(record):
+    """Reason a decoded event does not match the event schema, or None when it does"""
+    if not isinstance(record, dict):
+        return "event must be a JSON object"
+    value_col = record.get('type')
+    if value_col not in EVENT_TYPES:
+        return f"type must be one of {', '.join(EVENT_TYPES)}"
+    missing = [col for col in event_columns(value_col) if record.get(col) in (None, '')]
+    if missing:
+        return f"missing fields: {', '.join(missing)}"
+    count = record[value_col]
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        return f"{value_col} must be a non-negative integer"
+    try:
+        datetime.fromisoformat(str(record['date']))
+    except ValueError:
+        return "date must be ISO 8601"
+    return None
+
+class EventLogSink:
+    """Appends batches to the JSONL event log tailed by the live dashboard"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, records):
+        append_events(self.path, records)
+
+class ParquetSink:
+    """Writes each batch as Parquet part files per event type, readable by data_sources.ParquetSource"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.sequence = 0
+        self.started = int(time.time())
+        for value_col in EVENT_TYPES:
+            os.makedirs(os.path.join(out_dir, value_col), exist_ok=True)
+
+    def write(self, records):
+        for value_col, df in zip(EVENT_TYPES, records_to_frames(records)):
+            if df.empty:
+                continue
+            name = f"part-ingest-{self.started}-{self.sequence:06d}.parquet"
+            # Dot-prefixed files are ignored by dataset discovery until renamed into place
+            tmp_path = os.path.join(self.out_dir, value_col, '.' + name)
+            df.to_parquet(tmp_path, index=False)
+            os.rename(tmp_path, os.path.join(self.out_dir, value_col, name))
+        self.sequence += 1
+
+def open_sink(spec):
+    """Sink for a 'log:<path>' or 'parquet:<dir>' specification"""
+    kind, _, target = spec.partition(':')
+    if kind == 'log' and target:
+        return EventLogSink(target)
+    if kind == 'parquet' and target:
+        return ParquetSink(target)
+    raise ValueError(f"unsupported sink: {spec}")
+
+class IngestServer:
+    """Accepts JSON-lines events from local producers and writes them to a sink in batches"""
+
+    def __init__(self, sink, queue_size=DEFAULT_QUEUE_SIZE, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_seconds=DEFAULT_FLUSH_SECONDS):
+        self.sink = sink
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.started = time.monotonic()
+        self.received = 0
+        self.rejected = 0
+        self.written = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.connections = 0
+        self.last_write_rate = 0.0
+
+    def metrics(self):
+        """Ingest counters, throughput and queue depth"""
+        elapsed = time.monotonic() - self.started
+        return {
+            'received': self.received,
+            'rejected': self.rejected,
+            'written': self.written,
+            'batches': self.batches,
+            'queue_depth': self.queue.qsize(),
+            'max_queue_depth': self.max_queue_depth,
+            'queue_capacity': self.queue.maxsize,
+            'connections': self.connections,
+            'events_per_s': self.written / elapsed if elapsed > 0 else 0.0,
+            'last_batch_events_per_s': self.last_write_rate,
+        }
+
+    async def handle(self, reader, writer):
+        """Read one producer's events; awaiting a full queue stops reading and applies backpressure"""
+        self.connections += 1
+        line_number = 0
+        try:
+            while line := await reader.readline():
+                line_number += 1
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record, error = None, "invalid JSON"
+                else:
+                    if isinstance(record, dict) and record.get('type') == METRICS_REQUEST:
+                        writer.write((json.dumps(self.metrics()) + '\n').encode())
+                        await writer.drain()
+                        continue
+                    error = validate_record(record)
+
+                self.received += 1
+                if error is not None:
+                    self.rejected += 1
+                    writer.write((json.dumps({'error': error, 'line': line_number}) + '\n').encode())
+                    await writer.drain()
+                    continue
+
+                await self.queue.put(record)
+                self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _next_batch(self):
+        """Wait for one event, then take more until the batch is full or the flush interval passes"""
+        batch = [await self.queue.get()]
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            if self.queue.empty():
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self.queue.get_nowait())
+        return batch
+
+    async def write_batches(self):
+        """Drain the queue into the sink; writes run in a thread so producers keep being served"""
+        while True:
+            batch = await self._next_batch()
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(self.sink.write, batch)
+            except Exception:
+                logger.exception("failed to write a batch of %d events", len(batch))
+            else:
+                self.written += len(batch)
+                self.batches += 1
+                elapsed = time.perf_counter() - start
+                self.last_write_rate = len(batch) / elapsed if elapsed > 0 else float('inf')
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def report(self, interval):
+        """Log the metrics periodically"""
+        while True:
+            await asyncio.sleep(interval)
+            logger.info("ingest %s", json.dumps(self.metrics()))
+
+    async def serve(self, port=None, socket_path=None, host='127.0.0.1', report_seconds=10.0):
+        """Listen on a Unix socket or a local TCP port until cancelled"""
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = await asyncio.start_unix_server(self.handle, path=socket_path)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port)
+        tasks = [asyncio.create_task(self.write_batches()), asyncio.create_task(self.report(report_seconds))]
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Flush what producers already handed over before shutting down
+            await self.queue.join()
+            for task in tasks:
+                task.cancel()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--socket', help='Unix socket path to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='local TCP port when no socket is given')
+    parser.add_argument('--sink', default='log:events.jsonl', help="'log:<path>' or 'parquet:<dir>'")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--flush-seconds', type=float, default=DEFAULT_FLUSH_SECONDS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    server = IngestServer(open_sink(args.sink), args.queue_size, args.batch_size, args.flush_seconds)
+    try:
+        asyncio.run(server.serve(port=args.port, socket_path=args.socket))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+if __name__ == '__main__':
+    main()
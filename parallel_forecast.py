@@ -0,0 +1,115 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+
+from rolling_windows import month_period
+from forecasting import MODELS, DEFAULT_MODEL, DEFAULT_HORIZON, DEFAULT_INTERVAL
+
+# Columns that identify one forecast series in the fused table
+SERIES_KEYS = ['company', 'industry', 'location']
+
+# Shards per worker, so a slow shard does not leave the other workers idle
+SHARDS_PER_WORKER = 4
+
+# Fewer series per worker than this forecast faster in-process than the pool starts up
+MIN_SERIES_PER_WORKER = 5_000
+
+# Most series fitted in one piece, so the smoothing state of a piece stays in cache
+PIECE_SERIES = 5_000
+
+def series_matrix(fused_df, measure='net_change', keys=SERIES_KEYS):
+    """Monthly totals per series as (key frame, first period, series x months float64 array)"""
+    # Missing keys (a company-month with no industry or location) form their own series
+    grouped = fused_df.groupby(keys, observed=True, sort=True, dropna=False)
+    codes = grouped.ngroup().to_numpy()
+    key_frame = grouped.size().index.to_frame(index=False)
+    periods = month_period(fused_df['year'].to_numpy(), fused_df['month'].to_numpy())
+    if len(periods) == 0:
+        return key_frame, 0, np.zeros((0, 0))
+
+    first_period = int(periods.min())
+    n_months = int(periods.max()) - first_period + 1
+    cells = codes.astype(np.int64) * n_months + (periods - first_period)
+    values = np.bincount(cells, weights=fused_df[measure].to_numpy(np.float64),
+                         minlength=len(key_frame) * n_months).reshape(len(key_frame), n_months)
+    return key_frame, first_period, values
+
+def _attach(name):
+    """Attach to a shared memory block created by the parent process"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Pool workers report to the parent's resource tracker, which already holds the block
+    return shared_memory.SharedMemory(name=name)
+
+def _forecast_shard(task):
+    """Forecast rows start:stop of the shared input matrix into the shared output block"""
+    (values_name, values_shape, out_name, start, stop, first_period, horizon, interval, model) = task
+    values_block, out_block = _attach(values_name), _attach(out_name)
+    try:
+        values = np.ndarray(values_shape, dtype=np.float64, buffer=values_block.buf)
+        out = np.ndarray((3, values_shape[0], horizon), dtype=np.float64, buffer=out_block.buf)
+        _, forecast, lower, upper = MODELS[model](first_period, values[start:stop]).predict(horizon, interval)
+        out[0, start:stop], out[1, start:stop], out[2, start:stop] = forecast, lower, upper
+        # Views into a block must be gone before it can close
+        del values, out
+    finally:
+        values_block.close()
+        out_block.close()
+    return stop - start
+
+def shard_bounds(n_series, n_shards):
+    """Contiguous (start, stop) row ranges splitting n_series into n_shards near-equal shards"""
+    edges = np.linspace(0, n_series, max(min(n_shards, n_series), 1) + 1).round().astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+def forecast_parallel(fused_df, measure='net_change', horizon=DEFAULT_HORIZON, interval=DEFAULT_INTERVAL,
+                      model=DEFAULT_MODEL, keys=SERIES_KEYS, workers=None,
+                      min_series_per_worker=MIN_SERIES_PER_WORKER):
+    """Forecast every (company, industry, location) series of a fused table across a process pool
+
+    The monthly series matrix and the forecast output live in shared memory
+    blocks; workers receive only block names and row ranges, and write their
+    shard's forecasts in place, so no frames or arrays are pickled. Each series
+    is fitted independently, so results do not depend on the number of workers.
+    Small inputs (under min_series_per_worker series per worker) use fewer
+    workers, down to forecasting in-process.
+    Returns a long columnar table with the key columns as categoricals and
+    float32 date-aligned forecast, lower and upper columns.
+    """
+    key_frame, first_period, values = series_matrix(fused_df, measure, keys)
+    n_series = len(key_frame)
+    out = np.zeros((3, n_series, horizon))
+    workers = max(min(workers or os.cpu_count() or 1, -(-n_series // min_series_per_worker)), 1)
+
+    if n_series and workers == 1:
+        for start, stop in shard_bounds(n_series, -(-n_series // PIECE_SERIES)):
+            _, out[0, start:stop], out[1, start:stop], out[2, start:stop] = MODELS[model](
+                first_period, values[start:stop]).predict(horizon, interval)
+    elif n_series:
+        values_block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        out_block = shared_memory.SharedMemory(create=True, size=out.nbytes)
+        try:
+            np.ndarray(values.shape, dtype=np.float64, buffer=values_block.buf)[:] = values
+            tasks = [(values_block.name, values.shape, out_block.name, start, stop,
+                      first_period, horizon, interval, model)
+                     for start, stop in shard_bounds(n_series, max(workers * SHARDS_PER_WORKER,
+                                                                   -(-n_series // PIECE_SERIES)))]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_forecast_shard, tasks))
+            out[:] = np.ndarray(out.shape, dtype=np.float64, buffer=out_block.buf)
+        finally:
+            for block in (values_block, out_block):
+                block.close()
+                block.unlink()
+
+    periods = first_period + values.shape[1] + np.arange(horizon if n_series else 0)
+    dates = pd.to_datetime(pd.DataFrame({'year': periods // 12, 'month': periods % 12 + 1, 'day': 1}))
+    rows = np.repeat(np.arange(n_series), horizon)
+    result = {col: pd.Categorical(key_frame[col]).take(rows) for col in keys}
+    result['date'] = np.tile(dates.to_numpy(), n_series)
+    for i, name in enumerate(['forecast', 'lower', 'upper']):
+        result[name] = out[i].ravel().astype(np.float32)
+    return pd.DataFrame(result)
@@ -0,0 +1,84 @@
+import os
+import glob
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from concurrent.futures import ProcessPoolExecutor
+
+from data_generator import EVENT_TYPES, count_chunks, generate_chunk, generate_events
+
+MANIFEST_FILE = 'manifest.json'
+
+def _partition_path(out_dir, value_col, chunk_index):
+    """Path of the Parquet part file holding one chunk"""
+    return os.path.join(out_dir, value_col, f"part-{chunk_index:05d}.parquet")
+
+def partition_schema(value_col):
+    """(column, Arrow type) pairs of one event type's part files"""
+    schema = pa.Schema.from_pandas(generate_events(value_col, 1, rng=np.random.default_rng(0)), preserve_index=False)
+    return [[field.name, str(field.type)] for field in schema]
+
+def _write_chunk(task):
+    """Generate one chunk in a worker process and write it as its own part file"""
+    out_dir, value_col, chunk_index, n_events, chunk_size, seed, options = task
+    frame = generate_chunk(value_col, chunk_index, n_events, chunk_size, seed, **options)
+    path = _partition_path(out_dir, value_col, chunk_index)
+    frame.to_parquet(path, index=False)
+    return path
+
+def generate_parallel(out_dir, n_layoffs, n_hiring, seed=None, chunk_size=1_000_000, workers=None, **options):
+    """Generate partitioned layoffs/hiring Parquet output across a process pool
+
+    Chunks are cut by event count with a fixed chunk_size and seeded from
+    (seed, event type, chunk index), so the written files are byte-identical
+    for a given seed no matter how many workers produced them.
+    """
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    tasks = []
+    counts = {'layoffs': n_layoffs, 'hires': n_hiring}
+    for value_col in EVENT_TYPES:
+        partition_dir = os.path.join(out_dir, value_col)
+        os.makedirs(partition_dir, exist_ok=True)
+        # Drop parts left over from an earlier, larger run
+        for stale in glob.glob(os.path.join(partition_dir, 'part-*.parquet')):
+            os.remove(stale)
+        for chunk_index in range(count_chunks(counts[value_col], chunk_size)):
+            tasks.append((out_dir, value_col, chunk_index, counts[value_col], chunk_size, seed, options))
+
+    if workers == 1:
+        paths = [_write_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            paths = list(pool.map(_write_chunk, tasks))
+
+    manifest = {
+        'seed': seed,
+        'chunk_size': chunk_size,
+        'counts': counts,
+        # Lets an event type without parts still be read back with its columns
+        'schemas': {value_col: partition_schema(value_col) for value_col in EVENT_TYPES},
+        'parts': {value_col: [os.path.relpath(path, out_dir)
+                              for task, path in zip(tasks, paths) if task[1] == value_col]
+                  for value_col in EVENT_TYPES},
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+def read_partitions(out_dir, value_col, columns=None):
+    """Read the part files of one event type back into a single DataFrame"""
+    with open(os.path.join(out_dir, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    parts = [pd.read_parquet(os.path.join(out_dir, path), columns=columns)
+             for path in manifest['parts'][value_col]]
+    if not parts:
+        # Manifests written before schemas were recorded fall back to the generator's schema
+        fields = manifest.get('schemas', {}).get(value_col) or partition_schema(value_col)
+        schema = pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in fields])
+        empty = schema.empty_table().to_pandas()
+        return empty[columns] if columns is not None else empty
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,173 @@
+import pandas as pd
+import numpy as np
+
+from data_fusion import column_codes
+
+# Measures kept per series and the window lengths the dashboard reports
+WINDOW_MEASURES = ['layoffs', 'hires', 'net_change']
+WINDOW_LENGTHS = (3, 6, 12)
+
+TOTAL_KEY = 'All'
+
+def month_period(year, month):
+    """Months since year 0, so consecutive months are consecutive integers"""
+    return np.asarray(year, dtype=np.int64) * 12 + np.asarray(month, dtype=np.int64) - 1
+
+class RollingWindows:
+    """Monthly series per key with prefix sums of values and squares
+
+    Column t + 1 of each prefix array holds the total of months 0..t, so the
+    sum, mean and standard deviation of any window of months comes from two
+    lookups per series. Prefix sums are exact int64. Adding a new month, or
+    more events to the latest month, costs O(1) per series; back-dated events
+    shift the later prefixes and cost O(months after them).
+    """
+
+    def __init__(self, keys, first_period, totals):
+        self.keys = pd.Index(keys)
+        self.first_period = int(first_period)
+        self.n_months = next(iter(totals.values())).shape[1]
+        capacity = max(self.n_months, 1) * 2
+        self.sums = {}
+        self.squares = {}
+        for measure in WINDOW_MEASURES:
+            values = np.asarray(totals[measure], dtype=np.int64)
+            self.sums[measure] = np.zeros((len(self.keys), capacity + 1), dtype=np.int64)
+            self.squares[measure] = np.zeros((len(self.keys), capacity + 1), dtype=np.int64)
+            np.cumsum(values, axis=1, out=self.sums[measure][:, 1:self.n_months + 1])
+            np.cumsum(values * values, axis=1, out=self.squares[measure][:, 1:self.n_months + 1])
+
+    @classmethod
+    def from_frame(cls, df, by=None):
+        """Windows over the monthly totals of a cube or fused frame, per `by` column or overall"""
+        periods = month_period(df['year'].to_numpy(), df['month'].to_numpy())
+        if by is None:
+            codes, keys = np.zeros(len(df), dtype=np.int64), pd.Index([TOTAL_KEY])
+        else:
+            codes, keys = column_codes(df[by])
+            valid = codes >= 0
+            codes, periods, df = codes[valid], periods[valid], df[valid]
+
+        if len(periods) == 0:
+            return cls(keys, 0, {measure: np.zeros((len(keys), 0), dtype=np.int64) for measure in WINDOW_MEASURES})
+
+        first_period = periods.min()
+        n_months = int(periods.max() - first_period + 1)
+        cells = codes.astype(np.int64) * n_months + (periods - first_period)
+        totals = {
+            measure: np.bincount(cells, weights=df[measure].to_numpy(np.float64),
+                                 minlength=len(keys) * n_months).round().astype(np.int64).reshape(len(keys), n_months)
+            for measure in WINDOW_MEASURES
+        }
+        return cls(keys, first_period, totals)
+
+    def periods(self):
+        """Month start dates of the series, oldest first"""
+        months = np.arange(self.first_period, self.first_period + self.n_months)
+        return pd.to_datetime(pd.DataFrame({'year': months // 12, 'month': months % 12 + 1, 'day': 1}))
+
+    def memory_usage(self, deep=True):
+        """Bytes held by the prefix arrays and keys, for cache size accounting"""
+        arrays = list(self.sums.values()) + list(self.squares.values())
+        return sum(prefix.nbytes for prefix in arrays) + int(self.keys.memory_usage(deep=deep))
+
+    def _grow(self, n_months):
+        """Make room for n_months, doubling capacity so appends stay amortized O(1)"""
+        capacity = self.sums[WINDOW_MEASURES[0]].shape[1] - 1
+        if n_months <= capacity:
+            return
+        capacity = max(n_months, capacity * 2)
+        for prefixes in (self.sums, self.squares):
+            for measure, prefix in prefixes.items():
+                grown = np.zeros((prefix.shape[0], capacity + 1), dtype=np.int64)
+                grown[:, :self.n_months + 1] = prefix[:, :self.n_months + 1]
+                prefixes[measure] = grown
+
+    def _series_positions(self, keys):
+        """Row of each key, adding rows for keys not seen before"""
+        keys = pd.Index(keys)
+        new_keys = keys.difference(self.keys)
+        if len(new_keys):
+            self.keys = self.keys.append(new_keys)
+            for prefixes in (self.sums, self.squares):
+                for measure, prefix in prefixes.items():
+                    prefixes[measure] = np.vstack([prefix, np.zeros((len(new_keys), prefix.shape[1]), dtype=np.int64)])
+        return self.keys.get_indexer(keys)
+
+    def add(self, key, year, month, **values):
+        """Add event totals to one series and month, e.g. add('Meta', 2024, 6, layoffs=120)"""
+        period = int(month_period(year, month))
+        if self.n_months == 0:
+            self.first_period = period
+        t = period - self.first_period
+        if t < 0:
+            raise ValueError(f"{year}-{month:02d} is before the first month of the series")
+        try:
+            row = self.keys.get_loc(key)
+        except KeyError:
+            row = self._series_positions([key])[0]
+
+        if t >= self.n_months:
+            # Months without events between the old end and t carry the running totals forward
+            self._grow(t + 1)
+            for prefixes in (self.sums, self.squares):
+                for prefix in prefixes.values():
+                    prefix[:, self.n_months + 1:t + 2] = prefix[:, self.n_months:self.n_months + 1]
+            self.n_months = t + 1
+
+        values = dict(values)
+        if 'net_change' not in values:
+            values['net_change'] = values.get('hires', 0) - values.get('layoffs', 0)
+        for measure, value in values.items():
+            sums, squares = self.sums[measure][row], self.squares[measure][row]
+            old = sums[t + 1] - sums[t]
+            new = old + int(value)
+            sums[t + 1:self.n_months + 1] += int(value)
+            squares[t + 1:self.n_months + 1] += new * new - old * old
+
+    def values(self, measure):
+        """Monthly totals as a series x months array"""
+        return np.diff(self.sums[measure][:, :self.n_months + 1], axis=1)
+
+    def window(self, measure, months, end=None):
+        """Sum, mean and sample std per series over `months` months ending at month index end (default latest)
+
+        Months before the start of the series count as zero.
+        """
+        end = self.n_months - 1 if end is None else end
+        start = max(end + 1 - months, 0)
+        sums, squares = self.sums[measure], self.squares[measure]
+        total = sums[:, end + 1] - sums[:, start]
+        total_squares = squares[:, end + 1] - squares[:, start]
+        mean = total / months
+        variance = (total_squares - total * mean) / (months - 1) if months > 1 else np.zeros(len(total))
+        return pd.DataFrame({
+            'sum': total,
+            'mean': mean,
+            'std': np.sqrt(np.maximum(variance, 0)),
+        }, index=self.keys)
+
+    def rolling(self, measure, months, stat='sum'):
+        """Every complete window of `months` months as a periods x series frame, labelled by window end"""
+        n_windows = self.n_months - months + 1
+        if n_windows <= 0:
+            return pd.DataFrame(columns=self.keys, dtype=np.float64)
+        sums = self.sums[measure][:, months:self.n_months + 1] - self.sums[measure][:, :n_windows]
+        if stat == 'sum':
+            result = sums
+        elif stat == 'mean':
+            result = sums / months
+        elif stat == 'std':
+            squares = self.squares[measure][:, months:self.n_months + 1] - self.squares[measure][:, :n_windows]
+            result = np.sqrt(np.maximum((squares - sums * (sums / months)) / (months - 1), 0))
+        else:
+            raise ValueError(f"unknown window statistic: {stat}")
+        return pd.DataFrame(result.T, index=self.periods()[months - 1:].to_numpy(), columns=self.keys)
+
+def complete_lengths(windows, lengths=WINDOW_LENGTHS):
+    """Window lengths with at least one complete window in the series"""
+    return [months for months in lengths if months <= windows.n_months]
+
+def latest_windows(windows, measure, lengths=WINDOW_LENGTHS):
+    """Sum, mean and std of the latest window of each length per series, as one frame with a column level per length"""
+    return pd.concat({f'{months}m': windows.window(measure, months) for months in lengths}, axis=1)
@@ -0,0 +1,147 @@
+import pandas as pd
+import numpy as np
+
+from data_generator import COMPANIES, INDUSTRIES, LOCATIONS, QUARTERS, draw_event_columns
+
+# Categorical columns and the fixed values each dictionary starts from
+CATEGORY_VALUES = {
+    'company': COMPANIES,
+    'industry': INDUSTRIES,
+    'location': LOCATIONS,
+    'quarter': QUARTERS,
+}
+
+# Narrow integer types for the remaining event columns; columns with values
+# out of a type's range keep their original type
+INTEGER_DTYPES = {
+    'year': np.int16,
+    'month': np.int8,
+    'layoffs': np.int32,
+    'hires': np.int32,
+}
+
+def build_dictionary(*frames, values=None):
+    """Build the shared category dictionary, extended with any values seen in frames"""
+    base_values = dict(CATEGORY_VALUES, **(values or {}))
+    dictionary = {}
+    for col, fixed_values in base_values.items():
+        seen = set(fixed_values)
+        for df in frames:
+            if col in df.columns:
+                seen.update(df[col].dropna().unique())
+        dictionary[col] = pd.CategoricalDtype(sorted(seen))
+    return dictionary
+
+DEFAULT_DICTIONARY = build_dictionary()
+
+def extend_dictionary(dictionary, *frames):
+    """Dictionary with values first seen in frames appended to the end of its categories
+
+    Existing categories keep their codes, so frames coded against the old
+    dictionary stay valid; dtypes without new values are returned unchanged.
+    """
+    extended = {}
+    for col, dtype in dictionary.items():
+        seen = set()
+        for df in frames:
+            if col in df.columns:
+                seen.update(df[col].dropna().unique())
+        new_values = sorted(seen.difference(dtype.categories))
+        extended[col] = pd.CategoricalDtype(dtype.categories.append(pd.Index(new_values))) if new_values else dtype
+    return extended
+
+def as_categories(values, dtype):
+    """Column coded against dtype; free when its categories are a prefix of dtype's"""
+    current = values.dtype
+    if current == dtype:
+        return values
+    if isinstance(current, pd.CategoricalDtype) and dtype.categories[:len(current.categories)].equals(current.categories):
+        codes = pd.Categorical.from_codes(values.cat.codes.to_numpy(), dtype=dtype, validate=False)
+        return pd.Series(codes, index=values.index, name=values.name)
+    return values.astype(dtype)
+
+def recode_categories(df, dictionary):
+    """df with only its dictionary columns coded against dictionary"""
+    columns = {col: as_categories(df[col], dtype) for col, dtype in dictionary.items() if col in df.columns}
+    return df.assign(**columns) if columns else df
+
+def narrow_integers(values, dtype):
+    """Integer column cast to dtype, or left as is when any value would not fit"""
+    limits = np.iinfo(dtype)
+    if len(values) and (values.min() < limits.min or values.max() > limits.max):
+        return values
+    return values.astype(dtype)
+
+def compact_frame(df, dictionary=None):
+    """Convert an event (or fused) frame to shared categoricals and narrow integers"""
+    if dictionary is None:
+        dictionary = build_dictionary(df)
+
+    columns = {}
+    for col in df.columns:
+        if col in dictionary:
+            columns[col] = as_categories(df[col], dictionary[col])
+        elif col in INTEGER_DTYPES and pd.api.types.is_integer_dtype(df[col]):
+            columns[col] = narrow_integers(df[col], INTEGER_DTYPES[col])
+        else:
+            columns[col] = df[col]
+    return pd.DataFrame(columns, index=df.index)
+
+def compact_frames(layoffs_df, hiring_df):
+    """Compact both event frames over one dictionary so their category codes match"""
+    dictionary = build_dictionary(layoffs_df, hiring_df)
+    return compact_frame(layoffs_df, dictionary), compact_frame(hiring_df, dictionary)
+
+def _categorical_from_codes(codes, values, dtype):
+    """Re-map generator codes (positions in values) onto the dictionary's categories"""
+    remap = dtype.categories.get_indexer(values)
+    return pd.Categorical.from_codes(remap[codes], dtype=dtype)
+
+def events_to_compact_frame(columns, value_col, dictionary=DEFAULT_DICTIONARY, companies=COMPANIES,
+                            industries=INDUSTRIES, locations=LOCATIONS):
+    """Materialize drawn event columns straight into the compact schema"""
+    month = columns['month'].astype(INTEGER_DTYPES['month'])
+    return pd.DataFrame({
+        'date': columns['date'].astype('datetime64[us]'),
+        'company': _categorical_from_codes(columns['company'], companies, dictionary['company']),
+        value_col: columns[value_col].astype(INTEGER_DTYPES[value_col]),
+        'industry': _categorical_from_codes(columns['industry'], industries, dictionary['industry']),
+        'location': _categorical_from_codes(columns['location'], locations, dictionary['location']),
+        'year': columns['year'].astype(INTEGER_DTYPES['year']),
+        'month': month,
+        'quarter': _categorical_from_codes((month - 1) // 3, QUARTERS, dictionary['quarter']),
+    })
+
+def generate_compact_sample_data(n_layoffs=500, n_hiring=600, seed=None, companies=COMPANIES,
+                                 industries=INDUSTRIES, locations=LOCATIONS):
+    """Generate the sample layoffs and hiring data directly in the compact schema"""
+    rng = np.random.default_rng(seed)
+    names = {'companies': companies, 'industries': industries, 'locations': locations}
+    dictionary = DEFAULT_DICTIONARY
+    if (companies, industries, locations) != (COMPANIES, INDUSTRIES, LOCATIONS):
+        dictionary = build_dictionary(values={'company': companies, 'industry': industries, 'location': locations})
+
+    layoffs_df = events_to_compact_frame(draw_event_columns(rng, 'layoffs', n_layoffs, **names),
+                                         'layoffs', dictionary, **names)
+    hiring_df = events_to_compact_frame(draw_event_columns(rng, 'hires', n_hiring, **names),
+                                        'hires', dictionary, **names)
+
+    return layoffs_df, hiring_df
+
+def memory_report(frames_before, frames_after):
+    """Compare deep memory use per row of named frames before and after compaction"""
+    rows = []
+    for name, before in frames_before.items():
+        after = frames_after[name]
+        bytes_before = before.memory_usage(deep=True).sum()
+        bytes_after = after.memory_usage(deep=True).sum()
+        rows.append({
+            'frame': name,
+            'rows': len(before),
+            'bytes_before': bytes_before,
+            'bytes_after': bytes_after,
+            'bytes_per_row_before': bytes_before / max(len(before), 1),
+            'bytes_per_row_after': bytes_after / max(len(after), 1),
+            'reduction': 1 - bytes_after / bytes_before if bytes_before else 0.0,
+        })
+    return pd.DataFrame(rows).set_index('frame')
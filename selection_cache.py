@@ -0,0 +1,116 @@
+import sys
+import time
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+def _canonical_values(values):
+    """Sorted, de-duplicated string form of one filter list; empty means no filter"""
+    return sorted({str(value) for value in values}) if values else []
+
+def selection_key(dataset_version, companies=None, years=None, months=None, industries=None, namespace=''):
+    """Canonical hash of a filter selection for one dataset version
+
+    Order and duplicates inside each filter do not change the key, and an
+    empty filter hashes the same as None, matching filter_data semantics.
+    """
+    canonical = {
+        'namespace': namespace,
+        'dataset_version': str(dataset_version),
+        'companies': _canonical_values(companies),
+        'years': _canonical_values(years),
+        'months': _canonical_values(months),
+        'industries': _canonical_values(industries),
+    }
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+def estimate_size(value):
+    """Approximate memory footprint of a cached value in bytes"""
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    return sys.getsizeof(value)
+
+class SelectionCache:
+    """Thread-safe LRU cache with entry-count, byte-size and TTL eviction plus hit/miss counters"""
+
+    def __init__(self, maxsize=256, max_bytes=None, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _drop(self, key):
+        """Remove one entry and release its accounted size"""
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def get(self, key, default=None):
+        """Cached value for key, refreshing its recency; default on miss or expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and self.clock() - entry[2] > self.ttl:
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        """Store value, evicting least recently used entries past the count or byte budget"""
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, self.clock())
+            self.bytes += size
+            while len(self._entries) > self.maxsize or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Cached value for key, computing and storing it on a miss"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry, keeping the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+            }
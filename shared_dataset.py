@@ -0,0 +1,72 @@
+import os
+import fcntl
+import shutil
+import tempfile
+import pyarrow as pa
+
+# Shared-memory backed directory when available, so mapped pages live in RAM once per host
+DEFAULT_SHARED_DIR = os.environ.get(
+    'DASHBOARD_SHARED_DIR',
+    '/dev/shm/ai_dashboards' if os.path.isdir('/dev/shm') else os.path.join(tempfile.gettempdir(), 'ai_dashboards')
+)
+
+TABLE_SUFFIX = '.arrow'
+
+def publish(dataset_version, frames, shared_dir=DEFAULT_SHARED_DIR):
+    """Write frames as uncompressed Arrow IPC files; the dataset directory appears atomically"""
+    dataset_dir = os.path.join(shared_dir, dataset_version)
+    tmp_dir = f"{dataset_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    for name, df in frames.items():
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(os.path.join(tmp_dir, name + TABLE_SUFFIX), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    try:
+        os.rename(tmp_dir, dataset_dir)
+    except OSError:
+        # Another worker published the same version first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return dataset_dir
+
+def attach(dataset_version, shared_dir=DEFAULT_SHARED_DIR):
+    """Map a published dataset into this process, or None when it is not published
+
+    Arrow buffers point straight into the shared mapping, and numeric columns
+    convert to pandas without copying, so every attached worker shares the
+    same physical pages.
+    """
+    dataset_dir = os.path.join(shared_dir, dataset_version)
+    if not os.path.isdir(dataset_dir):
+        return None
+
+    frames = {}
+    for file_name in sorted(os.listdir(dataset_dir)):
+        if not file_name.endswith(TABLE_SUFFIX):
+            continue
+        source = pa.memory_map(os.path.join(dataset_dir, file_name), 'r')
+        table = pa.ipc.open_file(source).read_all()
+        frames[file_name[:-len(TABLE_SUFFIX)]] = table.to_pandas(split_blocks=True)
+    return frames
+
+def attach_or_publish(dataset_version, build, shared_dir=DEFAULT_SHARED_DIR):
+    """Attach to a published dataset, letting exactly one worker build and publish it first"""
+    frames = attach(dataset_version, shared_dir)
+    if frames is not None:
+        return frames
+
+    os.makedirs(shared_dir, exist_ok=True)
+    with open(os.path.join(shared_dir, f"{dataset_version}.lock"), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            # A worker holding the lock before us may have published meanwhile
+            frames = attach(dataset_version, shared_dir)
+            if frames is None:
+                publish(dataset_version, build(), shared_dir)
+                frames = attach(dataset_version, shared_dir)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+    return frames
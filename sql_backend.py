@@ -0,0 +1,242 @@
+import os
+import sqlite3
+import pandas as pd
+import numpy as np
+
+from data_generator import EVENT_TYPES
+from aggregation_cube import CUBE_KEYS, CUBE_MEASURES
+from data_fusion import fuse_employment_data, filter_data
+from schema import compact_frames
+
+# Event tables and their columns, in insert order
+TABLES = {'layoffs': 'layoffs', 'hires': 'hiring'}
+TEXT_COLUMNS = ['company', 'industry', 'location', 'quarter']
+
+# Columns a rollup may group by
+GROUP_COLUMNS = CUBE_KEYS + ['quarter']
+
+DATABASE_SUFFIXES = {'sqlite': '.sqlite', 'duckdb': '.duckdb'}
+
+def table_columns(value_col):
+    """Stored columns of one event table"""
+    return ['date', 'company', value_col, 'industry', 'location', 'year', 'month', 'quarter']
+
+def default_engine():
+    """DuckDB when it is installed, otherwise the standard library's SQLite"""
+    try:
+        import duckdb  # noqa: F401
+        return 'duckdb'
+    except ImportError:
+        return 'sqlite'
+
+def selection_where(companies=None, years=None, months=None, industries=None):
+    """WHERE clause and parameters for a filter selection, with filter_data semantics"""
+    conditions, params = [], []
+    for col, selected, cast in (('company', companies, str), ('year', years, int),
+                                ('month', months, int), ('industry', industries, str)):
+        if selected:
+            conditions.append(f"{col} IN ({', '.join('?' * len(selected))})")
+            params.extend(cast(value) for value in selected)
+    return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+class SQLBackend:
+    """Events kept in an embedded SQLite or DuckDB file, answering selection aggregates in SQL
+
+    Only aggregated result sets come back to pandas, so the event tables can
+    be far larger than memory. Each query opens its own read-only connection,
+    which keeps the backend safe to share between Streamlit sessions.
+    """
+
+    def __init__(self, path, engine=None):
+        self.path = path
+        self.engine = engine or default_engine()
+
+    def connect(self, read_only=True):
+        if self.engine == 'duckdb':
+            import duckdb
+            return duckdb.connect(self.path, read_only=read_only)
+        if read_only:
+            return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        return sqlite3.connect(self.path)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _create(self, connection):
+        """Event tables and the combined events view"""
+        for value_col, table in TABLES.items():
+            connection.execute(f"CREATE TABLE {table} (date TIMESTAMP, company VARCHAR, {value_col} BIGINT, "
+                               f"industry VARCHAR, location VARCHAR, year INTEGER, month INTEGER, quarter VARCHAR)")
+        connection.execute(
+            "CREATE VIEW events AS "
+            "SELECT company, industry, location, year, month, quarter, layoffs, 0 AS hires, "
+            "1 AS layoff_events, 0 AS hiring_events FROM layoffs "
+            "UNION ALL "
+            "SELECT company, industry, location, year, month, quarter, 0 AS layoffs, hires, "
+            "0 AS layoff_events, 1 AS hiring_events FROM hiring")
+
+    def _index(self, connection):
+        """Filter column indexes, created once the tables are loaded"""
+        if self.engine == 'sqlite':
+            # DuckDB prunes with zone maps instead
+            for table in TABLES.values():
+                for col in ('company', 'year, month', 'industry'):
+                    name = col.replace(', ', '_')
+                    connection.execute(f"CREATE INDEX {table}_{name} ON {table} ({col})")
+
+    def _insert(self, connection, value_col, chunk):
+        """Append one validated chunk to its event table"""
+        chunk = chunk[table_columns(value_col)]
+        if self.engine == 'duckdb':
+            connection.register('chunk', chunk)
+            connection.execute(f"INSERT INTO {TABLES[value_col]} SELECT * FROM chunk")
+            connection.unregister('chunk')
+            return
+        columns = [np.datetime_as_string(chunk['date'].to_numpy(), unit='s').tolist()]
+        columns += [chunk[col].astype(str).tolist() if col in TEXT_COLUMNS else chunk[col].tolist()
+                    for col in chunk.columns[1:]]
+        placeholders = ', '.join('?' * len(columns))
+        connection.executemany(f"INSERT INTO {TABLES[value_col]} VALUES ({placeholders})", zip(*columns))
+
+    def build(self, chunks):
+        """Create the database from {value_col: iterable of event chunks}; the file appears atomically"""
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        writer = SQLBackend(tmp_path, self.engine)
+        connection = writer.connect(read_only=False)
+        try:
+            writer._create(connection)
+            for value_col in EVENT_TYPES:
+                for chunk in chunks.get(value_col, ()):
+                    writer._insert(connection, value_col, chunk)
+            writer._index(connection)
+            connection.commit()
+        finally:
+            connection.close()
+
+        try:
+            os.rename(tmp_path, self.path)
+        except OSError:
+            # Another process built the same database first
+            os.remove(tmp_path)
+        return self
+
+    def build_from_frames(self, layoffs_df, hiring_df, chunksize=250_000):
+        """Create the database from in-memory event frames"""
+        def chunks(df):
+            return (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+        return self.build({'layoffs': chunks(layoffs_df), 'hires': chunks(hiring_df)})
+
+    def build_from_source(self, source):
+        """Create the database by streaming a data_sources event source, never holding it in memory"""
+        return self.build({value_col: source.iter_events(value_col) for value_col in EVENT_TYPES})
+
+    def query(self, sql, params=()):
+        """Result of one query as a DataFrame"""
+        connection = self.connect()
+        try:
+            cursor = connection.execute(sql, list(params))
+            names = [description[0] for description in cursor.description]
+            return pd.DataFrame(cursor.fetchall(), columns=names)
+        finally:
+            connection.close()
+
+    def rollup(self, by=None, companies=None, years=None, months=None, industries=None):
+        """Totals per `by` columns for a selection, shaped like aggregation_cube.rollup"""
+        by = list(by or [])
+        unknown = [col for col in by if col not in GROUP_COLUMNS]
+        if unknown:
+            raise ValueError(f"cannot group by {', '.join(unknown)}")
+
+        where, params = selection_where(companies, years, months, industries)
+        keys = ', '.join(by)
+        measures = ("COALESCE(SUM(layoffs), 0) AS layoffs, COALESCE(SUM(hires), 0) AS hires, "
+                    "COALESCE(SUM(hires) - SUM(layoffs), 0) AS net_change, "
+                    "COALESCE(SUM(layoff_events), 0) AS layoff_events, "
+                    "COALESCE(SUM(hiring_events), 0) AS hiring_events")
+        if not by:
+            return self.query(f"SELECT {measures} FROM events{where}", params).iloc[0].astype(np.int64)
+
+        result = self.query(f"SELECT {keys}, {measures} FROM events{where} GROUP BY {keys} ORDER BY {keys}", params)
+        return result.astype({col: np.int64 for col in CUBE_MEASURES})
+
+    def events(self, value_col, companies=None, years=None, months=None, industries=None):
+        """Selected rows of one event table, typed like the loaded event frames"""
+        where, params = selection_where(companies, years, months, industries)
+        result = self.query(f"SELECT {', '.join(table_columns(value_col))} FROM {TABLES[value_col]}{where}", params)
+        result['date'] = pd.to_datetime(result['date'], format='ISO8601').astype('datetime64[us]')
+        return result.astype({value_col: np.int64, 'year': np.int64, 'month': np.int64})
+
+    def totals(self, value_col, by, companies=None, years=None, months=None, industries=None):
+        """One event table's selected counts summed per `by` columns, where 'date' groups by day
+
+        The result can stand in for the selected events in any chart that
+        sums the counts over a coarser grouping.
+        """
+        unknown = [col for col in by if col not in GROUP_COLUMNS + ['date']]
+        if unknown:
+            raise ValueError(f"cannot group by {', '.join(unknown)}")
+
+        where, params = selection_where(companies, years, months, industries)
+        day = "CAST(date AS DATE)" if self.engine == 'duckdb' else "date(date)"
+        keys = ', '.join(f"{day} AS date" if col == 'date' else col for col in by)
+        groups = ', '.join(day if col == 'date' else col for col in by)
+        result = self.query(f"SELECT {keys}, SUM({value_col}) AS {value_col} FROM {TABLES[value_col]}{where} "
+                            f"GROUP BY {groups} ORDER BY {groups}", params)
+        if 'date' in by:
+            result['date'] = pd.to_datetime(result['date']).astype('datetime64[us]')
+        return result.astype({col: np.int64 for col in (value_col, 'year', 'month') if col in result.columns})
+
+    def monthly(self, value_col, companies=None, years=None, months=None, industries=None):
+        """One event table's selection aggregated like data_fusion.aggregate_monthly
+
+        Industry and location come from each cell's first stored event, as
+        'first' takes them from the first row of the loaded frames.
+        """
+        where, params = selection_where(companies, years, months, industries)
+        if self.engine == 'duckdb':
+            first = "arg_min(industry, rowid) AS industry, arg_min(location, rowid) AS location"
+        else:
+            # SQLite takes bare columns from the row holding the single MIN() aggregate
+            first = "industry, location, MIN(rowid) AS first_row"
+        result = self.query(
+            f"SELECT company, year, month, SUM({value_col}) AS {value_col}, {first} "
+            f"FROM {TABLES[value_col]}{where} GROUP BY company, year, month ORDER BY company, year, month", params)
+        result = result[['company', 'year', 'month', value_col, 'industry', 'location']]
+        return result.astype({value_col: np.int64, 'year': np.int64, 'month': np.int64})
+
+    def fused(self, companies=None, years=None, months=None, industries=None):
+        """Selected rows of the fused monthly table, fused from the monthly aggregates of both tables
+
+        Cells are whole (company, year, month) groups, so industries are
+        applied to each cell's first-seen industry after fusing, the same
+        rows filter_data keeps from the fused table of every event.
+        """
+        monthly = [self.monthly(value_col, companies, years, months) for value_col in EVENT_TYPES]
+        return filter_data(fuse_employment_data(*compact_frames(*monthly)), industries=industries)
+
+    def active_companies(self, companies=None, years=None, months=None, industries=None):
+        """Number of companies with any selected event"""
+        where, params = selection_where(companies, years, months, industries)
+        return int(self.query(f"SELECT COUNT(DISTINCT company) AS companies FROM events{where}", params).iloc[0, 0])
+
+    def filter_options(self):
+        """Companies of either table plus the years and industries with layoffs, for the sidebar filters"""
+        companies = self.query("SELECT DISTINCT company FROM events ORDER BY company")['company'].tolist()
+        years = self.query("SELECT DISTINCT year FROM layoffs ORDER BY year")['year'].tolist()
+        industries = self.query("SELECT DISTINCT industry FROM layoffs ORDER BY industry")['industry'].tolist()
+        return companies, years, industries
+
+def open_backend(path, build, engine=None):
+    """Backend over the database at path, calling build(backend) first when it does not exist yet"""
+    backend = SQLBackend(path, engine)
+    if not backend.exists():
+        build(backend)
+    return backend
+
+def database_path(root, dataset_version, engine):
+    """Database file for one dataset version under root"""
+    return os.path.join(root, dataset_version + DATABASE_SUFFIXES[engine])
@@ -0,0 +1,52 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from figure_cache import FigureCache
+from visualizations import create_timeline_chart
+
+def events(dates, value_col):
+    return pd.DataFrame({'date': pd.to_datetime(dates), value_col: np.ones(len(dates), dtype=np.int64)})
+
+def test_weekly_timeline_uses_monday_start_weeks():
+    dates = pd.date_range('2024-01-01', '2024-03-31', freq='D')
+    rng = np.random.default_rng(0)
+    layoffs_df = events(rng.choice(dates, 300), 'layoffs')
+    hiring_df = events(rng.choice(dates, 300), 'hires')
+
+    fig = create_timeline_chart(layoffs_df, hiring_df, unit='W')
+
+    expected = layoffs_df.groupby(layoffs_df['date'].dt.to_period('W-SUN'))['layoffs'].sum()
+    x = pd.to_datetime(fig.data[0].x)
+    y = pd.Series(fig.data[0].y, index=x)
+    assert (x.dayofweek == 0).all()
+    pd.testing.assert_series_equal(y[y > 0], expected.set_axis(expected.index.start_time).astype(float),
+                                   check_names=False, check_freq=False, check_index_type=False)
+
+def test_payloads_are_kept_per_selection():
+    figures = FigureCache()
+    build = lambda: go.Figure(go.Bar(x=[1, 2], y=[3, 4]))
+    figures.get_figure('top', 1, (['A'], None, None, None), build)
+    figures.get_figure('top', 1, (['B', 'C'], None, None, None), build)
+    figures.get_figure('top', 1, (['B', 'C'], None, None, None), build)
+
+    assert set(figures.payloads(1, (['A'], None, None, None))) == {'top'}
+    assert figures.payloads(1, (['C', 'B'], None, None, None))['top']['level'] == 0
+    assert figures.payloads(2, (['A'], None, None, None)) == {}
+
+def test_payload_records_are_bounded_under_concurrent_builds():
+    figures = FigureCache(maxsize=8)
+    build = lambda: go.Figure(go.Bar(x=[1], y=[1]))
+
+    def worker(offset):
+        for i in range(50):
+            figures.get_figure('top', 1, ([f'{offset}-{i}'], None, None, None), build)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(figures._payloads) == 8
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from data_sources import validate_events
+
+def raw_events(dates, counts):
+    n = len(dates)
+    return pd.DataFrame({'date': dates, 'company': ['Acme'] * n, 'layoffs': counts,
+                         'industry': ['Software'] * n, 'location': ['Remote'] * n})
+
+def test_mixed_date_and_datetime_strings_are_parsed():
+    df = raw_events(['2024-01-02', '2024-01-03 10:30:00', '2024-01-04T08:00:00', '2024-01-05T23:00:00Z'], [1, 2, 3, 4])
+    events = validate_events(df, 'layoffs')
+    assert list(events['date']) == [pd.Timestamp('2024-01-02'), pd.Timestamp('2024-01-03 10:30'),
+                                    pd.Timestamp('2024-01-04 08:00'), pd.Timestamp('2024-01-05 23:00')]
+
+def test_invalid_dates_and_counts_are_dropped():
+    df = raw_events(['2024-01-02', 'not a date', '2024-01-03', '2024-01-04', '2024-01-05', '2024-01-06'],
+                    [5, 1, 12.7, -3, None, '8'])
+    events = validate_events(df, 'layoffs')
+    assert events['layoffs'].dtype == np.int64
+    assert list(events['layoffs']) == [5, 8]
+
+def test_integral_float_counts_are_kept():
+    events = validate_events(raw_events(['2024-01-02', '2024-01-03'], [12.0, 3.0]), 'layoffs')
+    assert list(events['layoffs']) == [12, 3]
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from schema import generate_compact_sample_data
+from data_fusion import FUSION_KEYS, fuse_employment_data, filter_data
+from aggregation_cube import CUBE_KEYS, CUBE_MEASURES, build_cube
+from event_stream import EventLogTailer, LiveDataset, append_events
+
+TEXT_COLUMNS = ['company', 'industry', 'location']
+
+SELECTIONS = [
+    (None, None, None, None),
+    (['Meta', 'Google', 'Newco 3'], None, None, None),
+    (None, [2021, 2022], [1, 2, 3], None),
+    (['Amazon', 'Newco 1'], None, None, ['Technology', 'E-commerce']),
+]
+
+def live_batch(df, value_col, rename=None):
+    """Events as a live feed delivers them: plain strings, int64 counts and, optionally, renamed companies"""
+    batch = df.astype({col: str for col in TEXT_COLUMNS}).astype({value_col: np.int64})
+    if rename:
+        batch['company'] = batch['company'].replace(rename)
+    return batch
+
+def as_plain(df, keys):
+    """Rows sorted by keys with plain string columns, for comparing frames coded differently"""
+    df = df.astype({col: str for col in TEXT_COLUMNS if col in df.columns})
+    return df.sort_values(keys, kind='stable').reset_index(drop=True)
+
+def live_dataset(seed, n_batches):
+    """A LiveDataset fed n_batches batches, some introducing new companies, plus the full frames"""
+    layoffs_df, hiring_df = generate_compact_sample_data(2000, 2000, seed)
+    cuts = np.linspace(600, 2000, n_batches + 1).astype(int)
+    live = LiveDataset(layoffs_df.iloc[:600], hiring_df.iloc[:600], 'base')
+    all_layoffs, all_hiring = [layoffs_df.iloc[:600]], [hiring_df.iloc[:600]]
+    for i, (start, stop) in enumerate(zip(cuts[:-1], cuts[1:])):
+        rename = {'Meta': f'Newco {i}'} if i % 2 else None
+        new_layoffs = live_batch(layoffs_df.iloc[start:stop], 'layoffs', rename)
+        new_hiring = live_batch(hiring_df.iloc[start:stop], 'hires', rename)
+        live.apply(new_layoffs, new_hiring)
+        all_layoffs.append(new_layoffs)
+        all_hiring.append(new_hiring)
+    all_layoffs = pd.concat(all_layoffs, ignore_index=True).astype({col: str for col in TEXT_COLUMNS})
+    all_hiring = pd.concat(all_hiring, ignore_index=True).astype({col: str for col in TEXT_COLUMNS})
+    return live, all_layoffs, all_hiring
+
+@pytest.mark.parametrize('seed', range(3))
+def test_live_snapshot_matches_full_recompute(seed):
+    live, layoffs_df, hiring_df = live_dataset(seed, n_batches=12)
+    indexes, (companies, years, industries), version = live.snapshot()
+    assert version == 'base+12'
+    assert companies == sorted(set(layoffs_df['company']) | set(hiring_df['company']))
+    assert years == sorted(layoffs_df['year'].unique())
+    assert industries == sorted(layoffs_df['industry'].unique())
+
+    fused_df = fuse_employment_data(layoffs_df, hiring_df)
+    cube = build_cube(layoffs_df, hiring_df)
+    for selection in SELECTIONS:
+        for name, df, keys in (('layoffs', layoffs_df, ['date', 'company', 'layoffs']),
+                               ('hiring', hiring_df, ['date', 'company', 'hires']),
+                               ('fused', fused_df, FUSION_KEYS), ('cube', cube, CUBE_KEYS)):
+            expected = as_plain(filter_data(df, *selection), keys)
+            actual = as_plain(indexes[name].filter(*selection), keys)[expected.columns]
+            pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
+
+def test_fused_rows_stay_in_key_order():
+    live, _, _ = live_dataset(seed=4, n_batches=5)
+    fused = live.snapshot()[0]['fused'].filter()
+    # Companies are ordered by dictionary code, so later companies follow the initial ones
+    pd.testing.assert_frame_equal(fused, fused.sort_values(FUSION_KEYS, ignore_index=True))
+
+def test_new_values_extend_the_dictionary_without_recoding():
+    layoffs_df, hiring_df = generate_compact_sample_data(300, 300, seed=5)
+    live = LiveDataset(layoffs_df, hiring_df, 'base')
+    before = live.dictionary['company'].categories
+    live.apply(live_batch(layoffs_df.iloc[:20], 'layoffs', {'Meta': 'Zzz Corp', 'Google': 'Aaa Corp'}),
+               live_batch(hiring_df.iloc[:0], 'hires'))
+    after = live.dictionary['company'].categories
+    assert list(after) == list(before) + ['Aaa Corp', 'Zzz Corp']
+
+    layoffs = live.snapshot()[0]['layoffs'].filter()
+    assert layoffs['company'].dtype == live.dictionary['company']
+    assert {'Aaa Corp', 'Zzz Corp'} <= set(layoffs['company'])
+
+def test_segments_stay_logarithmic():
+    layoffs_df, hiring_df = generate_compact_sample_data(5000, 5000, seed=6)
+    live = LiveDataset(layoffs_df.iloc[:1000], hiring_df.iloc[:1000], 'base')
+    for start in range(1000, 5000, 50):
+        live.apply(layoffs_df.iloc[start:start + 50], hiring_df.iloc[start:start + 50])
+    for index in live.indexes.values():
+        assert len(index.segments) <= 2 * np.log2(5000)
+
+def test_snapshot_is_unchanged_by_later_batches():
+    layoffs_df, hiring_df = generate_compact_sample_data(1000, 1000, seed=8)
+    live = LiveDataset(layoffs_df.iloc[:500], hiring_df.iloc[:500], 'base')
+    indexes = live.snapshot()[0]
+    cube_before = indexes['cube'].filter()[CUBE_MEASURES].sum()
+    live.apply(layoffs_df.iloc[500:], hiring_df.iloc[500:])
+    pd.testing.assert_series_equal(indexes['cube'].filter()[CUBE_MEASURES].sum(), cube_before)
+    assert live.snapshot()[0]['cube'].filter()['layoffs'].sum() == layoffs_df['layoffs'].sum()
+
+def test_tailer_honors_its_starting_offset(tmp_path):
+    path = tmp_path / 'events.jsonl'
+    append_events(path, [{'type': 'layoffs', 'company': 'Meta', 'layoffs': 1}])
+    offset = path.stat().st_size
+    append_events(path, [{'type': 'layoffs', 'company': 'Google', 'layoffs': 2}])
+
+    records = EventLogTailer(path, offset).read()
+    assert [record['company'] for record in records] == ['Google']
+    assert [record['company'] for record in EventLogTailer(path).read()] == ['Meta', 'Google']
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from schema import generate_compact_sample_data
+from data_fusion import filter_data
+from filter_index import FilterIndex
+
+@pytest.fixture(scope='module')
+def layoffs_df():
+    layoffs_df, _ = generate_compact_sample_data(
+        20_000, 0, seed=4, companies=[f"Company {i:04d}" for i in range(2_000)])
+    layoffs_df = layoffs_df.copy()
+    layoffs_df.loc[layoffs_df.index[:30], 'company'] = None
+    return layoffs_df
+
+def selections(layoffs_df):
+    companies = list(layoffs_df['company'].cat.categories)
+    industries = list(layoffs_df['industry'].cat.categories)
+    return [
+        (None, None, None, None),
+        (companies[:5], None, None, None),
+        (companies[:1_500], [2022, 2023], None, None),
+        (companies[3:4], None, [1, 2, 3], industries[:2]),
+        (['Nobody'], None, None, None),
+        (companies, None, None, None),
+        (None, [2021], list(range(2, 13)), industries[1:]),
+    ]
+
+@pytest.mark.parametrize('max_bitmap_values', [0, 64, 10_000])
+def test_filter_matches_filter_data(layoffs_df, max_bitmap_values):
+    index = FilterIndex(layoffs_df, max_bitmap_values=max_bitmap_values)
+    for selection in selections(layoffs_df):
+        assert index.filter(*selection).index.equals(filter_data(layoffs_df, *selection).index)
+
+def test_high_cardinality_columns_use_row_lists(layoffs_df):
+    index = FilterIndex(layoffs_df)
+    n_companies = len(index.values['company'])
+    # One position per row plus offsets, instead of a rows / 8 byte bitmap per company
+    assert index.indexes['company'].nbytes == len(layoffs_df) * np.dtype(np.int32).itemsize - 30 * 4 + 8 * (n_companies + 1)
+    assert index.indexes['company'].nbytes < n_companies * len(layoffs_df) / 8 / 50
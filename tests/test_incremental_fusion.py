@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from schema import generate_compact_sample_data
+from data_fusion import fuse_employment_data
+from incremental_fusion import IncrementalFusion
+
+TEXT_COLUMNS = ['company', 'industry', 'location']
+
+def live_batch(df, value_col):
+    """Events as a live feed delivers them: plain strings and int64 counts instead of the compact schema"""
+    return df.astype({col: str for col in TEXT_COLUMNS}).astype({value_col: np.int64})
+
+def random_splits(rng, n_rows, n_batches):
+    """Row positions of an initial load followed by n_batches batches, in event order; batches may be empty"""
+    cuts = np.sort(rng.integers(0, n_rows + 1, size=n_batches))
+    return np.split(np.arange(n_rows), cuts)
+
+def assert_same_fused(expected, actual):
+    """Same cells and values; dtypes differ where live batches widened the compact schema"""
+    pd.testing.assert_frame_equal(expected.reset_index(drop=True), actual[expected.columns].reset_index(drop=True),
+                                  check_dtype=False, check_categorical=False)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_batches_match_full_fusion(seed):
+    rng = np.random.default_rng(seed)
+    layoffs_df, hiring_df = generate_compact_sample_data(int(rng.integers(1, 800)), int(rng.integers(1, 800)), seed)
+    n_batches = int(rng.integers(1, 6))
+    layoff_parts = random_splits(rng, len(layoffs_df), n_batches)
+    hiring_parts = random_splits(rng, len(hiring_df), n_batches)
+
+    fusion = IncrementalFusion(layoffs_df.iloc[layoff_parts[0]], hiring_df.iloc[hiring_parts[0]])
+    for layoff_rows, hiring_rows in zip(layoff_parts[1:], hiring_parts[1:]):
+        fusion.append(live_batch(layoffs_df.iloc[layoff_rows], 'layoffs'),
+                      live_batch(hiring_df.iloc[hiring_rows], 'hires'))
+
+    assert_same_fused(fuse_employment_data(layoffs_df, hiring_df), fusion.fused_df)
+
+def test_compact_batches_match_full_fusion():
+    layoffs_df, hiring_df = generate_compact_sample_data(500, 600, seed=7)
+    fusion = IncrementalFusion(layoffs_df.iloc[:200], hiring_df.iloc[:300])
+    fusion.append(layoffs_df.iloc[200:], hiring_df.iloc[300:])
+    assert_same_fused(fuse_employment_data(layoffs_df, hiring_df), fusion.fused_df)
+
+def test_int64_batch_into_int32_compact_frames():
+    layoffs_df, hiring_df = generate_compact_sample_data(100, 100, seed=1)
+    assert layoffs_df['layoffs'].dtype == np.int32
+    fusion = IncrementalFusion(layoffs_df, hiring_df)
+    batch = live_batch(layoffs_df.iloc[:10], 'layoffs')
+    batch['layoffs'] = np.int64(2) ** 40
+    fusion.append(new_layoffs=batch)
+    assert fusion.fused_df['layoffs'].max() >= 2 ** 40
+
+def test_empty_append_keeps_version():
+    layoffs_df, hiring_df = generate_compact_sample_data(50, 50, seed=2)
+    fusion = IncrementalFusion(layoffs_df, hiring_df)
+    assert fusion.append().empty
+    assert fusion.version == 0
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_missing_industry_is_filled_by_a_later_batch(compact):
+    layoffs_df, hiring_df = generate_compact_sample_data(200, 200, seed=3)
+    if not compact:
+        layoffs_df, hiring_df = live_batch(layoffs_df, 'layoffs'), live_batch(hiring_df, 'hires')
+    first = layoffs_df.iloc[[0]].copy()
+    first['industry'] = None
+    later = live_batch(layoffs_df.iloc[[0]], 'layoffs').assign(industry='Soft', location='Nowhere')
+
+    fusion = IncrementalFusion(first, hiring_df.iloc[:0])
+    fusion.append(new_layoffs=later)
+
+    full = fuse_employment_data(pd.concat([live_batch(first, 'layoffs'), later], ignore_index=True),
+                                live_batch(hiring_df.iloc[:0], 'hires'))
+    assert full['industry'].tolist() == ['Soft']
+    assert_same_fused(full, fusion.fused_df)
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from schema import generate_compact_sample_data
+from data_fusion import fuse_employment_data
+from parallel_forecast import series_matrix, forecast_parallel, SERIES_KEYS
+
+@pytest.fixture(params=['category', 'str'])
+def fused_df(request):
+    fused_df = fuse_employment_data(*generate_compact_sample_data(400, 400, seed=5))
+    fused_df = fused_df.astype({col: request.param for col in SERIES_KEYS})
+    rows = np.arange(len(fused_df))
+    return fused_df.assign(industry=fused_df['industry'].mask(rows < 25),
+                           location=fused_df['location'].mask((rows >= 40) & (rows < 50)))
+
+def test_missing_keys_form_their_own_series(fused_df):
+    key_frame, first_period, values = series_matrix(fused_df)
+    assert key_frame['industry'].isna().any()
+    assert len(key_frame) == len(fused_df[SERIES_KEYS].drop_duplicates())
+    assert values.sum() == fused_df['net_change'].sum()
+
+def test_parallel_forecasts_match_in_process(fused_df):
+    serial = forecast_parallel(fused_df, workers=1)
+    pooled = forecast_parallel(fused_df, workers=2, min_series_per_worker=1)
+    assert serial['industry'].isna().any()
+    pd.testing.assert_frame_equal(serial, pooled)
+    assert np.isfinite(serial['forecast']).all()
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from schema import generate_compact_sample_data
+from data_fusion import fuse_employment_data, filter_data
+from rolling_windows import RollingWindows, WINDOW_LENGTHS, WINDOW_MEASURES, complete_lengths
+
+def test_single_month_selection_has_no_complete_window():
+    fused_df = fuse_employment_data(*generate_compact_sample_data(500, 600, seed=2024))
+    company = fused_df['company'].iloc[0]
+    year, month = fused_df['year'].iloc[0], fused_df['month'].iloc[0]
+    windows = RollingWindows.from_frame(filter_data(fused_df, [company], [year], [month]))
+
+    assert windows.n_months == 1
+    assert complete_lengths(windows) == []
+    for months in WINDOW_LENGTHS:
+        assert windows.rolling('net_change', months).empty
+
+def test_complete_lengths_give_non_empty_rolling_frames():
+    fused_df = fuse_employment_data(*generate_compact_sample_data(500, 600, seed=2024))
+    windows = RollingWindows.from_frame(filter_data(fused_df, years=[2022], months=list(range(1, 8))))
+
+    assert windows.n_months == 7
+    assert complete_lengths(windows) == [3, 6]
+    for months in complete_lengths(windows):
+        rolling = pd.DataFrame({measure: windows.rolling(measure, months).iloc[:, 0] for measure in WINDOW_MEASURES})
+        assert len(rolling) == windows.n_months - months + 1
+        assert np.isfinite(rolling.to_numpy()).all()
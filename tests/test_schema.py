@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from schema import compact_frame, compact_frames, generate_compact_sample_data
+
+def test_counts_too_large_for_int32_keep_int64():
+    layoffs_df, hiring_df = generate_compact_sample_data(20, 20, seed=0)
+    layoffs_df = layoffs_df.astype({'layoffs': np.int64})
+    layoffs_df.loc[layoffs_df.index[0], 'layoffs'] = 2 ** 40
+
+    layoffs, hiring = compact_frames(layoffs_df, hiring_df.astype({'hires': np.int64}))
+    assert layoffs['layoffs'].dtype == np.int64
+    assert layoffs['layoffs'].iloc[0] == 2 ** 40
+    assert hiring['hires'].dtype == np.int32
+
+def test_counts_in_range_are_narrowed():
+    frame = pd.DataFrame({'layoffs': np.array([0, np.iinfo(np.int32).max], dtype=np.int64),
+                          'year': np.array([2020, 2024], dtype=np.int64)})
+    compact = compact_frame(frame)
+    assert compact['layoffs'].dtype == np.int32
+    assert compact['year'].dtype == np.int16
+    assert compact['layoffs'].iloc[1] == np.iinfo(np.int32).max
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from schema import generate_compact_sample_data
+from data_generator import get_company_list
+from data_fusion import filter_data, fuse_employment_data
+from aggregation_cube import CUBE_KEYS, build_cube, rollup
+from ai_insights import generate_ai_insights, predict_trends
+from visualizations import (
+    create_timeline_chart, create_quarterly_trends, create_industry_heatmap, create_top_companies_chart,
+    create_net_change_chart
+)
+from sql_backend import SQLBackend
+
+SELECTIONS = [
+    (None, None, None, None),
+    (['Amazon', 'Apple'], [2022, 2023], None, None),
+    (None, None, [1, 2, 3], ['Search/Cloud', 'E-commerce']),
+    (['Nobody'], None, None, None),
+]
+
+@pytest.fixture(scope='module')
+def events():
+    return generate_compact_sample_data(500, 600, seed=3)
+
+@pytest.fixture(scope='module')
+def backend(events, tmp_path_factory):
+    return SQLBackend(str(tmp_path_factory.mktemp('sql') / 'events.sqlite'), 'sqlite').build_from_frames(*events)
+
+def test_filter_options_match_the_frames(events, backend):
+    layoffs_df, hiring_df = events
+    companies, years, industries = backend.filter_options()
+    assert companies == get_company_list(layoffs_df, hiring_df)
+    assert years == sorted(layoffs_df['year'].unique())
+    assert industries == sorted(layoffs_df['industry'].unique())
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+def test_selected_events_match_filter_data(events, backend, selection):
+    for df, value_col in zip(events, ('layoffs', 'hires')):
+        expected = filter_data(df, *selection).sort_values(['date', 'company', value_col]).reset_index(drop=True)
+        actual = backend.events(value_col, *selection).sort_values(['date', 'company', value_col]).reset_index(drop=True)
+        assert actual['date'].dtype == expected['date'].dtype
+        pd.testing.assert_frame_equal(actual, expected.astype({col: actual[col].dtype for col in actual.columns}))
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+def test_totals_and_active_companies_match_the_cube(events, backend, selection):
+    cube = filter_data(build_cube(*events), *selection)
+    assert (backend.rollup([], *selection) == rollup(cube).astype(np.int64)).all()
+    assert backend.active_companies(*selection) == cube['company'].nunique()
+
+def chart_values(fig):
+    """Trace names and values of a figure, whatever the integer widths behind them"""
+    return [(trace.name, [np.asarray(values).tolist() for axis, values in trace.to_plotly_json().items()
+                          if axis in ('x', 'y', 'z')])
+            for trace in fig.data]
+
+@pytest.mark.parametrize('selection', SELECTIONS[:3])
+def test_views_render_the_same_from_sql_aggregates(events, backend, selection):
+    """Charts, fused table and insights built from SQL GROUP BY results match the in-memory ones"""
+    layoffs_df, hiring_df = (filter_data(df, *selection) for df in events)
+
+    def totals(by):
+        return [backend.totals(value_col, by, *selection) for value_col in ('layoffs', 'hires')]
+
+    for unit in ('D', 'W', 'M'):
+        assert chart_values(create_timeline_chart(*totals(['date']), unit=unit)) == \
+            chart_values(create_timeline_chart(layoffs_df, hiring_df, unit=unit))
+    assert chart_values(create_quarterly_trends(*totals(['year', 'quarter']))) == \
+        chart_values(create_quarterly_trends(layoffs_df, hiring_df))
+    assert chart_values(create_industry_heatmap(*totals(['industry', 'year']))) == \
+        chart_values(create_industry_heatmap(layoffs_df, hiring_df))
+    for metric in ('layoffs', 'hires'):
+        assert chart_values(create_top_companies_chart(*totals(['company']), metric)) == \
+            chart_values(create_top_companies_chart(layoffs_df, hiring_df, metric))
+
+    expected_fused = filter_data(fuse_employment_data(*events), *selection).reset_index(drop=True)
+    fused = backend.fused(*selection).reset_index(drop=True)
+    pd.testing.assert_frame_equal(fused, expected_fused, check_dtype=False, check_categorical=False)
+    assert chart_values(create_net_change_chart(fused)) == chart_values(create_net_change_chart(expected_fused))
+
+    cube = backend.rollup(CUBE_KEYS, *selection)
+    expected_cube = filter_data(build_cube(*events), *selection)
+    assert generate_ai_insights(None, None, fused, cube) == \
+        generate_ai_insights(layoffs_df, hiring_df, expected_fused, expected_cube)
+    assert predict_trends(fused) == predict_trends(expected_fused)
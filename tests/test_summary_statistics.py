@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from schema import generate_compact_sample_data
+from data_fusion import get_summary_statistics
+
+def groupby_statistics(layoffs_df, hiring_df):
+    """The same statistics computed with plain groupbys"""
+    return {
+        'total_layoffs': layoffs_df['layoffs'].sum(),
+        'total_hires': hiring_df['hires'].sum(),
+        'company_layoffs': layoffs_df.groupby('company', observed=True)['layoffs'].sum(),
+        'monthly_hires': hiring_df.groupby(['year', 'month'])['hires'].sum(),
+        'industry_impact': layoffs_df.groupby('industry', observed=True)['layoffs'].sum(),
+    }
+
+def assert_matches_groupby(layoffs_df, hiring_df):
+    stats = get_summary_statistics(layoffs_df, hiring_df, None)
+    expected = groupby_statistics(layoffs_df, hiring_df)
+    assert stats['total_layoffs'] == expected['total_layoffs']
+    assert stats['total_hires'] == expected['total_hires']
+    top = expected['company_layoffs'].sort_values(ascending=False, kind='stable').head(10)
+    assert np.array_equal(stats['top_layoff_companies'].to_numpy(), top.to_numpy())
+    pd.testing.assert_series_equal(stats['monthly_hires'], expected['monthly_hires'], check_dtype=False)
+    pd.testing.assert_series_equal(stats['industry_impact'].sort_index(), expected['industry_impact'].sort_index(),
+                                   check_dtype=False, check_categorical=False, check_index_type=False)
+
+def test_high_cardinality_stays_proportional_to_events():
+    # 20k companies x 60 months x 1k industries used to allocate a 9 GiB joint key
+    layoffs_df, hiring_df = generate_compact_sample_data(
+        10_000, 10_000, seed=0,
+        companies=[f"Company {i:06d}" for i in range(20_000)],
+        industries=[f"Industry {i:04d}" for i in range(1_000)])
+    assert_matches_groupby(layoffs_df, hiring_df)
+
+def test_missing_companies_and_industries_are_skipped():
+    layoffs_df, hiring_df = generate_compact_sample_data(2_000, 2_000, seed=1)
+    layoffs_df.loc[layoffs_df.index[:50], 'company'] = None
+    layoffs_df.loc[layoffs_df.index[50:90], 'industry'] = None
+    assert_matches_groupby(layoffs_df, hiring_df)
@@ -0,0 +1,191 @@
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+# Payload bounds: every chart is aggregated server-side and capped at these sizes
+MAX_TIMELINE_POINTS = 600
+MAX_COMPANY_SERIES = 10
+MAX_HEATMAP_ROWS = 30
+TOP_COMPANIES = 10
+
+LAYOFF_COLOR = '#d62728'
+HIRING_COLOR = '#2ca02c'
+
+def lttb_downsample(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling of a series to at most threshold points"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    x_values = np.asarray(x).astype('datetime64[ns]').astype(np.float64) \
+        if np.issubdtype(np.asarray(x).dtype, np.datetime64) else np.asarray(x, dtype=np.float64)
+    y_values = np.asarray(y, dtype=np.float64)
+
+    # First and last points are always kept; the rest are split into equal buckets
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        avg_x = x_values[end:next_end].mean()
+        avg_y = y_values[end:next_end].mean()
+        area = np.abs((x_values[anchor] - avg_x) * (y_values[start:end] - y_values[anchor])
+                      - (x_values[anchor] - x_values[start:end]) * (avg_y - y_values[anchor]))
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    selected[-1] = n - 1
+
+    return np.asarray(x)[selected], y_values[selected]
+
+# numpy weeks count from the 1970-01-01 epoch, a Thursday; shifting by three
+# days makes them Monday-to-Sunday weeks, the same as pandas' 'W-SUN' periods
+WEEK_START_OFFSET = 3
+
+def _period_keys(df, unit):
+    """Event dates as integer periods of a day ('D'), Monday-start week ('W') or month ('M')"""
+    dates = df['date'].to_numpy()
+    if unit == 'W':
+        return (dates.astype('datetime64[D]').astype(np.int64) + WEEK_START_OFFSET) // 7
+    return dates.astype(f'datetime64[{unit}]').astype(np.int64)
+
+def _period_starts(keys, unit):
+    """First day of each integer period from _period_keys"""
+    if unit == 'W':
+        return (keys * 7 - WEEK_START_OFFSET).astype('datetime64[D]')
+    return keys.astype(f'datetime64[{unit}]').astype('datetime64[D]')
+
+def create_timeline_chart(layoffs_df, hiring_df, max_points=MAX_TIMELINE_POINTS, unit='D'):
+    """Layoffs vs hiring over time per day (or coarser unit), downsampled to a bounded number of points"""
+    keys = {'layoffs': _period_keys(layoffs_df, unit), 'hires': _period_keys(hiring_df, unit)}
+    first_period = min(values.min() for values in keys.values())
+    n_periods = max(values.max() for values in keys.values()) - first_period + 1
+    dates = _period_starts(np.arange(n_periods) + first_period, unit)
+
+    fig = go.Figure()
+    for value_col, name, color in (('layoffs', 'Layoffs', LAYOFF_COLOR), ('hires', 'Hiring', HIRING_COLOR)):
+        df = layoffs_df if value_col == 'layoffs' else hiring_df
+        totals = np.bincount(keys[value_col] - first_period, weights=df[value_col].to_numpy(), minlength=n_periods)
+        x, y = lttb_downsample(dates, totals, max_points)
+        fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name=name, line=dict(color=color)))
+
+    fig.update_layout(
+        title='Layoffs vs Hiring Over Time',
+        xaxis_title='Date',
+        yaxis_title='Number of Employees',
+        hovermode='x unified'
+    )
+    return fig
+
+def _monthly_net_change(fused_df, by=None):
+    """Net change summed per month (and optionally per `by` column)"""
+    keys = ['date'] if by is None else [by, 'date']
+    return fused_df.groupby(keys, observed=True)['net_change'].sum().reset_index()
+
+def create_net_change_chart(fused_df):
+    """Monthly net employment change, positive months green and negative months red"""
+    monthly = _monthly_net_change(fused_df)
+    colors = np.where(monthly['net_change'] >= 0, HIRING_COLOR, LAYOFF_COLOR)
+
+    fig = go.Figure(go.Bar(x=monthly['date'], y=monthly['net_change'], marker_color=colors, name='Net Change'))
+    fig.update_layout(
+        title='Monthly Net Employment Change',
+        xaxis_title='Month',
+        yaxis_title='Net Change (Hires - Layoffs)'
+    )
+    return fig
+
+def create_company_comparison_chart(fused_df, selected_companies, max_points=MAX_TIMELINE_POINTS,
+                                    max_series=MAX_COMPANY_SERIES):
+    """Monthly net change per company for the most active selected companies"""
+    monthly = _monthly_net_change(fused_df, by='company')
+
+    # Keep the payload bounded: only the most active companies get a trace
+    activity = monthly.assign(activity=monthly['net_change'].abs()).groupby('company', observed=True)['activity'].sum()
+    if selected_companies:
+        activity = activity[activity.index.isin(selected_companies)]
+    companies = activity.sort_values(ascending=False).index[:max_series]
+
+    fig = go.Figure()
+    for company in companies:
+        series = monthly[monthly['company'] == company]
+        x, y = lttb_downsample(series['date'].to_numpy(), series['net_change'].to_numpy(), max_points)
+        fig.add_trace(go.Scattergl(x=x, y=y, mode='lines+markers', name=str(company)))
+
+    fig.update_layout(
+        title='Company Net Employment Change Comparison',
+        xaxis_title='Month',
+        yaxis_title='Net Change',
+        hovermode='x unified'
+    )
+    return fig
+
+def create_industry_heatmap(layoffs_df, hiring_df, max_rows=MAX_HEATMAP_ROWS):
+    """Net employment change by industry and year"""
+    layoffs = layoffs_df.groupby(['industry', 'year'], observed=True)['layoffs'].sum()
+    hires = hiring_df.groupby(['industry', 'year'], observed=True)['hires'].sum()
+    net_change = hires.sub(layoffs, fill_value=0).unstack('year', fill_value=0)
+
+    # Cap the number of industry rows by absolute activity
+    order = net_change.abs().sum(axis=1).sort_values(ascending=False).index[:max_rows]
+    net_change = net_change.loc[order]
+
+    limit = float(np.abs(net_change.to_numpy()).max()) if net_change.size else 0.0
+    fig = go.Figure(go.Heatmap(
+        z=net_change.to_numpy(),
+        x=[str(year) for year in net_change.columns],
+        y=[str(industry) for industry in net_change.index],
+        colorscale='RdYlGn',
+        zmid=0,
+        zmin=-limit,
+        zmax=limit,
+        colorbar=dict(title='Net Change')
+    ))
+    fig.update_layout(
+        title='Industry Net Employment Change by Year',
+        xaxis_title='Year',
+        yaxis_title='Industry'
+    )
+    return fig
+
+def create_top_companies_chart(layoffs_df, hiring_df, metric, top_n=TOP_COMPANIES):
+    """Top companies by total layoffs or hires"""
+    df = layoffs_df if metric == 'layoffs' else hiring_df
+    totals = df.groupby('company', observed=True)[metric].sum().nlargest(top_n).sort_values()
+
+    label = 'Layoffs' if metric == 'layoffs' else 'Hires'
+    fig = go.Figure(go.Bar(
+        x=totals.to_numpy(),
+        y=[str(company) for company in totals.index],
+        orientation='h',
+        marker_color=LAYOFF_COLOR if metric == 'layoffs' else HIRING_COLOR
+    ))
+    fig.update_layout(
+        title=f'Top {top_n} Companies by {label}',
+        xaxis_title=f'Total {label}',
+        yaxis_title='Company'
+    )
+    return fig
+
+def create_quarterly_trends(layoffs_df, hiring_df):
+    """Layoffs and hires per year-quarter"""
+    layoffs = layoffs_df.groupby(['year', 'quarter'], observed=True)['layoffs'].sum()
+    hires = hiring_df.groupby(['year', 'quarter'], observed=True)['hires'].sum()
+    quarterly = pd.concat([layoffs, hires], axis=1).fillna(0).sort_index()
+    labels = [f"{year} {quarter}" for year, quarter in quarterly.index]
+
+    fig = go.Figure([
+        go.Bar(x=labels, y=quarterly['layoffs'].to_numpy(), name='Layoffs', marker_color=LAYOFF_COLOR),
+        go.Bar(x=labels, y=quarterly['hires'].to_numpy(), name='Hiring', marker_color=HIRING_COLOR),
+    ])
+    fig.update_layout(
+        title='Quarterly Employment Trends',
+        xaxis_title='Quarter',
+        yaxis_title='Number of Employees',
+        barmode='group'
+    )
+    return fig